@@ -2,6 +2,14 @@
 
 __version__ = "0.1.0"
 
-from .plugin import AIAssistantPlugin
-
 __all__ = ["AIAssistantPlugin", "__version__"]
+
+
+def __getattr__(name: str):
+    """Import the plugin on first access (PEP 562), keeping CLI startup free of MkDocs."""
+    if name == "AIAssistantPlugin":
+        from .plugin import AIAssistantPlugin
+        
+        globals()[name] = AIAssistantPlugin
+        return AIAssistantPlugin
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,16 +1,38 @@
-"""Asset processing module for automatic documentation generation."""
+"""Asset processing module for automatic documentation generation.
 
-from .discovery import AssetDiscovery
-from .base import AssetProcessor
-from .models import Asset, AssetConfig, AssetSource, Documentation
-from .docker_compose import DockerComposeProcessor
-from .python_code import PythonCodeProcessor
-from .mermaid import MermaidGenerator
-from .processor import AssetProcessorOrchestrator
+Workload by module:
 
-# Legacy imports for backward compatibility
-from .compose import ComposeProcessor
-from .code import CodeProcessor
+- I/O-bound (file reads, LLM requests): ``discovery``, ``processor``,
+  ``docker_compose``, ``python_code``, ``compose``, ``code``
+- Compute-bound (pure diagram assembly): ``mermaid``
+
+Only compute-bound helpers are candidates for compiled kernels; they are
+imported lazily so that such a backend never adds to package import time.
+AST and string handling are deliberately left in plain Python.
+
+All public names are resolved on first access (PEP 562), so importing the
+package only pays for the processors that are actually used.
+"""
+
+import importlib
+
+# Public name -> (submodule, attribute)
+_LAZY = {
+    "AssetDiscovery": ("discovery", "AssetDiscovery"),
+    "Asset": ("models", "Asset"),
+    "AssetConfig": ("models", "AssetConfig"),
+    "AssetSource": ("models", "AssetSource"),
+    "Documentation": ("models", "Documentation"),
+    "AssetProcessor": ("base", "AssetProcessor"),
+    "DockerComposeProcessor": ("docker_compose", "DockerComposeProcessor"),
+    "PythonCodeProcessor": ("python_code", "PythonCodeProcessor"),
+    "MermaidGenerator": ("mermaid", "MermaidGenerator"),
+    "AssetProcessorOrchestrator": ("processor", "AssetProcessor"),
+    "process_project_assets": ("processor", "process_project_assets"),
+    # Legacy
+    "ComposeProcessor": ("compose", "ComposeProcessor"),
+    "CodeProcessor": ("code", "CodeProcessor"),
+}
 
 __all__ = [
     "AssetDiscovery",
@@ -23,7 +45,25 @@ __all__ = [
     "PythonCodeProcessor",
     "MermaidGenerator",
     "AssetProcessorOrchestrator",
+    "process_project_assets",
     # Legacy
     "ComposeProcessor",
     "CodeProcessor",
 ]
+
+
+def __getattr__(name: str):
+    """Import public names from their submodules on first access (PEP 562)."""
+    try:
+        module_name, attr = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    
+    value = getattr(importlib.import_module(f".{module_name}", __name__), attr)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    """Include lazily imported names in dir()."""
+    return sorted(set(globals()) | set(__all__))
@@ -3,7 +3,7 @@
 from abc import ABC, abstractmethod
 from typing import Optional
 
-from mkdocs_ai.cache.manager import CacheManager
+from mkdocs_ai.cache.manager import CacheManager, content_hash
 from mkdocs_ai.providers.base import AIProvider
 
 from .models import Asset, Documentation
@@ -68,9 +68,7 @@ class AssetProcessor(ABC):
         # Check cache
         cache_key = None
         if self.cache:
-            import hashlib
-
-            cache_key = f"asset:{hashlib.sha256(prompt.encode()).hexdigest()[:16]}"
+            cache_key = f"asset:{content_hash(prompt)[:16]}"
             cached = self.cache.get(cache_key)
             if cached:
                 return cached
@@ -1,12 +1,124 @@
 """Code documentation processor."""
 
+from collections import OrderedDict
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import AsyncIterator, List, Optional
 import ast
+import asyncio
 import re
 
 from ..providers import AIProvider
-from ..cache import CacheManager
+from ..cache import CacheManager, RequestCoalescer, cached_by_hash, content_hash
+from .models import ArgInfo, ClassInfo, FunctionInfo, ModuleInfo
+
+# Static prompt scaffolding; only the dynamic slots are filled per call
+_MODULE_OVERVIEW_TMPL = """Generate an overview for this Python module.
+
+Module: {name}
+Classes: {classes}
+Functions: {funcs}
+
+Module docstring:
+{docstring}
+
+Write a brief overview explaining:
+- What this module does
+- Main classes and their purposes
+- Main functions and their purposes
+- How to use this module"""
+
+_USAGE_EXAMPLES_TMPL = """Generate usage examples for this Python module.
+
+Module: {name}
+Classes: {classes}
+Functions: {funcs}
+
+Generate 2-3 practical code examples showing how to use this module.
+Include imports and complete, runnable examples."""
+
+_OVERVIEW_SYSTEM_PROMPT = "You are a technical writer documenting Python code."
+_EXAMPLES_SYSTEM_PROMPT = "You are a technical writer creating code examples."
+
+# Extracted module infos kept per processor, by source hash
+_MODULE_INFO_CACHE_SIZE = 128
+
+
+class _ModuleVisitor(ast.NodeVisitor):
+    """Collect top-level classes, functions and imports in a single pass."""
+    
+    def __init__(self):
+        self.classes: List[ClassInfo] = []
+        self.functions: List[FunctionInfo] = []
+        self.imports: List[str] = []
+    
+    def visit_Module(self, node: ast.Module) -> None:
+        for child in node.body:
+            self.visit(child)
+    
+    def visit_ClassDef(self, node: ast.ClassDef) -> None:
+        self.classes.append(self.class_info(node))
+    
+    def visit_FunctionDef(self, node: ast.FunctionDef) -> None:
+        self.functions.append(self.function_info(node))
+    
+    visit_AsyncFunctionDef = visit_FunctionDef
+    
+    def visit_Import(self, node: ast.Import) -> None:
+        self.imports.append(", ".join(alias.name for alias in node.names))
+    
+    def visit_ImportFrom(self, node: ast.ImportFrom) -> None:
+        names = ", ".join(alias.name for alias in node.names)
+        self.imports.append(f"{node.module or ''}: {names}")
+    
+    def generic_visit(self, node: ast.AST) -> None:
+        # Only top-level statements are documented; don't descend further
+        pass
+    
+    @staticmethod
+    def class_info(node: ast.ClassDef) -> ClassInfo:
+        """Extract information from class node.
+        
+        Args:
+            node: Class AST node
+            
+        Returns:
+            Class information
+        """
+        return ClassInfo(
+            name=node.name,
+            docstring=ast.get_docstring(node),
+            bases=tuple(ast.unparse(base) for base in node.bases),
+            methods=tuple(
+                _ModuleVisitor.function_info(item)
+                for item in node.body
+                if isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef))
+            ),
+            decorators=tuple(ast.unparse(dec) for dec in node.decorator_list),
+        )
+    
+    @staticmethod
+    def function_info(node: ast.FunctionDef | ast.AsyncFunctionDef) -> FunctionInfo:
+        """Extract information from function node.
+        
+        Args:
+            node: Function AST node
+            
+        Returns:
+            Function information
+        """
+        docstring = ast.get_docstring(node)
+        return FunctionInfo(
+            name=node.name,
+            docstring=docstring,
+            summary=docstring.partition("\n")[0] if docstring else None,
+            args=tuple(
+                ArgInfo(arg.arg, ast.unparse(arg.annotation) if arg.annotation else None)
+                for arg in node.args.args
+            ),
+            return_type=ast.unparse(node.returns) if node.returns else None,
+            decorators=tuple(ast.unparse(dec) for dec in node.decorator_list),
+            is_async=isinstance(node, ast.AsyncFunctionDef),
+        )
 
 
 class CodeProcessor:
@@ -24,16 +136,26 @@ class CodeProcessor:
         self,
         provider: AIProvider,
         cache_manager: Optional[CacheManager] = None,
+        max_concurrency: int = 4,
     ):
         """Initialize processor.
         
         Args:
             provider: AI provider for generation
             cache_manager: Optional cache manager
+            max_concurrency: Maximum number of concurrent provider requests
         """
         self.provider = provider
         self.cache_manager = cache_manager
+        self._requests = RequestCoalescer(provider, cache_manager, max_concurrency)
+        self._module_info_cache: "OrderedDict[str, ModuleInfo]" = OrderedDict()
     
+    @cached_by_hash("code_module", (
+        _MODULE_OVERVIEW_TMPL,
+        _USAGE_EXAMPLES_TMPL,
+        _OVERVIEW_SYSTEM_PROMPT,
+        _EXAMPLES_SYSTEM_PROMPT,
+    ))
     async def process_python_module(
         self,
         module_path: Path,
@@ -48,336 +170,358 @@ class CodeProcessor:
         Returns:
             Generated markdown documentation
         """
-        # Parse Python code
-        code = module_path.read_text(encoding="utf-8")
-        tree = ast.parse(code)
-        
-        # Extract module info
-        module_info = self._extract_module_info(tree, code)
+        module_info = await self._load_module_info(module_path)
         
-        # Generate documentation sections
-        sections = []
+        # Generate documentation sections concurrently
+        coros = [
+            self._generate_module_overview(module_path, module_info),
+            self._generate_classes_docs(module_info.classes),
+            self._generate_functions_docs(module_info.functions),
+            self._generate_usage_examples(module_path, module_info),
+        ]
+        overview, classes_doc, functions_doc, examples = await asyncio.gather(*coros)
         
-        # Module overview
-        sections.append(await self._generate_module_overview(
-            module_path,
-            module_info,
-            code,
-        ))
+        sections = [overview]
         
         # Class diagram
-        if include_diagram and module_info["classes"]:
-            diagram = self._generate_class_diagram(module_info["classes"])
+        if include_diagram and module_info.classes:
+            diagram = self._generate_class_diagram(module_info.classes)
             sections.append(f"## Class Diagram\n\n{diagram}")
         
         # Classes
-        if module_info["classes"]:
-            sections.append(await self._generate_classes_docs(
-                module_info["classes"],
-                code,
-            ))
+        if module_info.classes:
+            sections.append(classes_doc)
         
         # Functions
-        if module_info["functions"]:
-            sections.append(await self._generate_functions_docs(
-                module_info["functions"],
-                code,
-            ))
+        if module_info.functions:
+            sections.append(functions_doc)
         
         # Usage examples
-        sections.append(await self._generate_usage_examples(
-            module_path,
-            module_info,
-            code,
-        ))
+        sections.append(examples)
         
         return "\n\n".join(sections)
     
-    async def process_class(
+    async def stream_python_module(
         self,
         module_path: Path,
-        class_name: str,
-    ) -> str:
-        """Process a single class from a Python module.
+        include_diagram: bool = True,
+    ) -> AsyncIterator[str]:
+        """Process a Python module into documentation, streaming the output.
+        
+        Produces the same markdown as process_python_module, but yields it
+        in document order while the sections are still being generated, so
+        callers can start writing before the slowest section completes.
         
         Args:
             module_path: Path to Python file
-            class_name: Name of class to document
+            include_diagram: Whether to include class diagram
             
-        Returns:
-            Generated markdown documentation for class
+        Yields:
+            Chunks of generated markdown documentation
         """
-        code = module_path.read_text(encoding="utf-8")
-        tree = ast.parse(code)
-        
-        # Find class
-        class_node = None
-        for node in ast.walk(tree):
-            if isinstance(node, ast.ClassDef) and node.name == class_name:
-                class_node = node
-                break
+        module_info = await self._load_module_info(module_path)
         
-        if not class_node:
-            raise ValueError(f"Class '{class_name}' not found in {module_path}")
-        
-        class_info = self._extract_class_info(class_node, code)
+        # Start all sections at once; streamed sections buffer in queues
+        # until the consumer reaches them
+        overview = self._start_stream(
+            self._module_overview_prompt(module_path, module_info),
+            _OVERVIEW_SYSTEM_PROMPT,
+        )
+        examples = self._start_stream(
+            self._usage_examples_prompt(module_path, module_info),
+            _EXAMPLES_SYSTEM_PROMPT,
+        )
+        classes_task = asyncio.ensure_future(
+            self._generate_classes_docs(module_info.classes)
+        )
+        functions_task = asyncio.ensure_future(
+            self._generate_functions_docs(module_info.functions)
+        )
+        tasks = [overview[1], examples[1], classes_task, functions_task]
         
-        return await self._generate_class_doc(class_info, code)
+        try:
+            yield f"# {module_path.stem} Module\n\n"
+            async for chunk in self._drain_stream(*overview):
+                yield chunk
+            
+            # Class diagram
+            if include_diagram and module_info.classes:
+                diagram = self._generate_class_diagram(module_info.classes)
+                yield f"\n\n## Class Diagram\n\n{diagram}"
+            
+            # Classes
+            if module_info.classes:
+                yield "\n\n" + await classes_task
+            
+            # Functions
+            if module_info.functions:
+                yield "\n\n" + await functions_task
+            
+            # Usage examples
+            yield "\n\n## Usage Examples\n\n"
+            async for chunk in self._drain_stream(*examples):
+                yield chunk
+        finally:
+            for task in tasks:
+                task.cancel()
     
-    def _extract_module_info(
+    def _start_stream(
         self,
-        tree: ast.Module,
-        code: str,
-    ) -> Dict[str, Any]:
-        """Extract information from module AST.
+        prompt: str,
+        system_prompt: str,
+    ) -> tuple[asyncio.Queue, asyncio.Task]:
+        """Start streaming a generation into a queue.
         
         Args:
-            tree: AST tree
-            code: Source code
+            prompt: User prompt
+            system_prompt: System prompt
             
         Returns:
-            Module information dictionary
+            Tuple of (chunk queue terminated by None, producer task)
         """
-        info = {
-            "docstring": ast.get_docstring(tree),
-            "classes": [],
-            "functions": [],
-            "imports": [],
-        }
-        
-        for node in tree.body:
-            if isinstance(node, ast.ClassDef):
-                info["classes"].append(self._extract_class_info(node, code))
-            elif isinstance(node, ast.FunctionDef):
-                info["functions"].append(self._extract_function_info(node, code))
-            elif isinstance(node, (ast.Import, ast.ImportFrom)):
-                info["imports"].append(self._extract_import_info(node))
-        
-        return info
+        queue: asyncio.Queue = asyncio.Queue()
+        
+        async def produce() -> None:
+            try:
+                async for chunk in self._requests.stream(prompt, system_prompt):
+                    queue.put_nowait(chunk)
+            finally:
+                queue.put_nowait(None)
+        
+        return queue, asyncio.ensure_future(produce())
     
-    def _extract_class_info(
-        self,
-        node: ast.ClassDef,
-        code: str,
-    ) -> Dict[str, Any]:
-        """Extract information from class node.
+    @staticmethod
+    async def _drain_stream(
+        queue: asyncio.Queue,
+        task: asyncio.Task,
+    ) -> AsyncIterator[str]:
+        """Yield chunks from a queue filled by _start_stream.
         
         Args:
-            node: Class AST node
-            code: Source code
+            queue: Chunk queue terminated by None
+            task: Producer task, awaited to surface its errors
             
-        Returns:
-            Class information dictionary
+        Yields:
+            Chunks of generated content
         """
-        methods = []
-        for item in node.body:
-            if isinstance(item, ast.FunctionDef):
-                methods.append(self._extract_function_info(item, code))
-        
-        return {
-            "name": node.name,
-            "docstring": ast.get_docstring(node),
-            "bases": [self._get_name(base) for base in node.bases],
-            "methods": methods,
-            "decorators": [self._get_name(dec) for dec in node.decorator_list],
-        }
+        while (chunk := await queue.get()) is not None:
+            yield chunk
+        await task
     
-    def _extract_function_info(
+    async def process_class(
         self,
-        node: ast.FunctionDef,
-        code: str,
-    ) -> Dict[str, Any]:
-        """Extract information from function node.
+        module_path: Path,
+        class_name: str,
+    ) -> str:
+        """Process a single class from a Python module.
         
         Args:
-            node: Function AST node
-            code: Source code
+            module_path: Path to Python file
+            class_name: Name of class to document
             
         Returns:
-            Function information dictionary
+            Generated markdown documentation for class
         """
-        args = []
-        for arg in node.args.args:
-            arg_info = {"name": arg.arg}
-            if arg.annotation:
-                arg_info["type"] = self._get_name(arg.annotation)
-            args.append(arg_info)
-        
-        return_type = None
-        if node.returns:
-            return_type = self._get_name(node.returns)
-        
-        return {
-            "name": node.name,
-            "docstring": ast.get_docstring(node),
-            "args": args,
-            "return_type": return_type,
-            "decorators": [self._get_name(dec) for dec in node.decorator_list],
-            "is_async": isinstance(node, ast.AsyncFunctionDef),
-        }
+        code = await asyncio.to_thread(module_path.read_text, encoding="utf-8")
+        tree = ast.parse(code)
+        
+        # Find class at module level, then one level of nesting
+        class_node = next(
+            (
+                node for node in tree.body
+                if isinstance(node, ast.ClassDef) and node.name == class_name
+            ),
+            None,
+        )
+        if not class_node:
+            class_node = next(
+                (
+                    node
+                    for parent in tree.body if isinstance(parent, ast.ClassDef)
+                    for node in parent.body
+                    if isinstance(node, ast.ClassDef) and node.name == class_name
+                ),
+                None,
+            )
+        
+        if not class_node:
+            raise ValueError(f"Class '{class_name}' not found in {module_path}")
+        
+        class_info = _ModuleVisitor.class_info(class_node)
+        
+        return await self._generate_class_doc(class_info)
     
-    def _extract_import_info(self, node: ast.AST) -> str:
-        """Extract import statement.
+    async def _load_module_info(self, module_path: Path) -> ModuleInfo:
+        """Read and parse a module, reusing the extracted info for unchanged sources.
+        
+        The most recently used infos are kept, so a long-lived processor
+        (e.g. in the daemon) doesn't grow without bound.
         
         Args:
-            node: Import AST node
+            module_path: Path to Python file
             
         Returns:
-            Import statement string
+            Extracted module information
         """
-        if isinstance(node, ast.Import):
-            return ", ".join(alias.name for alias in node.names)
-        elif isinstance(node, ast.ImportFrom):
-            module = node.module or ""
-            names = ", ".join(alias.name for alias in node.names)
-            return f"{module}: {names}"
-        return ""
+        code = await asyncio.to_thread(module_path.read_text, encoding="utf-8")
+        code_hash = content_hash(code)
+        module_info = self._module_info_cache.get(code_hash)
+        if module_info is not None:
+            self._module_info_cache.move_to_end(code_hash)
+            return module_info
+        
+        module_info = self._extract_module_info(ast.parse(code))
+        
+        self._module_info_cache[code_hash] = module_info
+        if len(self._module_info_cache) > _MODULE_INFO_CACHE_SIZE:
+            self._module_info_cache.popitem(last=False)
+        return module_info
     
-    def _get_name(self, node: ast.AST) -> str:
-        """Get name from AST node.
+    def _extract_module_info(self, tree: ast.Module) -> ModuleInfo:
+        """Extract information from module AST.
         
         Args:
-            node: AST node
+            tree: AST tree
             
         Returns:
-            Name string
+            Module information
         """
-        if isinstance(node, ast.Name):
-            return node.id
-        elif isinstance(node, ast.Attribute):
-            return f"{self._get_name(node.value)}.{node.attr}"
-        elif isinstance(node, ast.Subscript):
-            return f"{self._get_name(node.value)}[{self._get_name(node.slice)}]"
-        return str(node)
+        visitor = _ModuleVisitor()
+        visitor.visit(tree)
+        
+        return ModuleInfo(
+            docstring=ast.get_docstring(tree),
+            classes=tuple(visitor.classes),
+            functions=tuple(visitor.functions),
+            imports=tuple(visitor.imports),
+        )
     
     async def _generate_module_overview(
         self,
         module_path: Path,
-        module_info: Dict[str, Any],
-        code: str,
+        module_info: ModuleInfo,
     ) -> str:
         """Generate module overview section.
         
         Args:
             module_path: Path to module
             module_info: Extracted module information
-            code: Source code
             
         Returns:
             Overview markdown
         """
-        prompt = f"""Generate an overview for this Python module.
-
-Module: {module_path.name}
-Classes: {', '.join(c['name'] for c in module_info['classes'])}
-Functions: {', '.join(f['name'] for f in module_info['functions'])}
-
-Module docstring:
-{module_info['docstring'] or 'No docstring'}
-
-Write a brief overview explaining:
-- What this module does
-- Main classes and their purposes
-- Main functions and their purposes
-- How to use this module"""
-        
-        response = await self.provider.generate(
-            prompt=prompt,
-            system_prompt="You are a technical writer documenting Python code.",
+        content = await self._memoized_generate(
+            self._module_overview_prompt(module_path, module_info),
+            system_prompt=_OVERVIEW_SYSTEM_PROMPT,
         )
         
-        return f"# {module_path.stem} Module\n\n{response.content}"
+        return f"# {module_path.stem} Module\n\n{content}"
+    
+    @staticmethod
+    def _module_overview_prompt(module_path: Path, module_info: ModuleInfo) -> str:
+        """Build the module overview prompt.
+        
+        Args:
+            module_path: Path to module
+            module_info: Extracted module information
+            
+        Returns:
+            Prompt text
+        """
+        return _MODULE_OVERVIEW_TMPL.format_map({
+            "name": module_path.name,
+            "classes": ", ".join(c.name for c in module_info.classes),
+            "funcs": ", ".join(f.name for f in module_info.functions),
+            "docstring": module_info.docstring or "No docstring",
+        })
     
     async def _generate_classes_docs(
         self,
-        classes: List[Dict[str, Any]],
-        code: str,
+        classes: tuple[ClassInfo, ...],
     ) -> str:
         """Generate documentation for all classes.
         
         Args:
             classes: List of class information
-            code: Source code
             
         Returns:
             Classes documentation markdown
         """
-        sections = ["## Classes\n"]
-        
-        for class_info in classes:
-            class_doc = await self._generate_class_doc(class_info, code)
-            sections.append(class_doc)
+        tasks = [self._generate_class_doc(class_info) for class_info in classes]
+        docs = await asyncio.gather(*tasks)
         
-        return "\n\n".join(sections)
+        return "\n\n".join(["## Classes\n", *docs])
     
     async def _generate_class_doc(
         self,
-        class_info: Dict[str, Any],
-        code: str,
+        class_info: ClassInfo,
     ) -> str:
         """Generate documentation for a single class.
         
         Args:
             class_info: Class information
-            code: Source code
             
         Returns:
             Class documentation markdown
         """
-        sections = [f"### {class_info['name']}\n"]
+        # Each fragment carries its own leading newline; joined once at the end
+        out = [f"### {class_info.name}\n"]
         
         # Docstring
-        if class_info["docstring"]:
-            sections.append(class_info["docstring"])
+        if class_info.docstring:
+            out.append(f"\n{class_info.docstring}")
         
         # Inheritance
-        if class_info["bases"]:
-            bases = ", ".join(f"`{base}`" for base in class_info["bases"])
-            sections.append(f"\n**Inherits from**: {bases}")
+        if class_info.bases:
+            bases = ", ".join(f"`{base}`" for base in class_info.bases)
+            out.append(f"\n\n**Inherits from**: {bases}")
         
         # Methods
-        if class_info["methods"]:
-            sections.append("\n**Methods**:\n")
-            for method in class_info["methods"]:
-                method_sig = self._format_function_signature(method)
-                sections.append(f"- `{method_sig}`")
-                if method["docstring"]:
-                    # First line of docstring
-                    first_line = method["docstring"].split("\n")[0]
-                    sections.append(f"  - {first_line}")
-        
-        return "\n".join(sections)
+        if class_info.methods:
+            out.append("\n\n**Methods**:\n")
+            for method in class_info.methods:
+                out.append(f"\n- `{self._format_function_signature(method)}`")
+                if method.summary:
+                    out.append(f"\n  - {method.summary}")
+        
+        return "".join(out)
     
     async def _generate_functions_docs(
         self,
-        functions: List[Dict[str, Any]],
-        code: str,
+        functions: tuple[FunctionInfo, ...],
     ) -> str:
         """Generate documentation for all functions.
         
         Args:
             functions: List of function information
-            code: Source code
             
         Returns:
             Functions documentation markdown
         """
-        sections = ["## Functions\n"]
+        tasks = [self._generate_function_doc(func_info) for func_info in functions]
+        docs = await asyncio.gather(*tasks)
         
-        for func_info in functions:
-            sections.append(f"### {func_info['name']}\n")
-            
-            # Signature
-            sig = self._format_function_signature(func_info)
-            sections.append(f"```python\n{sig}\n```")
+        return "\n\n".join(["## Functions\n", *docs])
+    
+    async def _generate_function_doc(self, func_info: FunctionInfo) -> str:
+        """Generate documentation for a single function.
+        
+        Args:
+            func_info: Function information
             
-            # Docstring
-            if func_info["docstring"]:
-                sections.append(f"\n{func_info['docstring']}")
+        Returns:
+            Function documentation markdown
+        """
+        sig = self._format_function_signature(func_info)
+        doc = f"### {func_info.name}\n\n\n```python\n{sig}\n```"
         
-        return "\n\n".join(sections)
+        # Docstring
+        if func_info.docstring:
+            doc += f"\n\n\n{func_info.docstring}"
+        
+        return doc
     
-    def _format_function_signature(self, func_info: Dict[str, Any]) -> str:
+    def _format_function_signature(self, func_info: FunctionInfo) -> str:
         """Format function signature.
         
         Args:
@@ -387,25 +531,25 @@ Write a brief overview explaining:
             Formatted signature string
         """
         args = []
-        for arg in func_info["args"]:
-            if "type" in arg:
-                args.append(f"{arg['name']}: {arg['type']}")
+        for arg in func_info.args:
+            if arg.type:
+                args.append(f"{arg.name}: {arg.type}")
             else:
-                args.append(arg["name"])
+                args.append(arg.name)
         
-        sig = f"{func_info['name']}({', '.join(args)})"
+        sig = f"{func_info.name}({', '.join(args)})"
         
-        if func_info["return_type"]:
-            sig += f" -> {func_info['return_type']}"
+        if func_info.return_type:
+            sig += f" -> {func_info.return_type}"
         
-        if func_info["is_async"]:
+        if func_info.is_async:
             sig = f"async {sig}"
         
         return sig
     
     def _generate_class_diagram(
         self,
-        classes: List[Dict[str, Any]],
+        classes: tuple[ClassInfo, ...],
     ) -> str:
         """Generate Mermaid class diagram.
         
@@ -415,61 +559,71 @@ Write a brief overview explaining:
         Returns:
             Mermaid diagram markdown
         """
-        lines = ["```mermaid", "classDiagram"]
+        blocks = []
         
         for class_info in classes:
-            class_name = class_info["name"]
-            
-            # Class definition
-            lines.append(f"    class {class_name} {{")
+            name = class_info.name
             
-            # Methods
-            for method in class_info["methods"]:
-                method_name = method["name"]
-                return_type = method.get("return_type", "")
-                if return_type:
-                    lines.append(f"        +{method_name}() {return_type}")
-                else:
-                    lines.append(f"        +{method_name}()")
-            
-            lines.append("    }")
+            # Class definition with one line per method
+            method_lines = "".join(
+                f"        +{method.name}() {method.return_type}\n"
+                if method.return_type
+                else f"        +{method.name}()\n"
+                for method in class_info.methods
+            )
+            blocks.append(f"    class {name} {{\n{method_lines}    }}")
             
             # Inheritance
-            for base in class_info["bases"]:
-                lines.append(f"    {base} <|-- {class_name}")
-        
-        lines.append("```")
+            blocks.extend(f"    {base} <|-- {name}" for base in class_info.bases)
         
-        return "\n".join(lines)
+        return "```mermaid\nclassDiagram\n" + "\n".join(blocks) + "\n```"
     
     async def _generate_usage_examples(
         self,
         module_path: Path,
-        module_info: Dict[str, Any],
-        code: str,
+        module_info: ModuleInfo,
     ) -> str:
         """Generate usage examples section.
         
         Args:
             module_path: Path to module
             module_info: Module information
-            code: Source code
             
         Returns:
             Usage examples markdown
         """
-        prompt = f"""Generate usage examples for this Python module.
-
-Module: {module_path.name}
-Classes: {', '.join(c['name'] for c in module_info['classes'])}
-Functions: {', '.join(f['name'] for f in module_info['functions'])}
-
-Generate 2-3 practical code examples showing how to use this module.
-Include imports and complete, runnable examples."""
-        
-        response = await self.provider.generate(
-            prompt=prompt,
-            system_prompt="You are a technical writer creating code examples.",
+        content = await self._memoized_generate(
+            self._usage_examples_prompt(module_path, module_info),
+            system_prompt=_EXAMPLES_SYSTEM_PROMPT,
         )
         
-        return f"## Usage Examples\n\n{response.content}"
+        return f"## Usage Examples\n\n{content}"
+    
+    @staticmethod
+    def _usage_examples_prompt(module_path: Path, module_info: ModuleInfo) -> str:
+        """Build the usage examples prompt.
+        
+        Args:
+            module_path: Path to module
+            module_info: Module information
+            
+        Returns:
+            Prompt text
+        """
+        return _USAGE_EXAMPLES_TMPL.format_map({
+            "name": module_path.name,
+            "classes": ", ".join(c.name for c in module_info.classes),
+            "funcs": ", ".join(f.name for f in module_info.functions),
+        })
+    
+    async def _memoized_generate(self, prompt: str, system_prompt: str) -> str:
+        """Generate content, sharing cached and in-flight responses.
+        
+        Args:
+            prompt: User prompt
+            system_prompt: System prompt
+            
+        Returns:
+            Generated content
+        """
+        return await self._requests.generate(prompt, system_prompt)
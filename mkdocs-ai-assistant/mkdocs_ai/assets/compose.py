@@ -2,10 +2,80 @@
 
 from pathlib import Path
 from typing import Dict, List, Any, Optional
+import asyncio
+import copy
+import functools
 import yaml
 
 from ..providers import AIProvider
-from ..cache import CacheManager
+from ..cache import CacheManager, RequestCoalescer, cached_by_hash
+
+# Prefer the LibYAML C bindings when available
+try:
+    from yaml import CSafeDumper as _SafeDumper, CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeDumper as _SafeDumper, SafeLoader as _SafeLoader
+
+# Compose files larger than this are summarized in prompts instead of quoted
+MAX_PROMPT_YAML_CHARS = 8000
+
+# Static prompt scaffolding; only the dynamic slots are filled per call
+_OVERVIEW_TMPL = """Generate an overview for this Docker Compose setup.
+
+File: {name}
+Services: {services}
+
+Compose content:
+```yaml
+{content}
+```
+
+Write a brief overview explaining:
+- What this Docker Compose setup does
+- The main services and their roles
+- The overall purpose of the stack"""
+
+_OVERVIEW_SYSTEM_PROMPT = "You are a technical writer documenting Docker infrastructure."
+
+
+def _load_compose_file(
+    path: str,
+    mtime_ns: int,
+    size: int,
+) -> tuple[str, Dict[str, Any]]:
+    """Load a compose file, memoized by path, modification time and size.
+    
+    Args:
+        path: Path to compose file
+        mtime_ns: Modification time in nanoseconds (cache key only)
+        size: File size in bytes (cache key only)
+        
+    Returns:
+        Tuple of (raw file content, parsed compose data); the data is a
+        copy the caller may modify
+    """
+    content, data = _parse_compose_file(path, mtime_ns, size)
+    return content, copy.deepcopy(data)
+
+
+@functools.lru_cache(maxsize=32)
+def _parse_compose_file(
+    path: str,
+    mtime_ns: int,
+    size: int,
+) -> tuple[str, Dict[str, Any]]:
+    """Read and parse a compose file; the result is shared between callers.
+    
+    Args:
+        path: Path to compose file
+        mtime_ns: Modification time in nanoseconds (cache key only)
+        size: File size in bytes (cache key only)
+        
+    Returns:
+        Tuple of (raw file content, parsed compose data)
+    """
+    content = Path(path).read_text(encoding="utf-8")
+    return content, yaml.load(content, Loader=_SafeLoader)
 
 
 class ComposeProcessor:
@@ -19,20 +89,27 @@ class ComposeProcessor:
     - Environment variable reference
     """
     
+    # Characters Mermaid doesn't accept in node IDs
+    _MERMAID_TRANS = str.maketrans({"-": "_", ".": "_", "/": "_"})
+    
     def __init__(
         self,
         provider: AIProvider,
         cache_manager: Optional[CacheManager] = None,
+        max_concurrency: int = 4,
     ):
         """Initialize processor.
         
         Args:
             provider: AI provider for generation
             cache_manager: Optional cache manager
+            max_concurrency: Maximum number of concurrent provider requests
         """
         self.provider = provider
         self.cache_manager = cache_manager
+        self._requests = RequestCoalescer(provider, cache_manager, max_concurrency)
     
+    @cached_by_hash("compose_file", (_OVERVIEW_TMPL, _OVERVIEW_SYSTEM_PROMPT))
     async def process_compose_file(
         self,
         compose_path: Path,
@@ -48,13 +125,20 @@ class ComposeProcessor:
             Generated markdown documentation
         """
         # Parse compose file
-        compose_data = self._parse_compose_file(compose_path)
+        compose_text, compose_data = await self._read_compose_file(compose_path)
+        compose_data = compose_data or {}
         
-        # Generate documentation sections
-        sections = []
+        # Override and fragment files without services don't need the provider
+        if not compose_data.get("services"):
+            return self._generate_stub(compose_path, compose_data)
         
-        # Overview
-        sections.append(await self._generate_overview(compose_data, compose_path))
+        # Generate AI-backed sections concurrently
+        overview, services_doc = await asyncio.gather(
+            self._generate_overview(compose_data, compose_path, compose_text),
+            self._generate_services_docs(compose_data),
+        )
+        
+        sections = [overview]
         
         # Architecture diagram
         if include_diagram:
@@ -62,7 +146,7 @@ class ComposeProcessor:
             sections.append(f"## Architecture\n\n{diagram}")
         
         # Services
-        sections.append(await self._generate_services_docs(compose_data))
+        sections.append(services_doc)
         
         # Networks
         if "networks" in compose_data:
@@ -77,6 +161,30 @@ class ComposeProcessor:
         
         return "\n\n".join(sections)
     
+    def _generate_stub(
+        self,
+        compose_path: Path,
+        compose_data: Dict[str, Any],
+    ) -> str:
+        """Generate minimal documentation for a compose file without services.
+        
+        Args:
+            compose_path: Path to compose file
+            compose_data: Parsed compose data
+            
+        Returns:
+            Stub markdown
+        """
+        sections = [f"# {compose_path.stem}\n\nNo services defined."]
+        
+        if compose_data.get("networks"):
+            sections.append(self._generate_networks_docs(compose_data["networks"]))
+        
+        if compose_data.get("volumes"):
+            sections.append(self._generate_volumes_docs(compose_data["volumes"]))
+        
+        return "\n\n".join(sections)
+    
     async def process_service(
         self,
         compose_path: Path,
@@ -91,7 +199,7 @@ class ComposeProcessor:
         Returns:
             Generated markdown documentation for service
         """
-        compose_data = self._parse_compose_file(compose_path)
+        compose_data = await self._parse_compose_file(compose_path)
         
         if service_name not in compose_data.get("services", {}):
             raise ValueError(f"Service '{service_name}' not found in {compose_path}")
@@ -100,7 +208,7 @@ class ComposeProcessor:
         
         return await self._generate_service_doc(service_name, service, compose_data)
     
-    def _parse_compose_file(self, compose_path: Path) -> Dict[str, Any]:
+    async def _parse_compose_file(self, compose_path: Path) -> Dict[str, Any]:
         """Parse Docker Compose YAML file.
         
         Args:
@@ -109,46 +217,79 @@ class ComposeProcessor:
         Returns:
             Parsed compose data
         """
-        content = compose_path.read_text(encoding="utf-8")
-        return yaml.safe_load(content)
+        _, compose_data = await self._read_compose_file(compose_path)
+        return compose_data
+    
+    async def _read_compose_file(self, compose_path: Path) -> tuple[str, Dict[str, Any]]:
+        """Read and parse Docker Compose YAML file off the event loop.
+        
+        Args:
+            compose_path: Path to compose file
+            
+        Returns:
+            Tuple of (raw file content, parsed compose data)
+        """
+        def load() -> tuple[str, Dict[str, Any]]:
+            stat = compose_path.stat()
+            return _load_compose_file(str(compose_path), stat.st_mtime_ns, stat.st_size)
+        
+        return await asyncio.to_thread(load)
     
     async def _generate_overview(
         self,
         compose_data: Dict[str, Any],
         compose_path: Path,
+        compose_text: str,
     ) -> str:
         """Generate overview section.
         
         Args:
             compose_data: Parsed compose data
             compose_path: Path to compose file
+            compose_text: Raw compose file content
             
         Returns:
             Overview markdown
         """
         services = list(compose_data.get("services", {}).keys())
         
-        prompt = f"""Generate an overview for this Docker Compose setup.
-
-File: {compose_path.name}
-Services: {', '.join(services)}
-
-Compose content:
-```yaml
-{yaml.dump(compose_data, default_flow_style=False)}
-```
-
-Write a brief overview explaining:
-- What this Docker Compose setup does
-- The main services and their roles
-- The overall purpose of the stack"""
+        # Quote the file as written; only large files are trimmed to the
+        # top-level sections that matter for the overview
+        if len(compose_text) > MAX_PROMPT_YAML_CHARS:
+            compose_text = yaml.dump(
+                {
+                    key: compose_data[key]
+                    for key in ("services", "networks", "volumes")
+                    if key in compose_data
+                },
+                Dumper=_SafeDumper,
+                default_flow_style=False,
+            )
+        
+        prompt = _OVERVIEW_TMPL.format_map({
+            "name": compose_path.name,
+            "services": ", ".join(services),
+            "content": compose_text.rstrip(),
+        })
         
-        response = await self.provider.generate(
-            prompt=prompt,
-            system_prompt="You are a technical writer documenting Docker infrastructure.",
+        content = await self._memoized_generate(
+            prompt,
+            system_prompt=_OVERVIEW_SYSTEM_PROMPT,
         )
         
-        return f"# {compose_path.stem} Documentation\n\n{response.content}"
+        return f"# {compose_path.stem} Documentation\n\n{content}"
+    
+    async def _memoized_generate(self, prompt: str, system_prompt: str) -> str:
+        """Generate content, sharing cached and in-flight responses.
+        
+        Args:
+            prompt: User prompt
+            system_prompt: System prompt
+            
+        Returns:
+            Generated content
+        """
+        return await self._requests.generate(prompt, system_prompt)
     
     async def _generate_services_docs(
         self,
@@ -167,17 +308,13 @@ Write a brief overview explaining:
         if not services:
             return ""
         
-        sections = ["## Services\n"]
+        tasks = [
+            self._generate_service_doc(service_name, service_config, compose_data)
+            for service_name, service_config in services.items()
+        ]
+        docs = await asyncio.gather(*tasks)
         
-        for service_name, service_config in services.items():
-            service_doc = await self._generate_service_doc(
-                service_name,
-                service_config,
-                compose_data,
-            )
-            sections.append(service_doc)
-        
-        return "\n\n".join(sections)
+        return "\n\n".join(["## Services\n", *docs])
     
     async def _generate_service_doc(
         self,
@@ -203,43 +340,36 @@ Write a brief overview explaining:
         volumes = service_config.get("volumes", [])
         depends_on = service_config.get("depends_on", [])
         
-        sections = [f"### {service_name}\n"]
+        # Each fragment carries its own leading newline; joined once at the end
+        out = [f"### {service_name}\n"]
         
         # Basic info
         if image != "N/A":
-            sections.append(f"**Image**: `{image}`")
+            out.append(f"\n**Image**: `{image}`")
         if build:
-            sections.append(f"**Build**: `{build}`")
+            out.append(f"\n**Build**: `{build}`")
         
         # Ports
         if ports:
-            sections.append("\n**Ports**:")
-            for port in ports:
-                sections.append(f"- `{port}`")
+            out.append("\n\n**Ports**:\n" + "\n".join(f"- `{port}`" for port in ports))
         
         # Environment variables
         if environment:
-            sections.append("\n**Environment Variables**:")
             if isinstance(environment, dict):
-                for key, value in environment.items():
-                    sections.append(f"- `{key}`: {value}")
+                env_lines = "\n".join(f"- `{key}`: {value}" for key, value in environment.items())
             else:
-                for env in environment:
-                    sections.append(f"- `{env}`")
+                env_lines = "\n".join(f"- `{env}`" for env in environment)
+            out.append("\n\n**Environment Variables**:\n" + env_lines)
         
         # Volumes
         if volumes:
-            sections.append("\n**Volumes**:")
-            for volume in volumes:
-                sections.append(f"- `{volume}`")
+            out.append("\n\n**Volumes**:\n" + "\n".join(f"- `{volume}`" for volume in volumes))
         
         # Dependencies
         if depends_on:
-            sections.append("\n**Dependencies**:")
-            for dep in depends_on:
-                sections.append(f"- `{dep}`")
+            out.append("\n\n**Dependencies**:\n" + "\n".join(f"- `{dep}`" for dep in depends_on))
         
-        return "\n".join(sections)
+        return "".join(out)
     
     def _generate_architecture_diagram(
         self,
@@ -260,19 +390,20 @@ Write a brief overview explaining:
         
         lines = ["```mermaid", "graph TB"]
         
+        # Sanitize names for Mermaid once per service
+        node_ids = {name: name.translate(self._MERMAID_TRANS) for name in services}
+        
         # Add services as nodes
-        for service_name in services.keys():
-            # Sanitize name for Mermaid
-            node_id = service_name.replace("-", "_").replace(".", "_")
+        for service_name, node_id in node_ids.items():
             lines.append(f"    {node_id}[{service_name}]")
         
         # Add dependencies as edges
         for service_name, service_config in services.items():
-            node_id = service_name.replace("-", "_").replace(".", "_")
+            node_id = node_ids[service_name]
             depends_on = service_config.get("depends_on", [])
             
             for dep in depends_on:
-                dep_id = dep.replace("-", "_").replace(".", "_")
+                dep_id = node_ids.get(dep) or dep.translate(self._MERMAID_TRANS)
                 lines.append(f"    {node_id} --> {dep_id}")
         
         lines.append("```")
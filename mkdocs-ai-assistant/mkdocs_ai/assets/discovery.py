@@ -1,9 +1,135 @@
 """Asset discovery system for automatic documentation generation."""
 
 from pathlib import Path
-from typing import List, Dict, Any, Optional
-import yaml
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, List, Dict, Any, Iterator, Optional, Tuple
+import fnmatch
 import json
+import os
+import re
+import yaml
+
+# Prefer the LibYAML C bindings and orjson when available
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+# Directories never descended into during discovery
+IGNORE_DIRS = frozenset({
+    "node_modules",
+    ".git",
+    ".venv",
+    "venv",
+    "__pycache__",
+    ".pytest_cache",
+    ".mypy_cache",
+    "dist",
+    "build",
+    ".tox",
+    "site",
+    ".cache",
+    ".ai-cache",
+})
+
+# File name patterns per asset type (matched against the name only)
+ASSET_PATTERNS = {
+    "docker_compose": [
+        "docker-compose.yml",
+        "docker-compose.yaml",
+        "compose.yml",
+        "compose.yaml",
+        "docker-compose.*.yml",
+        "docker-compose.*.yaml",
+    ],
+    "python_modules": [
+        "__init__.py",
+    ],
+    "openapi_specs": [
+        "openapi.json",
+        "openapi.yaml",
+        "openapi.yml",
+        "swagger.json",
+        "swagger.yaml",
+        "swagger.yml",
+        "*openapi*.json",
+        "*openapi*.yaml",
+        "*swagger*.json",
+        "*swagger*.yaml",
+    ],
+    "config_files": [
+        "package.json",
+        "pyproject.toml",
+        "Cargo.toml",
+        "go.mod",
+        "pom.xml",
+        "build.gradle",
+        "CMakeLists.txt",
+    ],
+}
+
+
+def _compile_patterns(
+    patterns: Dict[str, List[str]],
+) -> Tuple[Dict[str, List[str]], Dict[str, Callable[[str], Any]]]:
+    """Split name patterns into literal lookups and compiled wildcard matchers.
+    
+    Args:
+        patterns: Patterns per asset type
+        
+    Returns:
+        Tuple of (literal name -> asset types, asset type -> regex match)
+    """
+    literals: Dict[str, List[str]] = {}
+    matchers: Dict[str, Callable[[str], Any]] = {}
+    
+    for asset_type, type_patterns in patterns.items():
+        wildcards = []
+        for pattern in type_patterns:
+            if any(char in pattern for char in "*?["):
+                wildcards.append(fnmatch.translate(pattern))
+            else:
+                literals.setdefault(pattern, []).append(asset_type)
+        if wildcards:
+            matchers[asset_type] = re.compile("|".join(wildcards)).match
+    
+    return literals, matchers
+
+
+_LITERAL_NAMES, _NAME_MATCHERS = _compile_patterns(ASSET_PATTERNS)
+
+# Leading bytes of a candidate file inspected before it is fully parsed
+OPENAPI_SNIFF_BYTES = 4096
+
+# At least one of these appears near the top of any OpenAPI/Swagger document
+_OPENAPI_MARKERS = (b"openapi", b"swagger", b"info", b"paths")
+
+# Parallel discovery only pays off for wide trees
+PARALLEL_DISCOVERY_MIN_DIRS = 16
+
+# Bump when the persisted discovery format or classification rules change
+DISCOVERY_CACHE_VERSION = 1
+
+
+def _discover_subtrees(
+    project_root: str,
+    directories: List[Tuple[str, bool]],
+) -> Dict[str, List[str]]:
+    """Discover assets below some top-level directories (process pool worker).
+    
+    Args:
+        project_root: Root directory of the project
+        directories: Tuples of (directory, whether it is a source directory)
+        
+    Returns:
+        Dictionary mapping asset types to file paths
+    """
+    return AssetDiscovery(Path(project_root))._discover(directories)
 
 
 class AssetDiscovery:
@@ -14,28 +140,148 @@ class AssetDiscovery:
     - Python modules
     - OpenAPI specifications
     - Configuration files
+    
+    The project tree is walked once with os.scandir and every file is
+    classified against all asset types in the same pass.
     """
     
-    def __init__(self, project_root: Path):
+    # Top-level directories whose Python files are all documented
+    SOURCE_DIRS = {"src", "lib", "app"}
+    
+    def __init__(self, project_root: Path, cache_dir: Optional[Path] = None):
         """Initialize discovery system.
         
         Args:
             project_root: Root directory of the project
+            cache_dir: Directory for the persisted discovery result
+                (defaults to .ai-cache in the project root)
         """
         self.project_root = Path(project_root)
+        self.cache_dir = Path(cache_dir) if cache_dir else self.project_root / ".ai-cache"
+        self._stamps: Dict[str, int] = {}
         
     def discover_all(self) -> Dict[str, List[Path]]:
         """Discover all supported asset types.
         
+        Reuses the result persisted by a previous run when nothing it was
+        derived from has changed (set MKDOCS_AI_NOCACHE=1 to bypass).
+        
         Returns:
             Dictionary mapping asset types to file paths
         """
-        return {
-            "docker_compose": self.discover_docker_compose(),
-            "python_modules": self.discover_python_modules(),
-            "openapi_specs": self.discover_openapi_specs(),
-            "config_files": self.discover_config_files(),
+        use_cache = os.environ.get("MKDOCS_AI_NOCACHE") != "1"
+        
+        if use_cache:
+            cached = self.load_cached()
+            if cached is not None:
+                return cached
+            
+            # Create the cache directory before the walk stamps its parent
+            try:
+                self.cache_dir.mkdir(parents=True, exist_ok=True)
+            except OSError:
+                pass
+        
+        self._stamps = {}
+        assets = self._to_paths(self._discover(stamps=self._stamps))
+        
+        if use_cache:
+            self.save_cache(assets)
+        
+        return assets
+    
+    @property
+    def cache_file(self) -> Path:
+        """Path of the persisted discovery result."""
+        return self.cache_dir / "discovery.json"
+    
+    def load_cached(self) -> Optional[Dict[str, List[Path]]]:
+        """Load the persisted discovery result if it is still valid.
+        
+        The result is stamped with the modification times of every walked
+        directory (which change when entries are added, removed or renamed)
+        and of every OpenAPI candidate (whose content decides validity).
+        
+        Returns:
+            Dictionary mapping asset types to file paths, or None if there
+            is no valid cached result
+        """
+        try:
+            with open(self.cache_file, "rb") as f:
+                data = json.load(f)
+            
+            if (
+                data.get("version") != DISCOVERY_CACHE_VERSION
+                or data.get("project_root") != str(self.project_root)
+            ):
+                return None
+            
+            for path, mtime_ns in data["stamps"].items():
+                if os.stat(path).st_mtime_ns != mtime_ns:
+                    return None
+            
+            return self._to_paths(data["assets"])
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            return None
+    
+    def save_cache(self, assets: Dict[str, List[Path]]) -> None:
+        """Persist a discovery result stamped by the last discover_all walk.
+        
+        Args:
+            assets: Dictionary mapping asset types to file paths
+        """
+        data = {
+            "version": DISCOVERY_CACHE_VERSION,
+            "project_root": str(self.project_root),
+            "stamps": self._stamps,
+            "assets": {
+                asset_type: [str(file) for file in files]
+                for asset_type, files in assets.items()
+            },
         }
+        
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            self.cache_file.write_text(json.dumps(data), encoding="utf-8")
+        except OSError:
+            pass  # Persisting is an optimization only
+    
+    def discover_all_parallel(self, workers: Optional[int] = None) -> Dict[str, List[Path]]:
+        """Discover all supported asset types using multiple processes.
+        
+        Top-level directories are split across a process pool, each worker
+        walking its share of the tree. Projects with few top-level
+        directories are discovered in-process instead.
+        
+        Args:
+            workers: Number of worker processes (defaults to the CPU count)
+            
+        Returns:
+            Dictionary mapping asset types to file paths
+        """
+        root = str(self.project_root)
+        with os.scandir(root) as entries:
+            entries = list(entries)
+        
+        subdirs = [
+            (entry.path, entry.name in self.SOURCE_DIRS)
+            for entry in entries
+            if entry.is_dir(follow_symlinks=False) and entry.name not in IGNORE_DIRS
+        ]
+        if len(subdirs) <= PARALLEL_DISCOVERY_MIN_DIRS:
+            return self.discover_all()
+        
+        # Files directly in the root are classified here
+        assets = self._classify_files(entry for entry in entries if entry.is_file())
+        
+        workers = min(workers or os.cpu_count() or 1, len(subdirs))
+        chunks = [subdirs[i::workers] for i in range(workers)]
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for result in pool.map(_discover_subtrees, [root] * workers, chunks):
+                for asset_type, files in result.items():
+                    assets[asset_type].extend(files)
+        
+        return self._to_paths(assets)
     
     def discover_docker_compose(self) -> List[Path]:
         """Discover Docker Compose files.
@@ -50,21 +296,7 @@ class AssetDiscovery:
         Returns:
             List of Docker Compose file paths
         """
-        patterns = [
-            "docker-compose.yml",
-            "docker-compose.yaml",
-            "compose.yml",
-            "compose.yaml",
-            "docker-compose.*.yml",
-            "docker-compose.*.yaml",
-        ]
-        
-        files = []
-        for pattern in patterns:
-            files.extend(self.project_root.rglob(pattern))
-        
-        # Filter out files in common ignore directories
-        return self._filter_ignored(files)
+        return [Path(file) for file in self._scan()["docker_compose"]]
     
     def discover_python_modules(self) -> List[Path]:
         """Discover Python modules.
@@ -76,18 +308,7 @@ class AssetDiscovery:
         Returns:
             List of Python module paths
         """
-        files = []
-        
-        # Find all __init__.py files (packages)
-        files.extend(self.project_root.rglob("__init__.py"))
-        
-        # Find Python files in common source directories
-        for src_dir in ["src", "lib", "app"]:
-            src_path = self.project_root / src_dir
-            if src_path.exists():
-                files.extend(src_path.rglob("*.py"))
-        
-        return self._filter_ignored(files)
+        return [Path(file) for file in self._scan()["python_modules"]]
     
     def discover_openapi_specs(self) -> List[Path]:
         """Discover OpenAPI specification files.
@@ -102,30 +323,11 @@ class AssetDiscovery:
         Returns:
             List of OpenAPI spec file paths
         """
-        patterns = [
-            "openapi.json",
-            "openapi.yaml",
-            "openapi.yml",
-            "swagger.json",
-            "swagger.yaml",
-            "swagger.yml",
-            "*openapi*.json",
-            "*openapi*.yaml",
-            "*swagger*.json",
-            "*swagger*.yaml",
-        ]
-        
-        files = []
-        for pattern in patterns:
-            files.extend(self.project_root.rglob(pattern))
-        
         # Validate that files are actually OpenAPI specs
-        validated = []
-        for file in files:
-            if self._is_openapi_spec(file):
-                validated.append(file)
-        
-        return self._filter_ignored(validated)
+        return [
+            Path(file) for file in self._scan()["openapi_specs"]
+            if self._is_openapi_spec(file)
+        ]
     
     def discover_config_files(self) -> List[Path]:
         """Discover configuration files.
@@ -140,55 +342,165 @@ class AssetDiscovery:
         Returns:
             List of configuration file paths
         """
-        patterns = [
-            "package.json",
-            "pyproject.toml",
-            "Cargo.toml",
-            "go.mod",
-            "pom.xml",
-            "build.gradle",
-            "CMakeLists.txt",
+        return [Path(file) for file in self._scan()["config_files"]]
+    
+    def _discover(
+        self,
+        directories: Optional[List[Tuple[str, bool]]] = None,
+        stamps: Optional[Dict[str, int]] = None,
+    ) -> Dict[str, List[str]]:
+        """Scan the project and keep only valid OpenAPI specs.
+        
+        Args:
+            directories: Directories to walk instead of the project root
+            stamps: Optional dict collecting the modification times the
+                result depends on
+            
+        Returns:
+            Dictionary mapping asset types to file paths
+        """
+        assets = self._scan(directories, stamps)
+        
+        if stamps is not None:
+            for file in assets["openapi_specs"]:
+                try:
+                    stamps[file] = os.stat(file).st_mtime_ns
+                except OSError:
+                    pass
+        
+        assets["openapi_specs"] = [
+            file for file in assets["openapi_specs"] if self._is_openapi_spec(file)
         ]
+        return assets
+    
+    def _scan(
+        self,
+        directories: Optional[List[Tuple[str, bool]]] = None,
+        stamps: Optional[Dict[str, int]] = None,
+    ) -> Dict[str, List[str]]:
+        """Walk the project once and bucket candidate files by asset type.
+        
+        Paths stay plain strings internally; the public discover_* methods
+        convert them to Path objects once, on return.
         
-        files = []
-        for pattern in patterns:
-            files.extend(self.project_root.rglob(pattern))
+        Args:
+            directories: Directories to walk instead of the project root
+            stamps: Optional dict collecting walked directory modification times
+            
+        Returns:
+            Dictionary mapping asset types to candidate file paths
+        """
+        assets: Dict[str, List[str]] = {asset_type: [] for asset_type in ASSET_PATTERNS}
         
-        return self._filter_ignored(files)
+        for entry, in_source_dir in self._walk(directories, stamps):
+            for asset_type in self._classify(entry.name, in_source_dir):
+                assets[asset_type].append(entry.path)
+        
+        return assets
     
-    def _filter_ignored(self, files: List[Path]) -> List[Path]:
-        """Filter out files in ignored directories.
+    def _classify_files(self, entries: Iterator[os.DirEntry]) -> Dict[str, List[str]]:
+        """Bucket files outside any source directory, validating OpenAPI specs.
         
         Args:
-            files: List of file paths
+            entries: File entries
             
         Returns:
-            Filtered list of file paths
-        """
-        ignore_dirs = {
-            "node_modules",
-            ".git",
-            ".venv",
-            "venv",
-            "__pycache__",
-            ".pytest_cache",
-            ".mypy_cache",
-            "dist",
-            "build",
-            ".tox",
-            "site",
-            ".cache",
+            Dictionary mapping asset types to file paths
+        """
+        assets: Dict[str, List[str]] = {asset_type: [] for asset_type in ASSET_PATTERNS}
+        
+        for entry in entries:
+            for asset_type in self._classify(entry.name, False):
+                if asset_type != "openapi_specs" or self._is_openapi_spec(entry.path):
+                    assets[asset_type].append(entry.path)
+        
+        return assets
+    
+    @staticmethod
+    def _to_paths(assets: Dict[str, List[str]]) -> Dict[str, List[Path]]:
+        """Convert discovered string paths to Path objects.
+        
+        Args:
+            assets: Dictionary mapping asset types to file paths
+            
+        Returns:
+            Dictionary mapping asset types to Path objects
+        """
+        return {
+            asset_type: [Path(file) for file in files]
+            for asset_type, files in assets.items()
         }
+    
+    def _walk(
+        self,
+        directories: Optional[List[Tuple[str, bool]]] = None,
+        stamps: Optional[Dict[str, int]] = None,
+    ) -> Iterator[Tuple[os.DirEntry, bool]]:
+        """Yield every file below the project root.
         
-        filtered = []
-        for file in files:
-            # Check if any parent directory is in ignore list
-            if not any(part in ignore_dirs for part in file.parts):
-                filtered.append(file)
+        Ignored directories are pruned before descending into them and
+        symlinked directories are not followed.
+        
+        Args:
+            directories: Tuples of (directory, whether it is a source
+                directory) to walk instead of the project root
+            stamps: Optional dict collecting each walked directory's
+                modification time, taken before it is listed
+            
+        Yields:
+            Tuples of (file entry, whether it is inside a source directory)
+        """
+        root = str(self.project_root)
+        stack = list(directories) if directories is not None else [(root, False)]
         
-        return filtered
+        while stack:
+            directory, in_source_dir = stack.pop()
+            try:
+                if stamps is not None:
+                    stamps[directory] = os.stat(directory).st_mtime_ns
+                entries = os.scandir(directory)
+            except OSError:
+                continue
+            
+            with entries:
+                for entry in entries:
+                    # Symlinked directories are never followed: no cycles,
+                    # no duplicate subtrees, and no extra stat per entry
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in IGNORE_DIRS:
+                            stack.append((
+                                entry.path,
+                                in_source_dir or (
+                                    directory == root and entry.name in self.SOURCE_DIRS
+                                ),
+                            ))
+                    elif entry.is_file():
+                        yield entry, in_source_dir
     
-    def _is_openapi_spec(self, file: Path) -> bool:
+    def _classify(self, name: str, in_source_dir: bool) -> List[str]:
+        """Get the asset types a file name belongs to.
+        
+        Args:
+            name: File name
+            in_source_dir: Whether the file is inside a source directory
+            
+        Returns:
+            Matching asset types (usually zero or one)
+        """
+        # Literal names are a dict lookup; wildcards go through one regex per type
+        asset_types = list(_LITERAL_NAMES.get(name, ()))
+        
+        for asset_type, match in _NAME_MATCHERS.items():
+            if asset_type not in asset_types and match(name):
+                asset_types.append(asset_type)
+        
+        # Any module inside a source directory
+        if in_source_dir and name.endswith(".py") and "python_modules" not in asset_types:
+            asset_types.append("python_modules")
+        
+        return asset_types
+    
+    def _is_openapi_spec(self, file: str) -> bool:
         """Check if file is a valid OpenAPI specification.
         
         Args:
@@ -198,12 +510,17 @@ class AssetDiscovery:
             True if file is an OpenAPI spec
         """
         try:
-            content = file.read_text(encoding="utf-8")
+            with open(file, "rb") as f:
+                # Cheap sniff: skip parsing files that can't contain the markers
+                head = f.read(OPENAPI_SNIFF_BYTES)
+                if not any(marker in head for marker in _OPENAPI_MARKERS):
+                    return False
+                content = head + f.read()
             
-            if file.suffix == ".json":
-                data = json.loads(content)
+            if file.endswith(".json"):
+                data = _json_loads(content)
             else:
-                data = yaml.safe_load(content)
+                data = yaml.load(content, Loader=_SafeLoader)
             
             # Check for OpenAPI/Swagger markers
             return (
@@ -241,7 +558,25 @@ class Asset:
         Returns:
             File content as string
         """
-        return self.path.read_text(encoding="utf-8")
+        content = self.read_bytes().decode("utf-8")
+        
+        # Match the newline translation of text-mode reads
+        if "\r" in content:
+            content = content.replace("\r\n", "\n").replace("\r", "\n")
+        
+        return content
+    
+    def read_bytes(self) -> bytes:
+        """Read raw asset file content in a single read.
+        
+        Parsers that accept bytes (json, orjson, yaml) can use this directly
+        instead of round-tripping through str.
+        
+        Returns:
+            File content as bytes
+        """
+        with open(self.path, "rb") as f:
+            return f.read()
     
     def __repr__(self) -> str:
         return f"Asset(path={self.path}, type={self.asset_type})"
@@ -46,3 +46,45 @@ class AssetConfig:
 
     enabled: bool = False
     sources: list[AssetSource] = field(default_factory=list)
+
+
+@dataclass(frozen=True, slots=True)
+class ArgInfo:
+    """Function argument extracted from source code."""
+
+    name: str
+    type: Optional[str] = None
+
+
+@dataclass(frozen=True, slots=True)
+class FunctionInfo:
+    """Function or method extracted from source code."""
+
+    name: str
+    docstring: Optional[str]
+    summary: Optional[str]  # first line of the docstring
+    args: tuple[ArgInfo, ...]
+    return_type: Optional[str]
+    decorators: tuple[str, ...]
+    is_async: bool
+
+
+@dataclass(frozen=True, slots=True)
+class ClassInfo:
+    """Class extracted from source code."""
+
+    name: str
+    docstring: Optional[str]
+    bases: tuple[str, ...]
+    methods: tuple[FunctionInfo, ...]
+    decorators: tuple[str, ...]
+
+
+@dataclass(frozen=True, slots=True)
+class ModuleInfo:
+    """Module-level information extracted from source code."""
+
+    docstring: Optional[str]
+    classes: tuple[ClassInfo, ...]
+    functions: tuple[FunctionInfo, ...]
+    imports: tuple[str, ...]
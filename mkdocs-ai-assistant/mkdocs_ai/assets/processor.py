@@ -1,11 +1,13 @@
 """Asset processing orchestrator."""
 
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Awaitable, Callable, Dict, List, Optional
 import asyncio
+import os
 
 from ..providers import AIProvider, create_provider
 from ..cache import CacheManager
+from ..ratelimit import set_rate_limit
 from .discovery import AssetDiscovery, Asset
 from .compose import ComposeProcessor
 from .code import CodeProcessor
@@ -27,6 +29,8 @@ class AssetProcessor:
         provider: AIProvider,
         cache_manager: Optional[CacheManager] = None,
         output_dir: Optional[Path] = None,
+        concurrency: int = 8,
+        max_per_second: Optional[float] = None,
     ):
         """Initialize processor.
         
@@ -35,14 +39,20 @@ class AssetProcessor:
             provider: AI provider for generation
             cache_manager: Optional cache manager
             output_dir: Optional output directory for generated docs
+            concurrency: Maximum number of files processed at once
+            max_per_second: Optional maximum number of files started per second
         """
         self.project_root = Path(project_root)
         self.provider = provider
         self.cache_manager = cache_manager
+        self.concurrency = concurrency
+        self.max_per_second = max_per_second
         self.output_dir = Path(output_dir) if output_dir else self.project_root / "docs" / "generated"
         
         # Initialize discovery and processors
         self.discovery = AssetDiscovery(project_root)
+        self._discovery_cache: Optional[Dict[str, List[Path]]] = None
+        self._discovery_mtime_ns: Optional[int] = None
         self.compose_processor = ComposeProcessor(provider, cache_manager)
         self.code_processor = CodeProcessor(provider, cache_manager)
     
@@ -61,7 +71,7 @@ class AssetProcessor:
             Dictionary mapping asset types to generated doc paths
         """
         # Discover assets
-        all_assets = self.discovery.discover_all()
+        all_assets = self._get_or_discover()
         
         # Filter by requested types
         if asset_types:
@@ -101,7 +111,7 @@ class AssetProcessor:
         if compose_path:
             files = [compose_path]
         else:
-            files = self.discovery.discover_docker_compose()
+            files = self._get_or_discover()["docker_compose"]
         
         if not files:
             raise ValueError("No Docker Compose files found")
@@ -125,7 +135,7 @@ class AssetProcessor:
         if module_path:
             files = [module_path]
         else:
-            files = self.discovery.discover_python_modules()
+            files = self._get_or_discover()["python_modules"]
         
         if not files:
             raise ValueError("No Python modules found")
@@ -145,23 +155,11 @@ class AssetProcessor:
         Returns:
             List of generated documentation paths
         """
-        results = []
-        
-        for file in files:
-            try:
-                # Generate documentation
-                content = await self.compose_processor.process_compose_file(file)
-                
-                # Save to output directory
-                output_path = self._get_output_path(file, "compose")
-                output_path.parent.mkdir(parents=True, exist_ok=True)
-                output_path.write_text(content, encoding="utf-8")
-                
-                results.append(output_path)
-            except Exception as e:
-                print(f"Error processing {file}: {e}")
-        
-        return results
+        return await self._process_files(
+            self.compose_processor.process_compose_file,
+            files,
+            "compose",
+        )
     
     async def _process_python_modules(
         self,
@@ -175,31 +173,74 @@ class AssetProcessor:
         Returns:
             List of generated documentation paths
         """
-        results = []
-        
         # Filter to only __init__.py files (packages) or main modules
+        package_dirs = {f.parent for f in files if f.name == "__init__.py"}
         main_modules = [
             f for f in files
-            if f.name == "__init__.py" or not any(
-                p.name == "__init__.py" for p in f.parent.glob("__init__.py")
-            )
+            if f.name == "__init__.py" or f.parent not in package_dirs
         ]
         
-        for file in main_modules:
+        return await self._process_files(
+            self.code_processor.process_python_module,
+            main_modules,
+            "code",
+        )
+    
+    async def _process_files(
+        self,
+        process: Callable[[Path], Awaitable[str]],
+        files: List[Path],
+        asset_type: str,
+    ) -> List[Path]:
+        """Generate and save documentation for files with bounded concurrency.
+        
+        Each file is written from a worker thread as soon as its content is
+        ready, so writes overlap with the remaining provider requests. When
+        max_per_second is set, file starts are spaced evenly to stay under
+        the provider's request ceiling.
+        
+        Args:
+            process: Coroutine function generating documentation for a file
+            files: List of file paths
+            asset_type: Type of asset (compose, code, etc.)
+        
+        Returns:
+            List of generated documentation paths
+        """
+        semaphore = asyncio.Semaphore(self.concurrency)
+        loop = asyncio.get_running_loop()
+        interval = 1 / self.max_per_second if self.max_per_second else 0.0
+        next_start = loop.time()
+        
+        # All outputs of a type share one directory; create it once up front
+        await asyncio.to_thread(
+            (self.output_dir / asset_type).mkdir, parents=True, exist_ok=True
+        )
+        
+        async def run(file: Path) -> Optional[Path]:
+            nonlocal next_start
             try:
-                # Generate documentation
-                content = await self.code_processor.process_python_module(file)
-                
-                # Save to output directory
-                output_path = self._get_output_path(file, "code")
-                output_path.parent.mkdir(parents=True, exist_ok=True)
-                output_path.write_text(content, encoding="utf-8")
+                async with semaphore:
+                    if interval:
+                        # Reserve the next start slot before sleeping
+                        now = loop.time()
+                        delay = next_start - now
+                        next_start = max(next_start, now) + interval
+                        if delay > 0:
+                            await asyncio.sleep(delay)
+                    content = await process(file)
                 
-                results.append(output_path)
+                output_path = self._get_output_path(file, asset_type)
+                await asyncio.to_thread(
+                    output_path.write_text, content, encoding="utf-8"
+                )
+                return output_path
             except Exception as e:
                 print(f"Error processing {file}: {e}")
+                return None
         
-        return results
+        output_paths = await asyncio.gather(*(run(file) for file in files))
+        return [path for path in output_paths if path is not None]
     
     def _get_output_path(
         self,
@@ -232,8 +273,24 @@ class AssetProcessor:
         Returns:
             Dictionary mapping asset types to counts
         """
-        all_assets = self.discovery.discover_all()
+        all_assets = self._get_or_discover()
         return {k: len(v) for k, v in all_assets.items()}
+    
+    def _get_or_discover(self) -> Dict[str, List[Path]]:
+        """Get discovered assets, walking the project only when needed.
+        
+        The result is reused until the project root's modification time
+        changes, so long-lived processors pick up added or removed
+        top-level entries.
+        
+        Returns:
+            Dictionary mapping asset types to file paths
+        """
+        mtime_ns = os.stat(self.project_root).st_mtime_ns
+        if self._discovery_cache is None or mtime_ns != self._discovery_mtime_ns:
+            self._discovery_cache = self.discovery.discover_all()
+            self._discovery_mtime_ns = mtime_ns
+        return self._discovery_cache
 
 
 async def process_project_assets(
@@ -242,6 +299,8 @@ async def process_project_assets(
     api_key: Optional[str] = None,
     output_dir: Optional[Path] = None,
     asset_types: Optional[List[str]] = None,
+    rpm: Optional[int] = None,
+    max_concurrency: int = 8,
 ) -> Dict[str, List[Path]]:
     """Convenience function to process project assets.
     
@@ -251,12 +310,17 @@ async def process_project_assets(
         api_key: Optional API key
         output_dir: Optional output directory
         asset_types: Optional list of asset types to process
+        rpm: Optional provider requests per minute for the provider's host
+            (defaults to the ``--rpm`` override or the provider's ceiling)
+        max_concurrency: Maximum number of files processed at once
     
     Returns:
         Dictionary mapping asset types to generated doc paths
     """
     # Create provider
     provider = create_provider(provider_name, api_key=api_key)
+    if rpm:
+        set_rate_limit(provider.base_url, provider_name, rpm=rpm)
     
     # Create cache manager
     cache_dir = project_root / ".ai-cache"
@@ -268,6 +332,7 @@ async def process_project_assets(
         provider=provider,
         cache_manager=cache_manager,
         output_dir=output_dir,
+        concurrency=max_concurrency,
     )
     
     # Process assets
@@ -1,5 +1,13 @@
 """Caching system for AI responses."""
 
-from .manager import CacheManager
+from .manager import CacheManager, cached_by_hash, content_hash
+from .coalesce import RequestCoalescer
+from .semantic import SemanticCache
 
-__all__ = ["CacheManager"]
+__all__ = [
+    "CacheManager",
+    "RequestCoalescer",
+    "SemanticCache",
+    "cached_by_hash",
+    "content_hash",
+]
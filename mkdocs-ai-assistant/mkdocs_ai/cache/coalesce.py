@@ -0,0 +1,265 @@
+"""In-flight request coalescing for AI providers."""
+
+import asyncio
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+from ..providers.base import AIProvider
+from .manager import CacheManager, content_hash
+
+
+class _StreamBuffer:
+    """Chunks of a stream in flight, shared by every caller reading it."""
+    
+    def __init__(self):
+        """Initialize buffer."""
+        self.chunks: List[str] = []
+        self.done = False
+        self.changed = asyncio.Condition()
+    
+    async def publish(self, chunk: Optional[str] = None) -> None:
+        """Append a chunk, or mark the stream finished, and wake readers.
+        
+        Args:
+            chunk: Next chunk, or None once the stream has ended
+        """
+        if chunk is None:
+            self.done = True
+        else:
+            self.chunks.append(chunk)
+        async with self.changed:
+            self.changed.notify_all()
+    
+    async def read(self) -> AsyncIterator[str]:
+        """Yield every chunk from the start, waiting for new ones.
+        
+        Yields:
+            Chunks of generated content
+        """
+        sent = 0
+        while True:
+            while sent < len(self.chunks):
+                yield self.chunks[sent]
+                sent += 1
+            if self.done:
+                return
+            async with self.changed:
+                await self.changed.wait_for(lambda: self.done or sent < len(self.chunks))
+
+
+class RequestCoalescer:
+    """Share provider responses between identical prompts.
+    
+    Concurrent requests for the same prompt wait on a single provider call,
+    completed responses are persisted through the cache manager, and the
+    number of simultaneous provider calls is bounded.
+    """
+    
+    def __init__(
+        self,
+        provider: AIProvider,
+        cache_manager: Optional[CacheManager] = None,
+        max_concurrency: int = 4,
+    ):
+        """Initialize coalescer.
+        
+        Args:
+            provider: AI provider for generation
+            cache_manager: Optional cache manager for completed responses
+            max_concurrency: Maximum number of concurrent provider requests
+        """
+        self.provider = provider
+        self.cache_manager = cache_manager
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._inflight: dict[str, asyncio.Task] = {}
+        self._streams: dict[str, _StreamBuffer] = {}
+    
+    async def generate(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        **kwargs: Any,
+    ) -> str:
+        """Generate content, reusing cached or in-flight responses.
+        
+        Args:
+            prompt: User prompt
+            system_prompt: Optional system prompt
+            **kwargs: Generation parameters (e.g. temperature), passed to the
+                provider and part of the cache key
+            
+        Returns:
+            Generated content
+        """
+        cached = await self.lookup(prompt, system_prompt, **kwargs)
+        if cached:
+            return cached
+        
+        key = self._key(prompt, system_prompt, kwargs)
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._generate(prompt, system_prompt, kwargs))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        
+        # Shield so one cancelled waiter doesn't cancel the shared request
+        return await asyncio.shield(task)
+    
+    async def lookup(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        **kwargs: Any,
+    ) -> Optional[str]:
+        """Get a cached response without calling the provider.
+        
+        Args:
+            prompt: User prompt
+            system_prompt: Optional system prompt
+            **kwargs: Generation parameters, part of the cache key
+            
+        Returns:
+            Cached content, or None if not cached
+        """
+        if not self.cache_manager:
+            return None
+        
+        return await self.cache_manager.aget(
+            prompt,
+            system_prompt=system_prompt,
+            model=self.provider.model,
+            **kwargs,
+        )
+    
+    async def stream(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[str]:
+        """Stream content as the provider produces it.
+        
+        Cached responses are yielded as a single chunk. Identical streams
+        share one provider request: later callers replay the chunks received
+        so far, then follow along, and an identical non-streaming request in
+        flight is yielded as a single chunk once complete.
+        
+        The provider request runs in its own task, which holds the
+        concurrency slot only until the provider finishes, however slowly
+        callers consume the chunks. Callers that stop iterating early don't
+        cancel it, so the completed response is still cached.
+        
+        Args:
+            prompt: User prompt
+            system_prompt: Optional system prompt
+            **kwargs: Generation parameters, passed to the provider and part
+                of the cache key
+            
+        Yields:
+            Chunks of generated content
+        """
+        cached = await self.lookup(prompt, system_prompt, **kwargs)
+        if cached:
+            yield cached
+            return
+        
+        key = self._key(prompt, system_prompt, kwargs)
+        task = self._inflight.get(key)
+        if task is None:
+            buffer = self._streams[key] = _StreamBuffer()
+            task = asyncio.ensure_future(self._stream(prompt, system_prompt, kwargs, buffer))
+            self._inflight[key] = task
+            
+            def forget(_: asyncio.Task) -> None:
+                self._inflight.pop(key, None)
+                self._streams.pop(key, None)
+            
+            task.add_done_callback(forget)
+        
+        buffer = self._streams.get(key)
+        if buffer is None:
+            yield await asyncio.shield(task)
+            return
+        
+        async for chunk in buffer.read():
+            yield chunk
+        # Surface the provider's error, if any
+        await asyncio.shield(task)
+    
+    def _key(self, prompt: str, system_prompt: Optional[str], kwargs: Dict[str, Any]) -> str:
+        """Key identifying identical requests in flight."""
+        return content_hash(prompt, system_prompt, self.provider.model, sorted(kwargs.items()))
+    
+    async def _generate(
+        self,
+        prompt: str,
+        system_prompt: Optional[str],
+        kwargs: Dict[str, Any],
+    ) -> str:
+        """Call the provider and cache the response.
+        
+        Args:
+            prompt: User prompt
+            system_prompt: Optional system prompt
+            kwargs: Generation parameters
+            
+        Returns:
+            Generated content
+        """
+        async with self._semaphore:
+            response = await self.provider.generate(
+                prompt=prompt,
+                system_prompt=system_prompt,
+                **kwargs,
+            )
+        
+        if self.cache_manager:
+            await self.cache_manager.aset(
+                prompt,
+                response.content,
+                system_prompt=system_prompt,
+                model=self.provider.model,
+                **kwargs,
+            )
+        
+        return response.content
+    
+    async def _stream(
+        self,
+        prompt: str,
+        system_prompt: Optional[str],
+        kwargs: Dict[str, Any],
+        buffer: _StreamBuffer,
+    ) -> str:
+        """Stream from the provider into a buffer and cache the response.
+        
+        Args:
+            prompt: User prompt
+            system_prompt: Optional system prompt
+            kwargs: Generation parameters
+            buffer: Buffer read by the streaming callers
+            
+        Returns:
+            Generated content
+        """
+        try:
+            async with self._semaphore:
+                async for chunk in self.provider.generate_stream(
+                    prompt=prompt,
+                    system_prompt=system_prompt,
+                    **kwargs,
+                ):
+                    await buffer.publish(chunk)
+        finally:
+            await buffer.publish(None)
+        
+        content = "".join(buffer.chunks)
+        if self.cache_manager:
+            await self.cache_manager.aset(
+                prompt,
+                content,
+                system_prompt=system_prompt,
+                model=self.provider.model,
+                **kwargs,
+            )
+        
+        return content
@@ -1,11 +1,25 @@
 """Cache manager for AI responses."""
 
+import asyncio
+import functools
 import hashlib
+import inspect
 import json
+import time
 from pathlib import Path
-from typing import Optional, Any
+from typing import Optional, Any, Callable, Iterable
 from diskcache import Cache
 
+# BLAKE3 (``fast`` extra) hashes long prompts and sources several times
+# faster than SHA-256
+try:
+    from blake3 import blake3
+except ImportError:  # pragma: no cover - optional dependency
+    blake3 = None
+
+# Prefix of every cache key; bump to invalidate entries from older key schemes
+CACHE_KEY_VERSION = "v2"
+
 
 class CacheManager:
     """Manages caching of AI responses to reduce costs and improve performance.
@@ -31,6 +45,10 @@ class CacheManager:
             size_limit=max_size,
             eviction_policy="least-recently-used",
         )
+        
+        # Memoized get_stats() result and when it was computed
+        self._stats: Optional[dict[str, Any]] = None
+        self._stats_time = 0.0
 
     def _generate_key(self, prompt: str, **kwargs: Any) -> str:
         """Generate cache key from prompt and parameters.
@@ -56,7 +74,7 @@ class CacheManager:
         
         # Create hash
         key_str = json.dumps(key_data, sort_keys=True)
-        return hashlib.sha256(key_str.encode()).hexdigest()
+        return f"{CACHE_KEY_VERSION}:{_hash(key_str.encode())}"
 
     def get(self, prompt: str, **kwargs: Any) -> Optional[str]:
         """Get cached response if available.
@@ -82,22 +100,58 @@ class CacheManager:
         key = self._generate_key(prompt, **kwargs)
         self.cache.set(key, response, expire=self.ttl)
 
+    async def aget(self, prompt: str, **kwargs: Any) -> Optional[str]:
+        """Get cached response without blocking the event loop.
+        
+        Args:
+            prompt: The prompt text
+            **kwargs: Additional parameters
+            
+        Returns:
+            Cached response or None if not found
+        """
+        return await asyncio.to_thread(self.get, prompt, **kwargs)
+
+    async def aset(self, prompt: str, response: str, **kwargs: Any) -> None:
+        """Cache a response without blocking the event loop.
+        
+        Args:
+            prompt: The prompt text
+            response: The AI response to cache
+            **kwargs: Additional parameters
+        """
+        await asyncio.to_thread(self.set, prompt, response, **kwargs)
+
     def clear(self) -> None:
         """Clear all cached responses."""
         self.cache.clear()
+        self._stats = None
 
-    def get_stats(self) -> dict[str, Any]:
+    def get_stats(self, cached_for: float = 1.0) -> dict[str, Any]:
         """Get cache statistics.
         
+        Counting entries and size queries the cache database, so the result
+        is reused for ``cached_for`` seconds.
+        
+        Args:
+            cached_for: Seconds to reuse previously computed statistics
+            
         Returns:
             Dictionary with cache statistics
         """
-        return {
-            "size": self.cache.volume(),
-            "count": len(self.cache),
-            "hits": self.cache.stats(enable=True)[0],
-            "misses": self.cache.stats(enable=True)[1],
-        }
+        now = time.monotonic()
+        if self._stats is None or now - self._stats_time >= cached_for:
+            hits, misses = self.cache.stats(enable=True)
+            self._stats = {
+                "size": self.cache.volume(),
+                "count": len(self.cache),
+                "hits": hits,
+                "misses": misses,
+                "hit_rate": hits / max(hits + misses, 1),
+            }
+            self._stats_time = now
+        
+        return dict(self._stats)
 
     def close(self) -> None:
         """Close the cache."""
@@ -110,3 +164,91 @@ class CacheManager:
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Context manager exit."""
         self.close()
+
+
+def _hasher() -> Any:
+    """Create a hash object, using BLAKE3 when installed and SHA-256 otherwise."""
+    return blake3() if blake3 is not None else hashlib.sha256()
+
+
+def _hash(data: bytes) -> str:
+    """Hash bytes into a hex digest.
+    
+    Args:
+        data: Bytes to hash
+        
+    Returns:
+        Hex digest
+    """
+    digest = _hasher()
+    digest.update(data)
+    return digest.hexdigest()
+
+
+def content_hash(*parts: Any) -> str:
+    """Hash content and configuration into a stable cache key.
+    
+    Args:
+        *parts: Bytes or values (converted with ``str``) to hash
+        
+    Returns:
+        Hex digest of the combined parts (32 characters)
+    """
+    digest = _hasher()
+    for part in parts:
+        digest.update(part if isinstance(part, bytes) else str(part).encode())
+        digest.update(b"\0")
+    return digest.hexdigest()[:32]
+
+
+def cached_by_hash(namespace: str, templates: Iterable[str] = ()) -> Callable:
+    """Cache a document-producing method by the hash of its source file.
+    
+    The decorated coroutine method must take the source file path as its
+    first argument and return the rendered markdown. The key covers the file
+    contents, the prompt templates, the provider model and all remaining
+    arguments, so unchanged files skip parsing and generation entirely while
+    editing a prompt invalidates the documents built from it. The instance
+    is expected to expose ``provider`` and ``cache_manager`` attributes.
+    
+    Args:
+        namespace: Key prefix separating processors
+        templates: Prompt templates and system prompts the output depends on
+        
+    Returns:
+        Method decorator
+    """
+    template_version = content_hash(*templates)
+    
+    def decorator(method: Callable) -> Callable:
+        signature = inspect.signature(method)
+        # Skip ``self`` and the source path; everything else keys the entry
+        option_names = list(signature.parameters)[2:]
+        
+        @functools.wraps(method)
+        async def wrapper(self, path: Path, *args: Any, **kwargs: Any) -> str:
+            if not self.cache_manager:
+                return await method(self, path, *args, **kwargs)
+            
+            bound = signature.bind(self, path, *args, **kwargs)
+            bound.apply_defaults()
+            options = [(name, bound.arguments[name]) for name in option_names]
+            source = await asyncio.to_thread(Path(path).read_bytes)
+            key = f"{namespace}:" + content_hash(
+                template_version,
+                source,
+                self.provider.model,
+                options,
+            )
+            
+            cached = await self.cache_manager.aget(key)
+            if cached:
+                return cached
+            
+            result = await method(self, path, *args, **kwargs)
+            await self.cache_manager.aset(key, result)
+            return result
+        
+        return wrapper
+    
+    return decorator
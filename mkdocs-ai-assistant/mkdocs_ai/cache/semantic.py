@@ -0,0 +1,154 @@
+"""Similarity cache for near-duplicate texts."""
+
+import math
+import re
+from collections import OrderedDict
+from typing import Awaitable, Callable, Dict, FrozenSet, List, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+from .manager import content_hash
+
+# Tokens that must match exactly for two texts to share a result: inline
+# code, URLs and numbers (versions, ports, counts)
+_ENTITY = re.compile(r'`[^`\n]+`|https?://\S+|\d+(?:\.\d+)*')
+
+
+class SemanticCache:
+    """Reuse results computed for near-identical texts.
+
+    Texts are embedded once and compared by cosine similarity against the
+    texts already seen for the same kind of request, so repeated
+    boilerplate with small wording differences reuses an earlier result.
+    Results are never shared between kinds, and by default a hit also
+    requires the same code spans, URLs and numbers in both texts.
+
+    The index is in memory and scanned exactly; it is meant as a small
+    per-run layer in front of the exact-match cache.
+    """
+
+    def __init__(
+        self,
+        embed: Callable[[str], Awaitable[List[float]]],
+        threshold: float = 0.97,
+        max_entries: int = 2048,
+        match_entities: bool = True,
+    ):
+        """Initialize cache.
+
+        Args:
+            embed: Async function returning an embedding for a text, e.g.
+                ``EmbeddingGenerator(provider, cache_manager).generate_embedding``
+            threshold: Minimum cosine similarity for a hit
+            max_entries: Maximum entries kept per kind (oldest dropped first)
+            match_entities: Whether hits must share code spans, URLs and numbers
+        """
+        self.embed = embed
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.match_entities = match_entities
+        self._entries: Dict[str, List[Tuple[List[float], FrozenSet[str], str]]] = {}
+        self._matrices: Dict[str, object] = {}
+        self._embeddings: "OrderedDict[str, List[float]]" = OrderedDict()
+
+    async def get(self, kind: str, text: str) -> Optional[str]:
+        """Look up the result of a near-identical text.
+
+        Args:
+            kind: Request kind (e.g. the enhancement method name)
+            text: Input text
+
+        Returns:
+            Cached result, or None without a close enough match
+        """
+        entries = self._entries.get(kind)
+        if not entries:
+            return None
+
+        vector = await self._embedding(text)
+        entities = self._entities(text)
+        for index in self._ranked(kind, vector):
+            _, entry_entities, value = entries[index]
+            if entities == entry_entities:
+                return value
+        return None
+
+    async def add(self, kind: str, text: str, value: str) -> None:
+        """Remember the result for a text.
+
+        Args:
+            kind: Request kind
+            text: Input text
+            value: Result to reuse for similar texts
+        """
+        vector = await self._embedding(text)
+        entries = self._entries.setdefault(kind, [])
+        entries.append((vector, self._entities(text), value))
+        if len(entries) > self.max_entries:
+            del entries[0]
+        self._matrices.pop(kind, None)
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        self._entries.clear()
+        self._matrices.clear()
+        self._embeddings.clear()
+
+    def _ranked(self, kind: str, vector: List[float]) -> List[int]:
+        """Indices of entries above the threshold, most similar first.
+
+        Args:
+            kind: Request kind
+            vector: Normalized query embedding
+
+        Returns:
+            Entry indices
+        """
+        entries = self._entries[kind]
+
+        if np is not None:
+            matrix = self._matrices.get(kind)
+            if matrix is None:
+                matrix = self._matrices[kind] = np.array(
+                    [entry[0] for entry in entries], dtype=np.float32
+                )
+            scores = matrix @ np.asarray(vector, dtype=np.float32)
+            hits = np.flatnonzero(scores >= self.threshold)
+            return hits[np.argsort(-scores[hits])].tolist()
+
+        scores = [sum(a * b for a, b in zip(entry[0], vector)) for entry in entries]
+        hits = [i for i, score in enumerate(scores) if score >= self.threshold]
+        return sorted(hits, key=lambda i: -scores[i])
+
+    async def _embedding(self, text: str) -> List[float]:
+        """Get the normalized embedding of a text, reusing recent ones.
+
+        Args:
+            text: Input text
+
+        Returns:
+            Unit-length embedding
+        """
+        key = content_hash(text)
+        vector = self._embeddings.get(key)
+        if vector is not None:
+            self._embeddings.move_to_end(key)
+            return vector
+
+        vector = list(await self.embed(text))
+        norm = math.sqrt(sum(x * x for x in vector)) or 1.0
+        vector = [x / norm for x in vector]
+
+        self._embeddings[key] = vector
+        if len(self._embeddings) > self.max_entries:
+            self._embeddings.popitem(last=False)
+        return vector
+
+    def _entities(self, text: str) -> FrozenSet[str]:
+        """Tokens that must match for a hit."""
+        if not self.match_entities:
+            return frozenset()
+        return frozenset(_ENTITY.findall(text))
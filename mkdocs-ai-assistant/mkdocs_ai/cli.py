@@ -1,28 +1,99 @@
-"""CLI commands for MkDocs AI Assistant."""
+"""CLI commands for MkDocs AI Assistant.
 
-import asyncio
+Only click and the console are imported up front; everything else is
+imported by the command that needs it, so ``--help`` and light commands
+don't pay for providers, caches, asyncio or Markdown rendering.
+"""
+
+import functools
+import re
 import sys
 from pathlib import Path
 from typing import Optional
 
 import click
 from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn
-from rich.panel import Panel
-from rich.markdown import Markdown
-
-from .generation.prompt import PromptGenerator
-from .providers import get_provider, ProviderError
-from .cache import CacheManager
 
 console = Console()
 
+# Characters removed from generated filenames, and separator runs to collapse
+_FILENAME_UNSAFE = re.compile(r"[^\w -]+")
+_FILENAME_SEPARATORS = re.compile(r"[ -]+")
+
+# Markdown files at least this large are decoded from a memory map
+_MMAP_THRESHOLD = 256 * 1024
+
+
+def _run(coro):
+    """Run a coroutine with one HTTP session shared by all provider calls.
+    
+    Uses uvloop's event loop when it is installed (``fast`` extra).
+    
+    Args:
+        coro: Coroutine to run
+        
+    Returns:
+        Result of the coroutine
+    """
+    import asyncio
+    
+    from .providers import shared_session
+    
+    try:
+        import uvloop
+    except ImportError:
+        uvloop = None
+    
+    async def main_ctx():
+        async with shared_session():
+            return await coro
+    
+    if uvloop is not None and sys.platform != "win32":
+        return uvloop.run(main_ctx())
+    return asyncio.run(main_ctx())
+
+
+@functools.lru_cache(maxsize=None)
+def _progress_columns() -> tuple:
+    """Build the spinner and description columns once per process.
+    
+    Returns:
+        Progress columns shared by every command
+    """
+    from rich.progress import SpinnerColumn, TextColumn
+    
+    return SpinnerColumn(), TextColumn("[progress.description]{task.description}")
+
+
+def _progress():
+    """Create a transient spinner progress display.
+    
+    Returns:
+        Progress context manager
+    """
+    from rich.progress import Progress
+    
+    return Progress(*_progress_columns(), console=console, transient=True)
+
 
 @click.group()
 @click.version_option(package_name="mkdocs-ai-assistant")
-def main():
+@click.option(
+    "--rpm",
+    type=click.IntRange(min=1),
+    help="Provider requests per minute (default: provider's ceiling)",
+)
+@click.option(
+    "--tpm",
+    type=click.IntRange(min=1),
+    help="Provider tokens per minute (default: provider's ceiling)",
+)
+def main(rpm: Optional[int], tpm: Optional[int]):
     """MkDocs AI Assistant - AI-powered documentation generation."""
-    pass
+    if rpm or tpm:
+        from .ratelimit import configure_defaults
+        
+        configure_defaults(rpm=rpm, tpm=tpm)
 
 
 @main.command()
@@ -103,7 +174,7 @@ def generate(
         # With context variables
         mkdocs ai generate "Service docs" -t templates/service.md.j2 -c name=auth -c version=2.0
     """
-    asyncio.run(_generate_async(
+    _run(_generate_async(
         prompt=prompt,
         output=output,
         provider=provider,
@@ -128,6 +199,12 @@ async def _generate_async(
     verbose: bool,
 ):
     """Async implementation of generate command."""
+    from rich.markdown import Markdown
+    from rich.panel import Panel
+    
+    from .generation.prompt import PromptGenerator
+    from .providers import get_provider, ProviderError
+    from .cache import CacheManager
     
     # Show header
     console.print(Panel.fit(
@@ -197,11 +274,7 @@ async def _generate_async(
     
     # Generate content
     try:
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console,
-        ) as progress:
+        with _progress() as progress:
             task = progress.add_task("Generating content...", total=None)
             
             if template:
@@ -210,14 +283,22 @@ async def _generate_async(
                     context=context_dict,
                     prompt=prompt,
                 )
+                
+                # Write to file
+                output_path.write_text(content, encoding="utf-8")
+                length = len(content)
             else:
-                content = await generator.generate_from_prompt(prompt)
+                # Stream to a partial file so only the preview stays in memory
+                content, length = await _stream_to_file(
+                    generator.stream_from_prompt(prompt),
+                    output_path,
+                    lambda total: progress.update(
+                        task, description=f"Generating content... {total} chars"
+                    ),
+                )
             
             progress.update(task, completed=True)
         
-        # Write to file
-        output_path.write_text(content, encoding="utf-8")
-        
         # Show success
         console.print()
         console.print(f"[green]✓[/green] Generated: [bold]{output_path}[/bold]")
@@ -226,14 +307,14 @@ async def _generate_async(
         if verbose:
             console.print()
             console.print(Panel(
-                Markdown(content[:500] + ("..." if len(content) > 500 else "")),
+                Markdown(content[:500] + ("..." if length > 500 else "")),
                 title="Preview",
                 border_style="green",
             ))
         
         # Show stats
         console.print()
-        console.print(f"[dim]Length: {len(content)} characters[/dim]")
+        console.print(f"[dim]Length: {length} characters[/dim]")
         if cache_manager:
             stats = cache_manager.get_stats()
             console.print(f"[dim]Cache: {stats['hits']} hits, {stats['misses']} misses[/dim]")
@@ -254,20 +335,91 @@ async def _generate_async(
             cache_manager.close()
 
 
+def _write_file(output_path: Path, content: str) -> None:
+    """Write a document through a ``.part`` file replacing the output.
+    
+    Like _stream_to_file, an interrupted write never leaves a truncated
+    document behind.
+    
+    Args:
+        output_path: Output file path
+        content: Document content
+    """
+    part_path = output_path.with_name(output_path.name + ".part")
+    try:
+        part_path.write_text(content, encoding="utf-8")
+        part_path.replace(output_path)
+    except BaseException:
+        part_path.unlink(missing_ok=True)
+        raise
+
+
+async def _stream_to_file(chunks, output_path: Path, on_progress) -> tuple[str, int]:
+    """Write streamed chunks to a file as they arrive.
+    
+    Chunks go to a ``.part`` file that replaces the output once the stream
+    completes, so a failed generation never leaves a truncated document.
+    
+    Args:
+        chunks: Async iterator of content chunks
+        output_path: Output file path
+        on_progress: Callback receiving the number of characters written
+        
+    Returns:
+        Tuple of (first 500+ characters for previews, total length)
+    """
+    part_path = output_path.with_name(output_path.name + ".part")
+    head = ""
+    length = 0
+    
+    try:
+        with open(part_path, "w", encoding="utf-8") as f:
+            async for chunk in chunks:
+                f.write(chunk)
+                length += len(chunk)
+                if len(head) <= 500:
+                    head += chunk
+                on_progress(length)
+        part_path.replace(output_path)
+    except BaseException:
+        part_path.unlink(missing_ok=True)
+        raise
+    
+    return head, length
+
+
+def _read_markdown(path: Path) -> str:
+    """Read a markdown file as text with universal newlines.
+    
+    Large files are decoded straight from a memory map instead of being
+    read into an intermediate bytes copy first.
+    
+    Args:
+        path: Markdown file
+        
+    Returns:
+        File content
+    """
+    if path.stat().st_size < _MMAP_THRESHOLD:
+        return path.read_text(encoding="utf-8")
+    
+    import mmap
+    
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+        content = str(m, "utf-8")
+    
+    if "\r" in content:
+        content = content.replace("\r\n", "\n").replace("\r", "\n")
+    return content
+
+
+@functools.lru_cache(maxsize=4096)
 def _sanitize_filename(text: str) -> str:
     """Convert text to safe filename."""
-    # Remove special characters
-    safe = "".join(c if c.isalnum() or c in " -_" else "" for c in text)
-    # Replace spaces with hyphens
-    safe = safe.replace(" ", "-")
-    # Remove multiple hyphens
-    while "--" in safe:
-        safe = safe.replace("--", "-")
-    # Lowercase
-    safe = safe.lower()
-    # Remove leading/trailing hyphens
-    safe = safe.strip("-")
-    return safe or "generated"
+    # Drop special characters, then turn space/hyphen runs into one hyphen
+    safe = _FILENAME_UNSAFE.sub("", text)
+    safe = _FILENAME_SEPARATORS.sub("-", safe)
+    return safe.lower().strip("-") or "generated"
 
 
 @main.command()
@@ -308,9 +460,16 @@ def batch(config: str, verbose: bool):
 @main.command()
 def cache_stats():
     """Show cache statistics."""
+    from rich.panel import Panel
+    
+    from .cache import CacheManager
+    
     try:
-        cache_manager = CacheManager(cache_dir=".ai-cache")
-        stats = cache_manager.get_stats()
+        stats = _from_daemon("cache_stats", cache_dir=str(Path(".ai-cache").resolve()))
+        if stats is None:
+            cache_manager = CacheManager(cache_dir=".ai-cache")
+            stats = cache_manager.get_stats()
+            cache_manager.close()
         
         console.print(Panel.fit(
             f"[bold]Cache Statistics[/bold]\n\n"
@@ -318,20 +477,81 @@ def cache_stats():
             f"Size: {stats['size'] / 1024 / 1024:.2f} MB\n"
             f"Hits: {stats['hits']}\n"
             f"Misses: {stats['misses']}\n"
-            f"Hit Rate: {stats['hits'] / max(stats['hits'] + stats['misses'], 1) * 100:.1f}%",
+            f"Hit Rate: {stats['hit_rate'] * 100:.1f}%",
             border_style="cyan",
         ))
-        
-        cache_manager.close()
     except Exception as e:
         console.print(f"[red]Error:[/red] {e}")
         sys.exit(1)
 
 
+@main.command()
+@click.option(
+    "--socket",
+    "socket_path",
+    type=click.Path(),
+    help="UNIX socket path (default: ~/.cache/mkdocs-ai/sock)",
+)
+@click.option(
+    "--stop",
+    is_flag=True,
+    help="Stop the running daemon",
+)
+def daemon(socket_path: Optional[str], stop: bool):
+    """Run a background daemon that serves CLI commands.
+    
+    While the daemon is running, cache-stats, discover-assets and enhance
+    are answered by it, reusing its open cache, providers and HTTP session
+    instead of setting them up on every invocation.
+    
+    Examples:
+        # Start the daemon (stop with Ctrl+C, SIGTERM or --stop)
+        mkdocs-ai daemon
+        
+        # Stop a running daemon
+        mkdocs-ai daemon --stop
+    """
+    from .daemon import SOCKET_PATH, Daemon, DaemonUnavailable, request
+    
+    path = Path(socket_path) if socket_path else SOCKET_PATH
+    
+    if stop:
+        try:
+            request("shutdown", socket_path=path)
+            console.print("[green]✓[/green] Daemon stopped")
+        except DaemonUnavailable:
+            console.print("[yellow]No daemon running[/yellow]")
+        return
+    
+    console.print(f"Daemon listening on {path}")
+    _run(Daemon(path).serve())
+
+
+def _from_daemon(cmd: str, timeout: Optional[float] = None, **args):
+    """Run a command on the daemon if one is running.
+    
+    Args:
+        cmd: Daemon command name
+        timeout: Seconds to wait for the daemon (defaults to its request timeout)
+        **args: Command arguments
+        
+    Returns:
+        Command result, or None when no daemon answers
+    """
+    from .daemon import REQUEST_TIMEOUT, DaemonUnavailable, request
+    
+    try:
+        return request(cmd, timeout=timeout or REQUEST_TIMEOUT, **args)
+    except (DaemonUnavailable, OSError):
+        return None
+
+
 @main.command()
 @click.confirmation_option(prompt="Are you sure you want to clear the cache?")
 def cache_clear():
     """Clear the cache."""
+    from .cache import CacheManager
+    
     try:
         cache_manager = CacheManager(cache_dir=".ai-cache")
         cache_manager.clear()
@@ -374,6 +594,12 @@ def cache_clear():
     type=click.Choice(["docker_compose", "python_modules", "openapi_specs", "config_files"]),
     help="Asset types to process (can specify multiple)",
 )
+@click.option(
+    "--max-concurrency",
+    type=click.IntRange(min=1),
+    default=8,
+    help="Maximum number of files processed at once",
+)
 @click.option(
     "--verbose",
     "-v",
@@ -386,6 +612,7 @@ def process_assets(
     provider: str,
     api_key: Optional[str],
     types: tuple,
+    max_concurrency: int,
     verbose: bool,
 ):
     """Discover and process project assets into documentation.
@@ -408,29 +635,29 @@ def process_assets(
         
         # Custom output directory
         mkdocs-ai process-assets -o docs/api
+        
+        # Stay under a provider rate limit
+        mkdocs-ai --rpm 30 process-assets --max-concurrency 4
     """
-    from .assets import AssetProcessor, process_project_assets
+    from .assets import process_project_assets
     
     try:
         project_path = Path(project_root)
         output_path = Path(output_dir) if output_dir else None
         asset_types = list(types) if types else None
         
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console,
-        ) as progress:
+        with _progress() as progress:
             task = progress.add_task("Discovering assets...", total=None)
             
             # Run async processing
-            results = asyncio.run(
+            results = _run(
                 process_project_assets(
                     project_root=project_path,
                     provider_name=provider,
                     api_key=api_key,
                     output_dir=output_path,
                     asset_types=asset_types,
+                    max_concurrency=max_concurrency,
                 )
             )
             
@@ -477,13 +704,17 @@ def discover_assets(project_root: str):
         project_path = Path(project_root)
         discovery = AssetDiscovery(project_path)
         
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console,
-        ) as progress:
+        with _progress() as progress:
             task = progress.add_task("Discovering assets...", total=None)
-            assets = discovery.discover_all()
+            assets = _from_daemon("discover_assets", project_root=str(project_path.resolve()))
+            if assets is None:
+                assets = discovery.discover_all()
+            else:
+                root = project_path.resolve()
+                assets = {
+                    asset_type: [project_path / Path(p).relative_to(root) for p in paths]
+                    for asset_type, paths in assets.items()
+                }
             progress.update(task, description="Discovery complete!")
         
         # Display results
@@ -530,6 +761,18 @@ def discover_assets(project_root: str):
     default="moderate",
     help="Enhancement level",
 )
+@click.option(
+    "--chunk-size",
+    type=click.IntRange(min=1),
+    default=2000,
+    help="Target characters per provider call; sections are split at headings",
+)
+@click.option(
+    "--concurrency",
+    type=click.IntRange(min=1),
+    default=4,
+    help="Maximum number of chunks enhanced concurrently",
+)
 @click.option(
     "--preview",
     is_flag=True,
@@ -547,6 +790,8 @@ def enhance(
     provider: str,
     api_key: Optional[str],
     level: str,
+    chunk_size: int,
+    concurrency: int,
     preview: bool,
     verbose: bool,
 ):
@@ -573,6 +818,9 @@ def enhance(
         # Light enhancement only
         mkdocs-ai enhance docs/guide.md --level light
         
+        # Smaller chunks, more of them in flight
+        mkdocs-ai enhance docs/guide.md --chunk-size 1000 --concurrency 8
+        
         # Save to different file
         mkdocs-ai enhance docs/guide.md -o docs/guide-enhanced.md
     """
@@ -584,6 +832,28 @@ def enhance(
         file_path_obj = Path(file_path)
         output_path = Path(output) if output else None
         
+        # A running daemon already holds the provider and cache open; it
+        # has its own rate limiters, so --rpm/--tpm are only honored locally
+        limits = click.get_current_context().find_root().params
+        if not preview and not verbose and not (limits.get("rpm") or limits.get("tpm")):
+            enhanced = _from_daemon(
+                "enhance",
+                # Enhancing runs many provider requests
+                timeout=600,
+                content=_read_markdown(file_path_obj),
+                cache_dir=str(Path(".ai-cache").resolve()),
+                provider=provider,
+                api_key=api_key,
+                level=level,
+                chunk_size=chunk_size,
+                concurrency=concurrency,
+            )
+            if enhanced is not None:
+                output_file = output_path or file_path_obj
+                _write_file(output_file, enhanced)
+                console.print(f"\n[green]✓[/green] Enhanced: {output_file}")
+                return
+        
         # Create provider
         provider_instance = create_provider(provider, api_key=api_key)
         
@@ -595,52 +865,11 @@ def enhance(
             provider=provider_instance,
             cache_manager=cache_manager,
             enhancement_level=level,
+            chunk_size=chunk_size,
+            max_concurrency=concurrency,
         )
         
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console,
-        ) as progress:
-            task = progress.add_task(f"Enhancing {file_path_obj.name}...", total=None)
-            
-            # Read content
-            content = file_path_obj.read_text(encoding="utf-8")
-            
-            if preview:
-                # Get preview
-                preview_result = asyncio.run(
-                    processor.get_enhancement_preview(content, max_length=500)
-                )
-                
-                progress.update(task, description="Preview ready!")
-                
-                console.print("\n[bold]Preview (first 500 chars)[/bold]\n")
-                console.print("[yellow]Original:[/yellow]")
-                console.print(preview_result["original"])
-                console.print("\n[green]Enhanced:[/green]")
-                console.print(preview_result["enhanced"])
-                
-            else:
-                # Enhance content
-                enhanced = asyncio.run(processor.enhance_content(content))
-                
-                # Save result
-                output_file = output_path or file_path_obj
-                output_file.write_text(enhanced, encoding="utf-8")
-                
-                progress.update(task, description="Enhancement complete!")
-                
-                console.print(f"\n[green]✓[/green] Enhanced: {output_file}")
-                
-                if verbose:
-                    # Show quality metrics
-                    metrics = asyncio.run(processor.check_quality(enhanced))
-                    console.print("\n[bold]Quality Metrics:[/bold]")
-                    console.print(f"Grammar: {metrics.get('grammar_score', 0)}/100")
-                    console.print(f"Clarity: {metrics.get('clarity_score', 0)}/100")
-                    console.print(f"Consistency: {metrics.get('consistency_score', 0)}/100")
-                    console.print(f"Readability: {metrics.get('readability_score', 0)}/100")
+        _run(_enhance_async(processor, file_path_obj, output_path, preview, verbose))
         
         cache_manager.close()
         
@@ -652,8 +881,72 @@ def enhance(
         sys.exit(1)
 
 
+async def _enhance_async(
+    processor,
+    file_path: Path,
+    output_path: Optional[Path],
+    preview: bool,
+    verbose: bool,
+):
+    """Preview or enhance a file within a single event loop.
+    
+    With ``verbose``, the enhanced file is written while its quality
+    metrics are being fetched.
+    
+    Args:
+        processor: Enhancement processor
+        file_path: Markdown file to enhance
+        output_path: Optional output path (defaults to overwriting input)
+        preview: Only preview the first 500 characters
+        verbose: Show quality metrics of the enhanced content
+    """
+    import asyncio
+    
+    with _progress() as progress:
+        task = progress.add_task(f"Enhancing {file_path.name}...", total=None)
+        
+        # Read content
+        content = await asyncio.to_thread(_read_markdown, file_path)
+        
+        if preview:
+            # Get preview
+            preview_result = await processor.get_enhancement_preview(content, max_length=500)
+            
+            progress.update(task, description="Preview ready!")
+            
+            console.print("\n[bold]Preview (first 500 chars)[/bold]\n")
+            console.print("[yellow]Original:[/yellow]")
+            console.print(preview_result["original"])
+            console.print("\n[green]Enhanced:[/green]")
+            console.print(preview_result["enhanced"])
+            return
+        
+        # Enhance content
+        enhanced = await processor.enhance_content(content)
+        
+        # Save result, fetching quality metrics in the meantime
+        output_file = output_path or file_path
+        save = asyncio.to_thread(_write_file, output_file, enhanced)
+        if verbose:
+            _, metrics = await asyncio.gather(save, processor.check_quality(enhanced))
+        else:
+            await save
+        
+        progress.update(task, description="Enhancement complete!")
+    
+    console.print(f"\n[green]✓[/green] Enhanced: {output_file}")
+    
+    if verbose:
+        # Show quality metrics
+        console.print("\n[bold]Quality Metrics:[/bold]")
+        console.print(f"Grammar: {metrics.get('grammar_score', 0)}/100")
+        console.print(f"Clarity: {metrics.get('clarity_score', 0)}/100")
+        console.print(f"Consistency: {metrics.get('consistency_score', 0)}/100")
+        console.print(f"Readability: {metrics.get('readability_score', 0)}/100")
+
+
 @main.command()
-@click.argument("file_path", type=click.Path(exists=True))
+@click.argument("file_paths", nargs=-1, required=True, type=click.Path(exists=True))
 @click.option(
     "--provider",
     "-p",
@@ -666,28 +959,51 @@ def enhance(
     envvar="OPENROUTER_API_KEY",
     help="API key for provider",
 )
+@click.option(
+    "--concurrency",
+    type=click.IntRange(min=1),
+    default=8,
+    help="Maximum number of files checked concurrently",
+)
 def check_quality(
-    file_path: str,
+    file_paths: tuple,
     provider: str,
     api_key: Optional[str],
+    concurrency: int,
 ):
     """Check documentation quality and get improvement suggestions.
     
+    Accepts one or more markdown files or directories; directories are
+    searched recursively for markdown files.
+    
     Analyzes:
     - Grammar quality
     - Clarity and readability
     - Terminology consistency
     - Overall quality score
     
-    Example:
+    Examples:
         mkdocs-ai check-quality docs/guide.md
+        
+        # Check a whole docs tree
+        mkdocs-ai check-quality docs/ --concurrency 4
     """
     from .enhancement import EnhancementProcessor
     from .providers import create_provider
     from .cache import CacheManager
     
     try:
-        file_path_obj = Path(file_path)
+        # Expand directories to the markdown files they contain
+        files = []
+        for file_path in map(Path, file_paths):
+            if file_path.is_dir():
+                files.extend(sorted(file_path.rglob("*.md")))
+            else:
+                files.append(file_path)
+        
+        if not files:
+            console.print("[yellow]No markdown files found[/yellow]")
+            return
         
         # Create provider
         provider_instance = create_provider(provider, api_key=api_key)
@@ -701,47 +1017,87 @@ def check_quality(
             cache_manager=cache_manager,
         )
         
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console,
-        ) as progress:
-            task = progress.add_task("Analyzing quality...", total=None)
-            
-            # Read content
-            content = file_path_obj.read_text(encoding="utf-8")
-            
-            # Check quality
-            metrics = asyncio.run(processor.check_quality(content))
-            
-            progress.update(task, description="Analysis complete!")
-        
-        # Display results
-        console.print(f"\n[bold]Quality Report: {file_path_obj.name}[/bold]\n")
-        
-        console.print("[cyan]Scores:[/cyan]")
-        console.print(f"  Grammar: {metrics.get('grammar_score', 0)}/100")
-        console.print(f"  Clarity: {metrics.get('clarity_score', 0)}/100")
-        console.print(f"  Consistency: {metrics.get('consistency_score', 0)}/100")
-        console.print(f"  Readability: {metrics.get('readability_score', 0)}/100")
-        
-        if metrics.get('issues'):
-            console.print("\n[yellow]Issues Found:[/yellow]")
-            for issue in metrics['issues']:
-                console.print(f"  - {issue}")
-        
-        if metrics.get('suggestions'):
-            console.print("\n[green]Suggestions:[/green]")
-            for suggestion in metrics['suggestions']:
-                console.print(f"  - {suggestion}")
+        failed = _run(_check_quality_all(processor, files, concurrency))
         
         cache_manager.close()
         
+        if failed:
+            sys.exit(1)
+        
     except Exception as e:
         console.print(f"[red]Error:[/red] {e}")
         sys.exit(1)
 
 
+async def _check_quality_all(processor, files: list, limit: int) -> int:
+    """Check files concurrently, printing each report as it completes.
+    
+    Args:
+        processor: Enhancement processor
+        files: Markdown files to check
+        limit: Maximum number of files checked at once
+        
+    Returns:
+        Number of files that could not be checked
+    """
+    import asyncio
+    
+    sem = asyncio.Semaphore(limit)
+    
+    async def one(file_path: Path):
+        async with sem:
+            try:
+                content = await asyncio.to_thread(_read_markdown, file_path)
+                return file_path, await processor.check_quality(content), None
+            except Exception as e:
+                return file_path, None, e
+    
+    failed = 0
+    
+    with _progress() as progress:
+        task = progress.add_task("Analyzing quality...", total=len(files))
+        
+        for future in asyncio.as_completed([one(f) for f in files]):
+            file_path, metrics, error = await future
+            progress.advance(task)
+            
+            if error is not None:
+                failed += 1
+                console.print(f"[red]Error:[/red] {file_path}: {error}")
+            else:
+                _print_quality_report(file_path, metrics)
+        
+        progress.update(task, description="Analysis complete!")
+    
+    return failed
+
+
+def _print_quality_report(file_path: Path, metrics: dict):
+    """Print the quality report for a file.
+    
+    Args:
+        file_path: Checked file
+        metrics: Quality metrics from the enhancement processor
+    """
+    console.print(f"\n[bold]Quality Report: {file_path}[/bold]\n")
+    
+    console.print("[cyan]Scores:[/cyan]")
+    console.print(f"  Grammar: {metrics.get('grammar_score', 0)}/100")
+    console.print(f"  Clarity: {metrics.get('clarity_score', 0)}/100")
+    console.print(f"  Consistency: {metrics.get('consistency_score', 0)}/100")
+    console.print(f"  Readability: {metrics.get('readability_score', 0)}/100")
+    
+    if metrics.get('issues'):
+        console.print("\n[yellow]Issues Found:[/yellow]")
+        for issue in metrics['issues']:
+            console.print(f"  - {issue}")
+    
+    if metrics.get('suggestions'):
+        console.print("\n[green]Suggestions:[/green]")
+        for suggestion in metrics['suggestions']:
+            console.print(f"  - {suggestion}")
+
+
 @main.command()
 @click.option(
     "--docs-dir",
@@ -767,6 +1123,29 @@ def check_quality(
     envvar="OPENROUTER_API_KEY",
     help="API key for provider",
 )
+@click.option(
+    "--concurrency",
+    type=click.IntRange(min=1),
+    default=16,
+    help="Maximum number of files embedded concurrently",
+)
+@click.option(
+    "--force-rebuild",
+    is_flag=True,
+    help="Re-embed every file, ignoring the existing index",
+)
+@click.option(
+    "--vectors",
+    type=click.Choice(["float32", "float16", "int8"]),
+    default=None,
+    help="Embedding storage type: float32 (default), float16 (half the size) "
+    "or int8 (a quarter); compact types need numpy",
+)
+@click.option(
+    "--quantize",
+    is_flag=True,
+    help="Deprecated alias of --vectors int8",
+)
 @click.option(
     "--verbose",
     "-v",
@@ -778,11 +1157,16 @@ def build_search_index(
     index_path: str,
     provider: str,
     api_key: Optional[str],
+    concurrency: int,
+    force_rebuild: bool,
+    vectors: Optional[str],
+    quantize: bool,
     verbose: bool,
 ):
     """Build semantic search index from documentation.
     
     Generates embeddings for all markdown files and creates a searchable index.
+    Files unchanged since the existing index was built reuse their embeddings.
     
     Examples:
         # Build index
@@ -793,8 +1177,23 @@ def build_search_index(
         
         # Custom index path
         mkdocs-ai build-search-index --index-path search.json
+        
+        # Limit concurrent embedding requests
+        mkdocs-ai build-search-index --concurrency 4
+        
+        # Re-embed everything
+        mkdocs-ai build-search-index --force-rebuild
+        
+        # Half-size index
+        mkdocs-ai build-search-index --vectors float16
     """
-    from .search import SearchBuilder
+    if quantize:
+        if vectors not in (None, "int8"):
+            raise click.UsageError("--quantize conflicts with --vectors; use --vectors int8")
+        console.print("[yellow]--quantize is deprecated, use --vectors int8[/yellow]")
+        vectors = "int8"
+    
+    from .search import SearchBuilder, SearchIndex
     from .providers import create_provider
     from .cache import CacheManager
     
@@ -824,15 +1223,22 @@ def build_search_index(
             index_path=index_path_obj,
         )
         
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console,
-        ) as progress:
+        # Existing index, whose unchanged files are reused
+        previous = SearchIndex(index_path_obj)
+        if not force_rebuild:
+            previous.load()
+        
+        with _progress() as progress:
             task = progress.add_task("Building search index...", total=None)
             
             # Build index
-            index = asyncio.run(builder.build_index_from_files(md_files))
+            index = SearchIndex(index_path_obj, vectors=vectors)
+            results = _run(_embed_all(builder, md_files, concurrency, previous))
+            reused = 0
+            for file_path, (stamp, chunks, was_reused) in zip(md_files, results):
+                index.add_file(str(file_path), chunks, stamp)
+                reused += was_reused
+            index.metadata['total_documents'] = len(md_files)
             
             # Save index
             index.save()
@@ -844,6 +1250,7 @@ def build_search_index(
         console.print("\n[bold green]✓ Search Index Built[/bold green]\n")
         console.print(f"Total chunks: {stats['total_chunks']}")
         console.print(f"Total documents: {stats['total_documents']}")
+        console.print(f"Embedded: {len(md_files) - reused} ({reused} unchanged)")
         console.print(f"Index size: {stats['index_size_mb']:.2f} MB")
         console.print(f"Avg chunk length: {stats['avg_chunk_length']:.0f} chars")
         console.print(f"\nIndex saved to: {index_path_obj}")
@@ -858,6 +1265,68 @@ def build_search_index(
         sys.exit(1)
 
 
+async def _embed_all(builder, files: list, limit: int, previous=None) -> list:
+    """Embed files concurrently, bounded by a semaphore.
+    
+    Files whose size and modification time match the previous index reuse
+    its chunks after a single stat(); files with changed stamps but the same
+    content hash are reused too. The remaining files are read up front in
+    worker threads, so disk reads overlap with the embedding requests.
+    
+    Args:
+        builder: Search builder used to embed each file
+        files: Markdown files to embed
+        limit: Maximum number of files embedded at once
+        previous: Optional existing search index to reuse chunks from
+        
+    Returns:
+        (stamp, chunks, reused) tuples, in the order of files
+    """
+    import asyncio
+    import hashlib
+    
+    sem = asyncio.Semaphore(limit)
+    per_file = previous.per_file if previous else {}
+    
+    async def read(file_path: Path) -> bytes:
+        return await asyncio.to_thread(file_path.read_bytes)
+    
+    async def embed(file_path: Path, stat, entry, pending) -> tuple:
+        path = str(file_path)
+        stamp = {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size}
+        
+        if pending is None:
+            return {**entry, **stamp}, previous.get_file_chunks(path), True
+        
+        data = await pending
+        stamp["sha256"] = hashlib.sha256(data).hexdigest()
+        if entry and entry.get("sha256") == stamp["sha256"]:
+            return stamp, previous.get_file_chunks(path), True
+        
+        # Match the newline translation of text-mode reads
+        content = data.decode("utf-8")
+        if "\r" in content:
+            content = content.replace("\r\n", "\n").replace("\r", "\n")
+        
+        async with sem:
+            chunks = await builder.embed_content(file_path, content)
+        return stamp, chunks, False
+    
+    tasks = []
+    for file_path in files:
+        stat = file_path.stat()
+        entry = per_file.get(str(file_path))
+        unchanged = (
+            entry is not None
+            and entry.get("mtime_ns") == stat.st_mtime_ns
+            and entry.get("size") == stat.st_size
+        )
+        pending = None if unchanged else asyncio.ensure_future(read(file_path))
+        tasks.append(embed(file_path, stat, entry, pending))
+    
+    return await asyncio.gather(*tasks)
+
+
 @main.command()
 @click.argument("query")
 @click.option(
@@ -885,6 +1354,12 @@ def build_search_index(
     default=5,
     help="Number of results to return",
 )
+@click.option(
+    "--backend",
+    type=click.Choice(["auto", "numpy", "brute"]),
+    default="auto",
+    help="Similarity scoring backend (auto uses NumPy when installed)",
+)
 @click.option(
     "--verbose",
     "-v",
@@ -897,6 +1372,7 @@ def search(
     provider: str,
     api_key: Optional[str],
     top_k: int,
+    backend: str,
     verbose: bool,
 ):
     """Search documentation using semantic search.
@@ -931,21 +1407,18 @@ def search(
         # Create cache manager
         cache_manager = CacheManager(cache_dir=".ai-cache")
         
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console,
-        ) as progress:
+        with _progress() as progress:
             task = progress.add_task("Searching...", total=None)
             
             # Search
-            results = asyncio.run(
+            results = _run(
                 search_documents(
                     query=query,
                     index_path=index_path_obj,
                     provider=provider_instance,
                     cache_manager=cache_manager,
                     top_k=top_k,
+                    backend=backend,
                 )
             )
             
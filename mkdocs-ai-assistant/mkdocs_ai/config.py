@@ -18,6 +18,7 @@ class ProviderConfig(base.Config):
     temperature = c.Type(float, default=0.7)
     max_tokens = c.Type(int, default=4000)
     timeout = c.Type(int, default=60)
+    prompt_caching = c.Type(bool, default=False)  # Anthropic-style cache breakpoints
 
 
 class CacheConfig(base.Config):
@@ -0,0 +1,251 @@
+"""Long-lived daemon serving CLI commands over a UNIX socket.
+
+The daemon keeps cache handles, provider instances and the shared HTTP
+session open between CLI invocations, so short commands skip opening the
+cache database and setting up provider connections every time.
+"""
+
+import asyncio
+import json
+import os
+import signal
+import socket
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from .cache import CacheManager
+from .providers import AIProvider
+
+# Default socket location, next to other per-user caches
+SOCKET_PATH = (
+    Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+    / "mkdocs-ai"
+    / "sock"
+)
+
+# Requests carry whole documents, so allow lines well beyond asyncio's 64 KiB
+MAX_MESSAGE_BYTES = 64 * 1024 * 1024
+
+# Seconds a client waits on the socket before giving up on the daemon
+REQUEST_TIMEOUT = 10.0
+
+
+class DaemonError(Exception):
+    """Error reported by the daemon while running a command."""
+
+    pass
+
+
+class DaemonUnavailable(DaemonError):
+    """No daemon is listening on the socket, or it did not answer in time."""
+
+    pass
+
+
+class Daemon:
+    """Serve CLI commands from a single long-lived process.
+
+    Each connection carries one JSON request line,
+    ``{"cmd": "enhance", "args": {...}}``, answered by one JSON response
+    line, ``{"ok": true, "result": ...}`` or ``{"ok": false, "error": "..."}``.
+    """
+
+    def __init__(self, socket_path: Path = SOCKET_PATH):
+        """Initialize daemon.
+
+        Args:
+            socket_path: Path of the UNIX socket to listen on
+        """
+        self.socket_path = Path(socket_path)
+        self._caches: Dict[str, CacheManager] = {}
+        self._providers: Dict[Tuple[str, Optional[str]], AIProvider] = {}
+        self._stop: Optional[asyncio.Event] = None
+        self._handlers = {
+            "ping": self._ping,
+            "shutdown": self._shutdown,
+            "cache_stats": self._cache_stats,
+            "discover_assets": self._discover_assets,
+            "enhance": self._enhance,
+        }
+
+    async def serve(self) -> None:
+        """Listen for requests until shutdown or SIGTERM/SIGINT."""
+        self._stop = asyncio.Event()
+
+        self.socket_path.parent.mkdir(parents=True, exist_ok=True)
+        self.socket_path.unlink(missing_ok=True)
+
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGTERM, signal.SIGINT):
+            loop.add_signal_handler(sig, self._stop.set)
+
+        server = await asyncio.start_unix_server(
+            self._handle,
+            path=str(self.socket_path),
+            limit=MAX_MESSAGE_BYTES,
+        )
+
+        try:
+            async with server:
+                await self._stop.wait()
+        finally:
+            for sig in (signal.SIGTERM, signal.SIGINT):
+                loop.remove_signal_handler(sig)
+            self.socket_path.unlink(missing_ok=True)
+            self.close()
+
+    def close(self) -> None:
+        """Flush and close all open cache handles."""
+        for cache_manager in self._caches.values():
+            cache_manager.close()
+        self._caches.clear()
+        self._providers.clear()
+
+    async def _handle(
+        self,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+    ) -> None:
+        """Answer a single request.
+
+        Args:
+            reader: Connection reader
+            writer: Connection writer
+        """
+        try:
+            request = json.loads(await reader.readline())
+            handler = self._handlers.get(request.get("cmd"))
+            if handler is None:
+                raise DaemonError(f"Unknown command: {request.get('cmd')}")
+            response = {"ok": True, "result": await handler(**request.get("args", {}))}
+        except Exception as e:
+            response = {"ok": False, "error": str(e)}
+
+        writer.write(json.dumps(response).encode("utf-8") + b"\n")
+        try:
+            await writer.drain()
+        finally:
+            writer.close()
+
+    def _cache(self, cache_dir: str) -> CacheManager:
+        """Get the open cache handle for a directory.
+
+        Args:
+            cache_dir: Absolute cache directory
+
+        Returns:
+            Cache manager
+        """
+        if cache_dir not in self._caches:
+            self._caches[cache_dir] = CacheManager(cache_dir=cache_dir)
+        return self._caches[cache_dir]
+
+    def _provider(self, name: str, api_key: Optional[str]) -> AIProvider:
+        """Get the provider instance for a name and API key.
+
+        Args:
+            name: Provider name
+            api_key: Optional API key
+
+        Returns:
+            AI provider
+        """
+        from .providers import create_provider
+
+        key = (name, api_key)
+        if key not in self._providers:
+            self._providers[key] = create_provider(name, api_key=api_key)
+        return self._providers[key]
+
+    async def _ping(self) -> str:
+        """Report that the daemon is alive."""
+        return "pong"
+
+    async def _shutdown(self) -> None:
+        """Stop serving after answering this request."""
+        self._stop.set()
+
+    async def _cache_stats(self, cache_dir: str) -> Dict[str, Any]:
+        """Get statistics of a cache directory."""
+        return self._cache(cache_dir).get_stats()
+
+    async def _discover_assets(self, project_root: str) -> Dict[str, list]:
+        """Discover project assets, returned as path strings by type."""
+        from .assets import AssetDiscovery
+
+        assets = await asyncio.to_thread(AssetDiscovery(Path(project_root)).discover_all)
+        return {asset_type: [str(p) for p in paths] for asset_type, paths in assets.items()}
+
+    async def _enhance(
+        self,
+        content: str,
+        cache_dir: str,
+        provider: str,
+        api_key: Optional[str] = None,
+        level: str = "moderate",
+        chunk_size: int = 2000,
+        concurrency: int = 4,
+    ) -> str:
+        """Enhance document content with a cached provider."""
+        from .enhancement import EnhancementProcessor
+
+        processor = EnhancementProcessor(
+            provider=self._provider(provider, api_key),
+            cache_manager=self._cache(cache_dir),
+            enhancement_level=level,
+            chunk_size=chunk_size,
+            max_concurrency=concurrency,
+        )
+        return await processor.enhance_content(content)
+
+
+def request(
+    cmd: str,
+    socket_path: Path = SOCKET_PATH,
+    timeout: float = REQUEST_TIMEOUT,
+    **args: Any,
+) -> Any:
+    """Send a command to a running daemon and wait for its result.
+
+    Uses a blocking socket so callers don't need an event loop.
+
+    Args:
+        cmd: Command name
+        socket_path: Path of the daemon's UNIX socket
+        timeout: Seconds to wait for each socket operation
+        **args: Command arguments (JSON-serializable)
+
+    Returns:
+        Command result
+
+    Raises:
+        DaemonUnavailable: If no daemon can be reached or it doesn't answer
+            within the timeout
+        DaemonError: If the daemon failed to run the command
+    """
+    if not hasattr(socket, "AF_UNIX"):
+        raise DaemonUnavailable("UNIX sockets are not supported on this platform")
+
+    payload = json.dumps({"cmd": cmd, "args": args}).encode("utf-8")
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout)
+        try:
+            sock.connect(str(socket_path))
+            sock.sendall(payload + b"\n")
+            with sock.makefile("rb") as stream:
+                line = stream.readline()
+        except TimeoutError as e:
+            raise DaemonUnavailable(f"Daemon did not answer within {timeout}s") from e
+        except OSError as e:
+            # Missing or stale socket, or one owned by another user
+            raise DaemonUnavailable(str(e)) from e
+
+    if not line:
+        raise DaemonError("Daemon closed the connection without a response")
+
+    response = json.loads(line)
+    if not response.get("ok"):
+        raise DaemonError(response.get("error", "Unknown daemon error"))
+
+    return response.get("result")
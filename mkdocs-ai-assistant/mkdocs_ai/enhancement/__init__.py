@@ -1,15 +1,26 @@
 """Content enhancement module for improving documentation quality."""
 
 from .processor import EnhancementProcessor, enhance_markdown_file
-from .grammar import GrammarEnhancer, SpellingChecker, fix_grammar_in_file
-from .clarity import ClarityEnhancer, improve_clarity_in_file
+from .grammar import (
+    GrammarEnhancer,
+    SpellingChecker,
+    FastSpellFixer,
+    LocalGrammarFixer,
+    fix_grammar_in_file,
+    fix_grammar_in_files,
+)
+from .clarity import ClarityEnhancer, improve_clarity_in_file, improve_clarity_in_files
 
 __all__ = [
     "EnhancementProcessor",
     "enhance_markdown_file",
     "GrammarEnhancer",
     "SpellingChecker",
+    "FastSpellFixer",
+    "LocalGrammarFixer",
     "fix_grammar_in_file",
+    "fix_grammar_in_files",
     "ClarityEnhancer",
     "improve_clarity_in_file",
+    "improve_clarity_in_files",
 ]
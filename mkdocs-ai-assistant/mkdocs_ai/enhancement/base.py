@@ -0,0 +1,107 @@
+"""Shared base of the enhancers."""
+
+from typing import Optional
+import re
+
+from ..providers import AIProvider
+from ..cache import CacheManager, RequestCoalescer, SemanticCache
+
+# Code removed before looking at prose
+CODE_FENCE = re.compile(r'```[\s\S]*?```')
+INLINE_CODE = re.compile(r'`[^`]+`')
+WORD = re.compile(r'\b\w+\b')
+
+# Texts with less prose than this outside code are returned unchanged
+MIN_PROSE_CHARS = 30
+MIN_PROSE_WORDS = 8
+
+
+def is_trivial(text: str) -> bool:
+    """Check whether text has too little prose to be worth a provider call.
+
+    Args:
+        text: Markdown text
+
+    Returns:
+        True for very short or code-only text
+    """
+    prose = INLINE_CODE.sub('', CODE_FENCE.sub('', text)).strip()
+    return len(prose) < MIN_PROSE_CHARS or len(WORD.findall(prose)) < MIN_PROSE_WORDS
+
+
+class CachedEnhancer:
+    """Base for enhancers sending their prompts through the caches."""
+
+    def __init__(
+        self,
+        provider: AIProvider,
+        cache_manager: Optional[CacheManager] = None,
+        max_concurrency: Optional[int] = None,
+        semantic_cache: Optional[SemanticCache] = None,
+    ):
+        """Initialize enhancer.
+
+        Args:
+            provider: AI provider for the enhancements
+            cache_manager: Optional cache manager
+            max_concurrency: Maximum number of concurrent cached requests
+                (defaults to the provider's ``max_concurrency`` config, or 8)
+            semantic_cache: Optional cache reusing results of near-identical texts
+        """
+        self.provider = provider
+        self.cache_manager = cache_manager
+        self.semantic_cache = semantic_cache
+        # Cached requests share identical in-flight prompts
+        self._requests = RequestCoalescer(
+            provider,
+            cache_manager,
+            max_concurrency or provider.config.get("max_concurrency", 8),
+        )
+
+    async def _cached_call(
+        self,
+        kind: str,
+        text: str,
+        prompt: str,
+        system_prompt: str,
+        temperature: float,
+    ) -> str:
+        """Generate a response through the caches.
+
+        The exact-match cache is tried first, then the semantic cache (if
+        any) for a near-identical text of the same kind. Identical requests
+        already in flight share one provider call.
+
+        Args:
+            kind: Request kind, keeping semantic hits within one method
+            text: Input text the prompt was built from
+            prompt: Prompt text
+            system_prompt: System prompt
+            temperature: Sampling temperature
+
+        Returns:
+            Stripped response text
+        """
+        if self.semantic_cache:
+            cached = await self._requests.lookup(
+                prompt,
+                system_prompt,
+                temperature=temperature,
+            )
+            if cached:
+                return cached.strip()
+
+            similar = await self.semantic_cache.get(kind, text)
+            if similar is not None:
+                return similar
+
+        response = await self._requests.generate(
+            prompt,
+            system_prompt=system_prompt,
+            temperature=temperature,
+        )
+
+        if self.semantic_cache:
+            await self.semantic_cache.add(kind, text, response.strip())
+
+        return response.strip()
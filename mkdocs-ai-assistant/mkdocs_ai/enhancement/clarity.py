@@ -1,13 +1,76 @@
 """Clarity and readability enhancement."""
 
-from typing import Dict, Any, Optional, List
+from collections import Counter
+from typing import AsyncIterator, Dict, Any, Optional, List
+import asyncio
 import re
 
 from ..providers import AIProvider
 from ..cache import CacheManager
+from .base import CODE_FENCE, INLINE_CODE, WORD, CachedEnhancer, is_trivial
+from .parsing import extract_json
 
+# Sentence boundaries for the readability metrics
+_SENTENCE_END = re.compile(r'[.!?]+')
 
-class ClarityEnhancer:
+_VOWELS = frozenset('aeiouy')
+
+_CLARITY_SYSTEM_PROMPT = "You are a technical writing expert improving documentation clarity."
+
+
+def _word_syllables(word: str) -> int:
+    """Estimate syllables of a lowercased word from its vowel groups.
+    
+    Args:
+        word: Lowercased word
+        
+    Returns:
+        Estimated syllable count (at least 1)
+    """
+    # Count vowel groups by their first vowel
+    vowel_groups = 0
+    previous_vowel = False
+    for char in word:
+        is_vowel = char in _VOWELS
+        if is_vowel and not previous_vowel:
+            vowel_groups += 1
+        previous_vowel = is_vowel
+    
+    # Adjust for silent e
+    if word.endswith('e'):
+        vowel_groups -= 1
+    
+    # Minimum 1 syllable per word
+    return max(1, vowel_groups)
+
+
+async def _strip_stream(chunks: AsyncIterator[str]) -> AsyncIterator[str]:
+    """Strip surrounding whitespace from a stream of text chunks.
+    
+    Trailing whitespace is held back until more text follows it, so the
+    joined output equals the stripped joined input.
+    
+    Args:
+        chunks: Text chunks
+        
+    Yields:
+        Chunks without leading or trailing whitespace of the whole text
+    """
+    started = False
+    pending = ""
+    async for chunk in chunks:
+        if not started:
+            chunk = chunk.lstrip()
+            started = bool(chunk)
+        body = chunk.rstrip()
+        if body:
+            yield pending + body
+            pending = chunk[len(body):]
+        else:
+            pending += chunk
+
+
+class ClarityEnhancer(CachedEnhancer):
     """Enhance clarity and readability of documentation.
     
     Features:
@@ -18,30 +81,74 @@ class ClarityEnhancer:
     - Ensure consistency
     """
     
-    def __init__(
-        self,
-        provider: AIProvider,
-        cache_manager: Optional[CacheManager] = None,
-    ):
-        """Initialize enhancer.
+    async def improve_clarity(self, text: str) -> str:
+        """Improve clarity of text.
         
         Args:
-            provider: AI provider for improvements
-            cache_manager: Optional cache manager
+            text: Text to improve
+            
+        Returns:
+            Improved text
         """
-        self.provider = provider
-        self.cache_manager = cache_manager
+        if is_trivial(text):
+            return text
+        
+        return await self._cached_call(
+            "improve_clarity",
+            text,
+            self._clarity_prompt(text),
+            _CLARITY_SYSTEM_PROMPT,
+            0.4,
+        )
     
-    async def improve_clarity(self, text: str) -> str:
-        """Improve clarity of text.
+    async def improve_clarity_stream(self, text: str) -> AsyncIterator[str]:
+        """Improve clarity of text, yielding the result as it is generated.
+        
+        Joined chunks equal the result of ``improve_clarity``, and share its
+        cache entries.
+        
+        Args:
+            text: Text to improve
+            
+        Yields:
+            Chunks of improved text
+        """
+        if is_trivial(text):
+            yield text
+            return
+        
+        prompt = self._clarity_prompt(text)
+        
+        if self.semantic_cache:
+            cached = await self._requests.lookup(prompt, _CLARITY_SYSTEM_PROMPT, temperature=0.4)
+            if not cached:
+                cached = await self.semantic_cache.get("improve_clarity", text)
+            if cached:
+                yield cached.strip()
+                return
+        
+        chunks = []
+        async for chunk in _strip_stream(self._requests.stream(
+            prompt,
+            _CLARITY_SYSTEM_PROMPT,
+            temperature=0.4,
+        )):
+            chunks.append(chunk)
+            yield chunk
+        
+        if self.semantic_cache:
+            await self.semantic_cache.add("improve_clarity", text, "".join(chunks))
+    
+    def _clarity_prompt(self, text: str) -> str:
+        """Build the improve_clarity prompt, which also keys its cache entry.
         
         Args:
             text: Text to improve
             
         Returns:
-            Improved text
+            Prompt text
         """
-        prompt = f"""Improve the clarity and readability of the following text.
+        return f"""Improve the clarity and readability of the following text.
 
 Rules:
 - Simplify complex sentences
@@ -57,30 +164,30 @@ Text:
 {text}
 
 Return ONLY the improved text, no explanations."""
+    
+    async def improve_clarity_batch(
+        self,
+        texts: List[str],
+        max_concurrency: Optional[int] = None,
+    ) -> List[str]:
+        """Improve clarity of several texts concurrently.
         
-        # Check cache
-        cache_key = f"clarity_{text[:100]}"
-        if self.cache_manager:
-            cached = self.cache_manager.get(
-                cache_key,
-                model=self.provider.model,
-            )
-            if cached:
-                return cached
-        
-        response = await self.provider.generate(
-            prompt=prompt,
-            system_prompt="You are a technical writing expert improving documentation clarity.",
-            temperature=0.4,
-        )
-        
-        improved = response.content.strip()
+        Args:
+            texts: Texts to process
+            max_concurrency: Maximum number of concurrent provider calls
+                (defaults to the provider's ``max_concurrency`` config, or 8)
+            
+        Returns:
+            Improved texts, in input order
+        """
+        limit = max_concurrency or self.provider.config.get("max_concurrency", 8)
+        semaphore = asyncio.Semaphore(limit)
         
-        # Cache result
-        if self.cache_manager:
-            self.cache_manager.set(cache_key, improved, model=self.provider.model)
+        async def run(text: str) -> str:
+            async with semaphore:
+                return await self.improve_clarity(text)
         
-        return improved
+        return await asyncio.gather(*(run(text) for text in texts))
     
     async def simplify_sentences(self, text: str) -> str:
         """Simplify complex sentences.
@@ -91,6 +198,9 @@ Return ONLY the improved text, no explanations."""
         Returns:
             Text with simplified sentences
         """
+        if is_trivial(text):
+            return text
+        
         prompt = f"""Simplify complex sentences in the following text.
 
 Rules:
@@ -106,13 +216,13 @@ Text:
 
 Return ONLY the simplified text, no explanations."""
         
-        response = await self.provider.generate(
-            prompt=prompt,
-            system_prompt="You are an expert at simplifying technical writing.",
-            temperature=0.3,
+        return await self._cached_call(
+            "simplify_sentences",
+            text,
+            prompt,
+            "You are an expert at simplifying technical writing.",
+            0.3,
         )
-        
-        return response.content.strip()
     
     async def improve_word_choice(self, text: str) -> str:
         """Improve word choice for better clarity.
@@ -123,6 +233,9 @@ Return ONLY the simplified text, no explanations."""
         Returns:
             Text with better word choices
         """
+        if is_trivial(text):
+            return text
+        
         prompt = f"""Improve word choice in the following text for better clarity.
 
 Rules:
@@ -138,13 +251,13 @@ Text:
 
 Return ONLY the improved text, no explanations."""
         
-        response = await self.provider.generate(
-            prompt=prompt,
-            system_prompt="You are a technical writing expert improving word choice.",
-            temperature=0.3,
+        return await self._cached_call(
+            "improve_word_choice",
+            text,
+            prompt,
+            "You are a technical writing expert improving word choice.",
+            0.3,
         )
-        
-        return response.content.strip()
     
     async def check_consistency(self, text: str) -> Dict[str, Any]:
         """Check terminology consistency in text.
@@ -173,18 +286,19 @@ Return a JSON object with:
 
 Return ONLY valid JSON, no other text."""
         
-        response = await self.provider.generate(
-            prompt=prompt,
-            system_prompt="You are a documentation consistency analyzer.",
-            temperature=0.2,
+        content = await self._cached_call(
+            "check_consistency",
+            text,
+            prompt,
+            "You are a documentation consistency analyzer.",
+            0.2,
         )
         
         # Parse JSON response
-        import json
         try:
-            report = json.loads(response.content)
+            report = extract_json(content)
             return report
-        except json.JSONDecodeError:
+        except ValueError:
             return {
                 "inconsistencies": [],
                 "recommendations": [],
@@ -200,6 +314,9 @@ Return ONLY valid JSON, no other text."""
         Returns:
             Text with consistent terminology
         """
+        if is_trivial(text):
+            return text
+        
         prompt = f"""Fix terminology consistency issues in the following text.
 
 Rules:
@@ -215,13 +332,13 @@ Text:
 
 Return ONLY the corrected text, no explanations."""
         
-        response = await self.provider.generate(
-            prompt=prompt,
-            system_prompt="You are a documentation consistency expert.",
-            temperature=0.2,
+        return await self._cached_call(
+            "fix_consistency",
+            text,
+            prompt,
+            "You are a documentation consistency expert.",
+            0.2,
         )
-        
-        return response.content.strip()
     
     async def calculate_readability(self, text: str) -> Dict[str, Any]:
         """Calculate readability metrics for text.
@@ -232,35 +349,73 @@ Return ONLY the corrected text, no explanations."""
         Returns:
             Readability metrics
         """
-        # Simple readability calculations
-        sentences = self._count_sentences(text)
-        words = self._count_words(text)
-        syllables = self._count_syllables(text)
+        # Simple readability calculations, from a single pass over the text
+        sentences, word_counts = self._prepare(text)
+        words = word_counts.total()
+        syllables = self._syllables_from_words(word_counts)
         
-        # Flesch Reading Ease
-        if sentences > 0 and words > 0:
-            avg_sentence_length = words / sentences
-            avg_syllables_per_word = syllables / words
-            flesch_score = 206.835 - 1.015 * avg_sentence_length - 84.6 * avg_syllables_per_word
-        else:
-            flesch_score = 0
+        if sentences == 0 or words == 0:
+            return {
+                "flesch_reading_ease": 0,
+                "flesch_kincaid_grade": 0,
+                "sentences": sentences,
+                "words": words,
+                "avg_sentence_length": 0,
+                "avg_syllables_per_word": 0,
+                "interpretation": "No readable text",
+            }
+        
+        avg_sentence_length = words / sentences
+        avg_syllables_per_word = syllables / words
         
+        # Flesch Reading Ease
+        flesch_score = 206.835 - 1.015 * avg_sentence_length - 84.6 * avg_syllables_per_word
         # Flesch-Kincaid Grade Level
-        if sentences > 0 and words > 0:
-            grade_level = 0.39 * avg_sentence_length + 11.8 * avg_syllables_per_word - 15.59
-        else:
-            grade_level = 0
+        grade_level = 0.39 * avg_sentence_length + 11.8 * avg_syllables_per_word - 15.59
         
         return {
             "flesch_reading_ease": max(0, min(100, flesch_score)),
             "flesch_kincaid_grade": max(0, grade_level),
             "sentences": sentences,
             "words": words,
-            "avg_sentence_length": avg_sentence_length if sentences > 0 else 0,
-            "avg_syllables_per_word": avg_syllables_per_word if words > 0 else 0,
+            "avg_sentence_length": avg_sentence_length,
+            "avg_syllables_per_word": avg_syllables_per_word,
             "interpretation": self._interpret_flesch_score(flesch_score),
         }
     
+    def _prepare(self, text: str) -> tuple[int, Counter]:
+        """Strip code and tokenize text once for the readability metrics.
+        
+        Args:
+            text: Text to analyze
+            
+        Returns:
+            Tuple of (sentence count, counts of lowercased words)
+        """
+        # Remove code blocks (most prose has none, so skip the copies)
+        if '`' in text:
+            text = CODE_FENCE.sub('', text)
+            text = INLINE_CODE.sub('', text)
+        
+        # Lowercase each distinct word instead of a copy of the whole text
+        words = Counter()
+        for word, count in Counter(WORD.findall(text)).items():
+            words[word.lower()] += count
+        
+        return len(_SENTENCE_END.findall(text)), words
+    
+    def _syllables_from_words(self, words: Counter) -> int:
+        """Estimate syllable count of lowercased words.
+        
+        Args:
+            words: Counts of lowercased words
+            
+        Returns:
+            Estimated syllable count
+        """
+        # Words repeat a lot, so estimate each distinct word once
+        return sum(count * _word_syllables(word) for word, count in words.items())
+    
     def _count_sentences(self, text: str) -> int:
         """Count sentences in text.
         
@@ -270,13 +425,7 @@ Return ONLY the corrected text, no explanations."""
         Returns:
             Number of sentences
         """
-        # Remove code blocks
-        text = re.sub(r'```[\s\S]*?```', '', text)
-        text = re.sub(r'`[^`]+`', '', text)
-        
-        # Count sentence endings
-        sentences = re.findall(r'[.!?]+', text)
-        return len(sentences)
+        return self._prepare(text)[0]
     
     def _count_words(self, text: str) -> int:
         """Count words in text.
@@ -287,13 +436,7 @@ Return ONLY the corrected text, no explanations."""
         Returns:
             Number of words
         """
-        # Remove code blocks
-        text = re.sub(r'```[\s\S]*?```', '', text)
-        text = re.sub(r'`[^`]+`', '', text)
-        
-        # Count words
-        words = re.findall(r'\b\w+\b', text)
-        return len(words)
+        return self._prepare(text)[1].total()
     
     def _count_syllables(self, text: str) -> int:
         """Estimate syllable count in text.
@@ -304,24 +447,7 @@ Return ONLY the corrected text, no explanations."""
         Returns:
             Estimated syllable count
         """
-        # Remove code blocks
-        text = re.sub(r'```[\s\S]*?```', '', text)
-        text = re.sub(r'`[^`]+`', '', text)
-        
-        # Simple syllable estimation
-        words = re.findall(r'\b\w+\b', text.lower())
-        syllables = 0
-        
-        for word in words:
-            # Count vowel groups
-            vowel_groups = len(re.findall(r'[aeiouy]+', word))
-            # Adjust for silent e
-            if word.endswith('e'):
-                vowel_groups -= 1
-            # Minimum 1 syllable per word
-            syllables += max(1, vowel_groups)
-        
-        return syllables
+        return self._syllables_from_words(self._prepare(text)[1])
     
     def _interpret_flesch_score(self, score: float) -> str:
         """Interpret Flesch Reading Ease score.
@@ -371,18 +497,19 @@ Provide 3-5 specific, actionable suggestions. Focus on:
 Return a JSON array of suggestion strings.
 Return ONLY valid JSON, no other text."""
         
-        response = await self.provider.generate(
-            prompt=prompt,
-            system_prompt="You are a technical writing coach providing improvement suggestions.",
-            temperature=0.4,
+        content = await self._cached_call(
+            "get_improvement_suggestions",
+            text,
+            prompt,
+            "You are a technical writing coach providing improvement suggestions.",
+            0.4,
         )
         
         # Parse JSON response
-        import json
         try:
-            suggestions = json.loads(response.content)
+            suggestions = extract_json(content)
             return suggestions if isinstance(suggestions, list) else []
-        except json.JSONDecodeError:
+        except ValueError:
             return []
 
 
@@ -403,9 +530,37 @@ async def improve_clarity_in_file(
     """
     from pathlib import Path
     
-    content = Path(file_path).read_text(encoding="utf-8")
+    content = await asyncio.to_thread(Path(file_path).read_text, encoding="utf-8")
     
     enhancer = ClarityEnhancer(provider, cache_manager)
     improved = await enhancer.improve_clarity(content)
     
     return improved
+
+
+async def improve_clarity_in_files(
+    file_paths: List[str],
+    provider: AIProvider,
+    cache_manager: Optional[CacheManager] = None,
+    max_concurrency: Optional[int] = None,
+) -> List[str]:
+    """Convenience function to improve clarity in several files concurrently.
+    
+    Args:
+        file_paths: Paths to files
+        provider: AI provider
+        cache_manager: Optional cache manager
+        max_concurrency: Maximum number of concurrent provider calls
+        
+    Returns:
+        Improved contents, in input order
+    """
+    from pathlib import Path
+    
+    contents = await asyncio.gather(*(
+        asyncio.to_thread(Path(file_path).read_text, encoding="utf-8")
+        for file_path in file_paths
+    ))
+    
+    enhancer = ClarityEnhancer(provider, cache_manager)
+    return await enhancer.improve_clarity_batch(contents, max_concurrency=max_concurrency)
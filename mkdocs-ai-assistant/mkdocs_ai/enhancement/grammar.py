@@ -1,13 +1,78 @@
 """Grammar and spelling enhancement."""
 
-from typing import List, Dict, Any, Optional
+from importlib import resources
+from types import MappingProxyType
+from typing import List, Dict, Any, ClassVar, Mapping, Optional
+import asyncio
+import functools
 import re
+import threading
+
+# Local typo correction requires the ``spelling`` extra
+try:
+    from symspellpy import SymSpell
+except ImportError:  # pragma: no cover - optional dependency
+    SymSpell = None
+
+# Offline grammar fixes require the ``local`` extra (and a Java runtime)
+try:
+    import language_tool_python
+except ImportError:  # pragma: no cover - optional dependency
+    language_tool_python = None
 
 from ..providers import AIProvider
-from ..cache import CacheManager
+from ..cache import CacheManager, SemanticCache
+from .base import CODE_FENCE, INLINE_CODE, CachedEnhancer, is_trivial
+from .parsing import extract_json
+
+# Words left to spell check once code is removed
+_ALPHA_WORD = re.compile(r'\b[a-zA-Z]+\b')
+
+# Spans left untouched by local spelling fixes (code, URLs, link targets),
+# and the prose words checked between them
+_SPELL_MASK = re.compile(r'(```[\s\S]*?```|`[^`]+`|https?://\S+|\]\([^)]*\))')
+_PROSE_WORD = re.compile(r"\b[a-zA-Z]+(?:'[a-zA-Z]+)*\b")
+
+# Misspellings fixed without asking the model. "cant" and "wont" are
+# missing on purpose: both are also real words.
+_KNOWN_TYPOS: Mapping[str, str] = MappingProxyType({
+    "recieve": "receive",
+    "occured": "occurred",
+    "seperate": "separate",
+    "definately": "definitely",
+    "accomodate": "accommodate",
+    "alot": "a lot",
+    "dont": "don't",
+    "shouldnt": "shouldn't",
+})
+
+# Numbered documents in a packed fix_all_many response
+_DOC_BLOCK = re.compile(r'<DOC (\d+)>\n?([\s\S]*?)\n?</DOC \1>')
+
+# Editing rules shared by the single and packed fix-all prompts
+_FIX_ALL_RULES = """Rules:
+- Fix grammar errors (subject-verb agreement, tense, articles, pronouns)
+- Fix spelling mistakes
+- Fix punctuation errors
+- Preserve all markdown formatting
+- Preserve technical terms and code
+- Don't add new content or change meaning
+- Don't rewrite sentences unless necessary for grammar"""
 
+_FIX_ALL_SYSTEM_PROMPT = "You are an expert editor fixing grammar, spelling, and punctuation."
 
-class GrammarEnhancer:
+# Common technical patterns, matched at the start of a word
+_TECHNICAL_TERM = re.compile(r'''
+    [A-Z][a-z]+[A-Z]    # CamelCase
+  | [a-z]+_[a-z]+       # snake_case
+  | [A-Z_]+$            # CONSTANT_CASE
+  | \w+\.\w+            # module.function
+  | @\w+                # @decorator
+  | \$\w+               # $variable
+''', re.VERBOSE)
+
+
+class GrammarEnhancer(CachedEnhancer):
     """Enhance grammar and spelling in documentation.
     
     Features:
@@ -17,19 +82,48 @@ class GrammarEnhancer:
     - Sentence structure improvements
     """
     
+    # Common errors and their corrections, shared by all instances
+    _COMMON_ERRORS: ClassVar[Mapping[str, str]] = MappingProxyType({
+        # Common grammar errors
+        "it's": "its (possessive)",
+        "your": "you're (you are)",
+        "their": "there/they're",
+        "affect": "effect",
+        "then": "than",
+        
+        # Common spelling errors
+        **_KNOWN_TYPOS,
+        
+        # Technical writing
+        "cant": "can't",
+        "wont": "won't",
+    })
+    
     def __init__(
         self,
         provider: AIProvider,
         cache_manager: Optional[CacheManager] = None,
+        max_concurrency: Optional[int] = None,
+        semantic_cache: Optional[SemanticCache] = None,
+        spell_fixer: Optional["FastSpellFixer"] = None,
+        local_fixer: Optional["LocalGrammarFixer"] = None,
     ):
         """Initialize enhancer.
         
         Args:
             provider: AI provider for corrections
             cache_manager: Optional cache manager
+            max_concurrency: Maximum number of concurrent cached requests
+                (defaults to the provider's ``max_concurrency`` config, or 8)
+            semantic_cache: Optional cache reusing results of near-identical texts
+            spell_fixer: Optional local spelling fixer tried before the
+                provider in fix_spelling, e.g. ``FastSpellFixer()``
+            local_fixer: Offline grammar fixer tried before the provider in
+                fix_all (off by default; its first use starts LanguageTool)
         """
-        self.provider = provider
-        self.cache_manager = cache_manager
+        super().__init__(provider, cache_manager, max_concurrency, semantic_cache)
+        self.spell_fixer = spell_fixer
+        self.local_fixer = local_fixer
     
     async def fix_grammar(self, text: str) -> str:
         """Fix grammar errors in text.
@@ -40,6 +134,9 @@ class GrammarEnhancer:
         Returns:
             Text with grammar fixes
         """
+        if is_trivial(text):
+            return text
+        
         prompt = f"""Fix grammar errors in the following text.
 
 Rules:
@@ -56,13 +153,13 @@ Text:
 
 Return ONLY the corrected text, no explanations."""
         
-        response = await self.provider.generate(
-            prompt=prompt,
-            system_prompt="You are a grammar expert fixing documentation errors.",
-            temperature=0.2,
+        return await self._cached_call(
+            "fix_grammar",
+            text,
+            prompt,
+            "You are a grammar expert fixing documentation errors.",
+            0.2,
         )
-        
-        return response.content.strip()
     
     async def fix_spelling(self, text: str) -> str:
         """Fix spelling mistakes in text.
@@ -73,6 +170,15 @@ Return ONLY the corrected text, no explanations."""
         Returns:
             Text with spelling fixes
         """
+        if is_trivial(text):
+            return text
+        
+        # Known typos are fixed locally; anything uncertain goes to the model
+        if self.spell_fixer is not None:
+            fixed = await asyncio.to_thread(self.spell_fixer.fix, text)
+            if fixed is not None:
+                return fixed
+        
         prompt = f"""Fix spelling mistakes in the following text.
 
 Rules:
@@ -87,13 +193,13 @@ Text:
 
 Return ONLY the corrected text, no explanations."""
         
-        response = await self.provider.generate(
-            prompt=prompt,
-            system_prompt="You are a spelling expert correcting documentation.",
-            temperature=0.2,
+        return await self._cached_call(
+            "fix_spelling",
+            text,
+            prompt,
+            "You are a spelling expert correcting documentation.",
+            0.2,
         )
-        
-        return response.content.strip()
     
     async def fix_punctuation(self, text: str) -> str:
         """Fix punctuation errors in text.
@@ -104,6 +210,9 @@ Return ONLY the corrected text, no explanations."""
         Returns:
             Text with punctuation fixes
         """
+        if is_trivial(text):
+            return text
+        
         prompt = f"""Fix punctuation errors in the following text.
 
 Rules:
@@ -119,13 +228,13 @@ Text:
 
 Return ONLY the corrected text, no explanations."""
         
-        response = await self.provider.generate(
-            prompt=prompt,
-            system_prompt="You are a punctuation expert fixing documentation.",
-            temperature=0.2,
+        return await self._cached_call(
+            "fix_punctuation",
+            text,
+            prompt,
+            "You are a punctuation expert fixing documentation.",
+            0.2,
         )
-        
-        return response.content.strip()
     
     async def detect_errors(self, text: str) -> List[Dict[str, Any]]:
         """Detect grammar and spelling errors without fixing them.
@@ -136,6 +245,9 @@ Return ONLY the corrected text, no explanations."""
         Returns:
             List of detected errors with details
         """
+        if is_trivial(text):
+            return []
+        
         prompt = f"""Detect grammar and spelling errors in the following text.
 
 Text:
@@ -151,18 +263,19 @@ For each error, provide:
 Return a JSON array of errors. If no errors, return empty array [].
 Return ONLY valid JSON, no other text."""
         
-        response = await self.provider.generate(
-            prompt=prompt,
-            system_prompt="You are a grammar and spelling error detector.",
-            temperature=0.2,
+        content = await self._cached_call(
+            "detect_errors",
+            text,
+            prompt,
+            "You are a grammar and spelling error detector.",
+            0.2,
         )
         
         # Parse JSON response
-        import json
         try:
-            errors = json.loads(response.content)
+            errors = extract_json(content)
             return errors if isinstance(errors, list) else []
-        except json.JSONDecodeError:
+        except ValueError:
             return []
     
     async def fix_all(self, text: str) -> str:
@@ -174,74 +287,193 @@ Return ONLY valid JSON, no other text."""
         Returns:
             Fully corrected text
         """
-        prompt = f"""Fix all grammar, spelling, and punctuation errors in the following text.
+        if is_trivial(text):
+            return text
+        
+        # Texts the offline checker can fix unambiguously skip the model
+        if self.local_fixer is not None:
+            fixed = await asyncio.to_thread(self.local_fixer.fix, text)
+            if fixed is not None:
+                return fixed
+        
+        return await self._cached_call(
+            "fix_all",
+            text,
+            self._fix_all_prompt(text),
+            _FIX_ALL_SYSTEM_PROMPT,
+            0.2,
+        )
+    
+    async def fix_all_local(self, text: str) -> str:
+        """Fix grammar and spelling offline, without calling the provider.
+        
+        Applies LanguageTool's first suggestion for every issue outside
+        code, URLs and link targets.
+        
+        Args:
+            text: Text to fix
+            
+        Returns:
+            Corrected text
+        """
+        if self.local_fixer is None:
+            self.local_fixer = LocalGrammarFixer()
+        
+        return await asyncio.to_thread(self.local_fixer.correct, text)
+    
+    async def fix_all_batch(
+        self,
+        texts: List[str],
+        max_concurrency: Optional[int] = None,
+    ) -> List[str]:
+        """Fix grammar, spelling, and punctuation in several texts concurrently.
+        
+        Args:
+            texts: Texts to process
+            max_concurrency: Maximum number of concurrent provider calls
+                (defaults to the provider's ``max_concurrency`` config, or 8)
+            
+        Returns:
+            Corrected texts, in input order
+        """
+        limit = max_concurrency or self.provider.config.get("max_concurrency", 8)
+        semaphore = asyncio.Semaphore(limit)
+        
+        async def run(text: str) -> str:
+            async with semaphore:
+                return await self.fix_all(text)
+        
+        return await asyncio.gather(*(run(text) for text in texts))
+    
+    async def fix_all_many(
+        self,
+        texts: List[str],
+        pack: int = 8,
+        max_concurrency: Optional[int] = None,
+    ) -> List[str]:
+        """Fix all errors in many texts, packing several texts per request.
+        
+        Up to ``pack`` uncached texts are sent in one prompt as numbered
+        ``<DOC n>`` blocks, and the model answers with the same blocks.
+        This trades per-text latency for request-rate headroom, which pays
+        off on rate-limited accounts. Texts missing from a packed response
+        are retried individually with fix_all.
+        
+        Args:
+            texts: Texts to fix
+            pack: Maximum number of texts per request
+            max_concurrency: Maximum number of concurrent provider calls
+                (defaults to the provider's ``max_concurrency`` config, or 8)
+            
+        Returns:
+            Corrected texts, in input order
+        """
+        results: List[Optional[str]] = [None] * len(texts)
+        
+        if self.cache_manager:
+            results = await asyncio.gather(*(
+                self.cache_manager.aget(
+                    self._fix_all_prompt(text),
+                    system_prompt=_FIX_ALL_SYSTEM_PROMPT,
+                    model=self.provider.model,
+                    temperature=0.2,
+                )
+                for text in texts
+            ))
+        
+        trivial = [is_trivial(text) for text in texts]
+        results = [text if skip else result for text, skip, result in zip(texts, trivial, results)]
+        
+        pending = [i for i, result in enumerate(results) if not result and not trivial[i]]
+        groups = [pending[start:start + pack] for start in range(0, len(pending), pack)]
+        
+        limit = max_concurrency or self.provider.config.get("max_concurrency", 8)
+        semaphore = asyncio.Semaphore(limit)
+        
+        async def run(group: List[int]):
+            async with semaphore:
+                if len(group) == 1:
+                    results[group[0]] = await self.fix_all(texts[group[0]])
+                    return
+                
+                corrected = await self._fix_packed([texts[i] for i in group])
+                for i, fixed in zip(group, corrected):
+                    if fixed is None:
+                        results[i] = await self.fix_all(texts[i])
+                        continue
+                    
+                    results[i] = fixed
+                    if self.cache_manager:
+                        await self.cache_manager.aset(
+                            self._fix_all_prompt(texts[i]),
+                            fixed,
+                            system_prompt=_FIX_ALL_SYSTEM_PROMPT,
+                            model=self.provider.model,
+                            temperature=0.2,
+                        )
+        
+        await asyncio.gather(*(run(group) for group in groups))
+        return results
+    
+    async def _fix_packed(self, texts: List[str]) -> List[Optional[str]]:
+        """Fix several texts with a single provider call.
+        
+        Args:
+            texts: Texts to fix
+            
+        Returns:
+            Corrected texts, None for texts missing from the response
+        """
+        documents = "\n\n".join(
+            f"<DOC {n}>\n{text}\n</DOC {n}>" for n, text in enumerate(texts, 1)
+        )
+        prompt = f"""Fix all grammar, spelling, and punctuation errors in each of the following {len(texts)} documents independently.
 
-Rules:
-- Fix grammar errors (subject-verb agreement, tense, articles, pronouns)
-- Fix spelling mistakes
-- Fix punctuation errors
-- Preserve all markdown formatting
-- Preserve technical terms and code
-- Don't add new content or change meaning
-- Don't rewrite sentences unless necessary for grammar
+{_FIX_ALL_RULES}
 
-Text:
-{text}
+Documents:
+{documents}
 
-Return ONLY the corrected text, no explanations."""
-        
-        # Check cache
-        cache_key = f"grammar_fix_{text[:100]}"
-        if self.cache_manager:
-            cached = self.cache_manager.get(
-                cache_key,
-                model=self.provider.model,
-            )
-            if cached:
-                return cached
+Return every corrected document wrapped in the same <DOC n> and </DOC n> lines, in the same order.
+Return ONLY the wrapped documents, no explanations."""
         
         response = await self.provider.generate(
             prompt=prompt,
-            system_prompt="You are an expert editor fixing grammar, spelling, and punctuation.",
+            system_prompt=_FIX_ALL_SYSTEM_PROMPT,
             temperature=0.2,
         )
         
-        corrected = response.content.strip()
-        
-        # Cache result
-        if self.cache_manager:
-            self.cache_manager.set(cache_key, corrected, model=self.provider.model)
+        corrected = {
+            int(match.group(1)): match.group(2).strip()
+            for match in _DOC_BLOCK.finditer(response.content)
+        }
+        return [corrected.get(n) or None for n in range(1, len(texts) + 1)]
+    
+    def _fix_all_prompt(self, text: str) -> str:
+        """Build the fix_all prompt, which also keys its cache entry.
         
-        return corrected
+        Args:
+            text: Text to fix
+            
+        Returns:
+            Prompt text
+        """
+        return f"""Fix all grammar, spelling, and punctuation errors in the following text.
+
+{_FIX_ALL_RULES}
+
+Text:
+{text}
+
+Return ONLY the corrected text, no explanations."""
     
-    def get_common_errors(self) -> Dict[str, str]:
+    def get_common_errors(self) -> Mapping[str, str]:
         """Get common grammar and spelling errors to watch for.
         
         Returns:
-            Dictionary of common errors and their corrections
+            Read-only mapping of common errors and their corrections
         """
-        return {
-            # Common grammar errors
-            "it's": "its (possessive)",
-            "your": "you're (you are)",
-            "their": "there/they're",
-            "affect": "effect",
-            "then": "than",
-            
-            # Common spelling errors
-            "recieve": "receive",
-            "occured": "occurred",
-            "seperate": "separate",
-            "definately": "definitely",
-            "accomodate": "accommodate",
-            
-            # Technical writing
-            "alot": "a lot",
-            "cant": "can't",
-            "dont": "don't",
-            "wont": "won't",
-            "shouldnt": "shouldn't",
-        }
+        return self._COMMON_ERRORS
 
 
 class SpellingChecker:
@@ -268,8 +500,7 @@ class SpellingChecker:
         Args:
             words: Words to add
         """
-        for word in words:
-            self.add_word(word)
+        self.custom_dictionary.update(word.lower() for word in words)
     
     def is_technical_term(self, word: str) -> bool:
         """Check if word is a technical term.
@@ -280,21 +511,11 @@ class SpellingChecker:
         Returns:
             True if word is a technical term
         """
-        # Common technical patterns
-        technical_patterns = [
-            r'^[A-Z][a-z]+[A-Z]',  # CamelCase
-            r'^[a-z]+_[a-z]+',      # snake_case
-            r'^[A-Z_]+$',           # CONSTANT_CASE
-            r'^\w+\.\w+',           # module.function
-            r'^@\w+',               # @decorator
-            r'^\$\w+',              # $variable
-        ]
-        
-        for pattern in technical_patterns:
-            if re.match(pattern, word):
-                return True
+        if _TECHNICAL_TERM.match(word):
+            return True
         
-        return word.lower() in self.custom_dictionary
+        # Most words are already lowercase; skip copying those
+        return (word if word.islower() else word.lower()) in self.custom_dictionary
     
     def extract_words(self, text: str) -> List[str]:
         """Extract words from text, excluding code and technical terms.
@@ -306,16 +527,182 @@ class SpellingChecker:
             List of words to check
         """
         # Remove code blocks
-        text = re.sub(r'```[\s\S]*?```', '', text)
-        text = re.sub(r'`[^`]+`', '', text)
+        text = CODE_FENCE.sub('', text)
+        text = INLINE_CODE.sub('', text)
         
         # Extract words
-        words = re.findall(r'\b[a-zA-Z]+\b', text)
+        words = _ALPHA_WORD.findall(text)
         
         # Filter technical terms
         return [w for w in words if not self.is_technical_term(w)]
 
 
+@functools.lru_cache(maxsize=None)
+def _load_symspell() -> "SymSpell":
+    """Load the English frequency dictionary shipped with symspellpy, once."""
+    sym_spell = SymSpell(max_dictionary_edit_distance=2)
+    dictionary = resources.files("symspellpy") / "frequency_dictionary_en_82_765.txt"
+    sym_spell.load_dictionary(str(dictionary), term_index=0, count_index=1)
+    return sym_spell
+
+
+class FastSpellFixer:
+    """Fix known spelling mistakes locally.
+    
+    Words are checked against symspellpy's English frequency dictionary.
+    Only misspellings from a known-typo list are corrected; any other word
+    missing from the dictionary (often technical vocabulary such as "async"
+    or "npm") makes the text uncertain, so it is left to the model instead
+    of being mapped to the nearest frequent word.
+    """
+    
+    def __init__(
+        self,
+        checker: Optional["SpellingChecker"] = None,
+        typos: Optional[Mapping[str, str]] = None,
+    ):
+        """Initialize fixer.
+        
+        The dictionary is loaded on first use.
+        
+        Args:
+            checker: Spelling checker whose technical terms are never changed
+            typos: Lowercase misspellings and their corrections (defaults to
+                the known typos of GrammarEnhancer's common errors)
+        """
+        if SymSpell is None:
+            raise ImportError("FastSpellFixer requires 'symspellpy' (install the 'spelling' extra)")
+        
+        self.checker = checker or SpellingChecker()
+        self.typos = _KNOWN_TYPOS if typos is None else typos
+    
+    def fix(self, text: str) -> Optional[str]:
+        """Fix spelling outside code, URLs and link targets.
+        
+        Args:
+            text: Text to fix
+            
+        Returns:
+            Corrected text, or None if a word could not be corrected confidently
+        """
+        uncertain = False
+        
+        def correct(match: re.Match) -> str:
+            nonlocal uncertain
+            word = match.group(0)
+            if uncertain or self.checker.is_technical_term(word):
+                return word
+            
+            corrected = self._correct_word(word)
+            if corrected is None:
+                uncertain = True
+                return word
+            return corrected
+        
+        # Odd parts are masked spans captured by the split
+        parts = _SPELL_MASK.split(text)
+        for i in range(0, len(parts), 2):
+            parts[i] = _PROSE_WORD.sub(correct, parts[i])
+            if uncertain:
+                return None
+        
+        return "".join(parts)
+    
+    def _correct_word(self, word: str) -> Optional[str]:
+        """Correct one word, keeping its capitalization.
+        
+        Args:
+            word: Word to correct
+            
+        Returns:
+            The word or its correction, or None if unsure
+        """
+        lower = word.lower()
+        corrected = self.typos.get(lower)
+        if corrected is not None:
+            return corrected[0].upper() + corrected[1:] if word[0].isupper() else corrected
+        
+        return word if lower in _load_symspell().words else None
+
+
+class LocalGrammarFixer:
+    """Fix grammar and spelling offline with LanguageTool.
+    
+    The LanguageTool server is started on first use and runs locally, so
+    no text leaves the machine.
+    """
+    
+    def __init__(self, language: str = "en-US"):
+        """Initialize fixer.
+        
+        Args:
+            language: LanguageTool language code
+        """
+        if language_tool_python is None:
+            raise ImportError(
+                "LocalGrammarFixer requires 'language-tool-python' (install the 'local' extra)"
+            )
+        
+        self.language = language
+        self._tool = None
+        self._lock = threading.Lock()
+    
+    def correct(self, text: str) -> str:
+        """Apply the first suggestion for every issue found.
+        
+        Args:
+            text: Text to fix
+            
+        Returns:
+            Corrected text
+        """
+        return language_tool_python.utils.correct(text, self._matches(text))
+    
+    def fix(self, text: str) -> Optional[str]:
+        """Fix text only if every issue has a single suggestion.
+        
+        Args:
+            text: Text to fix
+            
+        Returns:
+            Corrected text, or None if an issue has no or several suggestions
+        """
+        matches = self._matches(text)
+        if any(len(match.replacements) != 1 for match in matches):
+            return None
+        
+        return language_tool_python.utils.correct(text, matches)
+    
+    def close(self) -> None:
+        """Stop the LanguageTool server, if started."""
+        with self._lock:
+            if self._tool is not None:
+                self._tool.close()
+                self._tool = None
+    
+    def _matches(self, text: str) -> list:
+        """Check text, ignoring issues inside code, URLs and link targets.
+        
+        Args:
+            text: Text to check
+            
+        Returns:
+            LanguageTool matches in prose
+        """
+        with self._lock:
+            if self._tool is None:
+                self._tool = language_tool_python.LanguageTool(self.language)
+        
+        masked = [match.span() for match in _SPELL_MASK.finditer(text)]
+        return [
+            match for match in self._tool.check(text)
+            if not any(
+                start < match.offset + match.error_length and match.offset < end
+                for start, end in masked
+            )
+        ]
+
+
 async def fix_grammar_in_file(
     file_path: str,
     provider: AIProvider,
@@ -333,9 +720,37 @@ async def fix_grammar_in_file(
     """
     from pathlib import Path
     
-    content = Path(file_path).read_text(encoding="utf-8")
+    content = await asyncio.to_thread(Path(file_path).read_text, encoding="utf-8")
     
     enhancer = GrammarEnhancer(provider, cache_manager)
     corrected = await enhancer.fix_all(content)
     
     return corrected
+
+
+async def fix_grammar_in_files(
+    file_paths: List[str],
+    provider: AIProvider,
+    cache_manager: Optional[CacheManager] = None,
+    max_concurrency: Optional[int] = None,
+) -> List[str]:
+    """Convenience function to fix grammar in several files concurrently.
+    
+    Args:
+        file_paths: Paths to files
+        provider: AI provider
+        cache_manager: Optional cache manager
+        max_concurrency: Maximum number of concurrent provider calls
+        
+    Returns:
+        Corrected contents, in input order
+    """
+    from pathlib import Path
+    
+    contents = await asyncio.gather(*(
+        asyncio.to_thread(Path(file_path).read_text, encoding="utf-8")
+        for file_path in file_paths
+    ))
+    
+    enhancer = GrammarEnhancer(provider, cache_manager)
+    return await enhancer.fix_all_batch(contents, max_concurrency=max_concurrency)
@@ -0,0 +1,81 @@
+"""Parsing of structured model responses."""
+
+import re
+from typing import Any
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # pragma: no cover - optional dependency
+    from json import loads as _json_loads
+
+# Markdown code fence around a JSON answer
+_JSON_FENCE = re.compile(r'```(?:json)?\s*([\s\S]*?)```')
+
+
+def extract_json(content: str) -> Any:
+    """Parse JSON from a model response.
+
+    Models often wrap JSON in a code fence or surround it with prose, so
+    after a plain parse fails the fenced block, then the first balanced
+    object or array, is parsed instead.
+
+    Args:
+        content: Response text
+
+    Returns:
+        Parsed JSON value
+
+    Raises:
+        ValueError: If the response contains no valid JSON
+    """
+    try:
+        return _json_loads(content)
+    except ValueError:
+        pass
+
+    match = _JSON_FENCE.search(content)
+    if match:
+        content = match.group(1)
+
+    return _json_loads(_balanced_json(content))
+
+
+def _balanced_json(content: str) -> str:
+    """Slice the first balanced JSON object or array out of text.
+
+    Args:
+        content: Text containing JSON
+
+    Returns:
+        JSON text
+
+    Raises:
+        ValueError: If no balanced object or array is found
+    """
+    starts = [i for i in (content.find('{'), content.find('[')) if i != -1]
+    if not starts:
+        raise ValueError("No JSON object or array in response")
+
+    start = min(starts)
+    depth = 0
+    in_string = False
+    escaped = False
+    for i in range(start, len(content)):
+        char = content[i]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif char == '\\':
+                escaped = True
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+        elif char in '{[':
+            depth += 1
+        elif char in '}]':
+            depth -= 1
+            if depth == 0:
+                return content[start:i + 1]
+
+    raise ValueError("Unbalanced JSON in response")
@@ -1,11 +1,60 @@
 """Content enhancement processor."""
 
+from collections import OrderedDict
 from pathlib import Path
 from typing import Optional, Dict, Any, List
+import asyncio
+import copy
+import os
 import re
 
 from ..providers import AIProvider
-from ..cache import CacheManager
+from ..cache import CacheManager, content_hash
+from .parsing import extract_json
+
+# Zero-width match before each markdown heading line
+_HEADING_BOUNDARY = re.compile(r'^(?=#{1,6}\s)', re.MULTILINE)
+
+# Sections preserved verbatim during enhancement, matched in one pass: YAML
+# frontmatter (--- at start and end), fenced code blocks (``` or ~~~) and
+# inline code
+_CODE_PATTERN = r'(?P<fence>```.*?```|~~~.*?~~~)|`[^`\n]+`'
+_CODE = re.compile(_CODE_PATTERN, re.DOTALL)
+_PRESERVED = re.compile(r'(?P<frontmatter>\A---\s*\n.*?\n---\s*\n)|' + _CODE_PATTERN, re.DOTALL)
+
+# Placeholders standing in for preserved code while text is enhanced
+_CODE_PLACEHOLDER = re.compile(r'__(?:CODE_BLOCK|INLINE_CODE)_\d+__')
+
+# Prompt instruction for each enhancement level option, in prompt order
+_INSTRUCTIONS = (
+    ("fix_grammar", "Fix any grammar errors"),
+    ("fix_spelling", "Correct spelling mistakes"),
+    ("improve_clarity", "Improve clarity and readability"),
+    ("check_consistency", "Ensure terminology consistency"),
+    ("rewrite_sentences", "Rewrite unclear sentences for better flow"),
+)
+
+_ENHANCE_SYSTEM_PROMPT = "You are an expert technical editor improving documentation quality."
+
+_ENHANCE_PROMPT_SUFFIX = "\n\nReturn ONLY the enhanced text, no explanations or meta-commentary."
+
+# Default number of results kept in memory per processor, unless
+# ``MKDOCS_AI_MEMO_SIZE`` holds a valid size
+DEFAULT_MEMO_SIZE = 256
+
+
+def _default_memo_size() -> int:
+    """Read the memo size from ``MKDOCS_AI_MEMO_SIZE``.
+    
+    Returns:
+        The variable's value if it is a non-negative integer, otherwise
+        DEFAULT_MEMO_SIZE
+    """
+    try:
+        size = int(os.environ.get("MKDOCS_AI_MEMO_SIZE", DEFAULT_MEMO_SIZE))
+    except ValueError:
+        return DEFAULT_MEMO_SIZE
+    return size if size >= 0 else DEFAULT_MEMO_SIZE
 
 
 class EnhancementProcessor:
@@ -17,6 +66,7 @@ class EnhancementProcessor:
     - Consistency checking
     - Preserves code blocks and frontmatter
     - Configurable enhancement levels
+    - Long documents enhanced section by section, concurrently
     """
     
     def __init__(
@@ -24,6 +74,9 @@ class EnhancementProcessor:
         provider: AIProvider,
         cache_manager: Optional[CacheManager] = None,
         enhancement_level: str = "moderate",
+        chunk_size: int = 2000,
+        max_concurrency: int = 4,
+        memo_size: Optional[int] = None,
     ):
         """Initialize processor.
         
@@ -31,10 +84,20 @@ class EnhancementProcessor:
             provider: AI provider for enhancements
             cache_manager: Optional cache manager
             enhancement_level: Enhancement level (light, moderate, aggressive)
+            chunk_size: Target maximum characters sent per provider call
+            max_concurrency: Maximum number of concurrent provider calls
+            memo_size: Number of results kept in memory in front of the
+                cache manager (defaults to ``MKDOCS_AI_MEMO_SIZE``, or 256;
+                0 disables)
         """
         self.provider = provider
         self.cache_manager = cache_manager
         self.enhancement_level = enhancement_level
+        self.chunk_size = chunk_size
+        self.max_concurrency = max_concurrency
+        self.memo_size = _default_memo_size() if memo_size is None else memo_size
+        self._memo: "OrderedDict[str, Any]" = OrderedDict()
+        self._prompt_prefixes: Dict[str, Optional[str]] = {}
         
         # Enhancement level configurations
         self.level_configs = {
@@ -77,26 +140,49 @@ class EnhancementProcessor:
         Returns:
             Enhanced markdown content
         """
-        # Extract and preserve special sections
-        preserved_sections = {}
-        working_content = content
-        
-        if preserve_frontmatter:
-            working_content, frontmatter = self._extract_frontmatter(working_content)
-            if frontmatter:
-                preserved_sections["frontmatter"] = frontmatter
+        return await self._enhance_content(
+            content,
+            preserve_code,
+            preserve_frontmatter,
+            asyncio.Semaphore(self.max_concurrency),
+        )
+    
+    async def _enhance_content(
+        self,
+        content: str,
+        preserve_code: bool,
+        preserve_frontmatter: bool,
+        semaphore: asyncio.Semaphore,
+    ) -> str:
+        """Enhance markdown content under a shared provider call limit.
         
-        if preserve_code:
-            working_content, code_blocks = self._extract_code_blocks(working_content)
-            preserved_sections["code_blocks"] = code_blocks
+        Args:
+            content: Original markdown content
+            preserve_code: Whether to preserve code blocks
+            preserve_frontmatter: Whether to preserve frontmatter
+            semaphore: Semaphore bounding concurrent provider calls
+            
+        Returns:
+            Enhanced markdown content
+        """
+        # Extract and preserve special sections
+        working_content, frontmatter, code_blocks = self._extract_preserved(
+            content,
+            preserve_code=preserve_code,
+            preserve_frontmatter=preserve_frontmatter,
+        )
         
-        # Enhance the content
-        enhanced = await self._enhance_text(working_content)
+        # Enhance the content, one chunk of sections per provider call
+        chunks = self._split_sections(working_content, self.chunk_size)
+        enhanced_chunks = await asyncio.gather(
+            *(self._enhance_chunk(chunk, semaphore) for chunk in chunks)
+        )
+        enhanced = "".join(enhanced_chunks)
         
         # Restore preserved sections
-        enhanced = self._restore_code_blocks(enhanced, preserved_sections.get("code_blocks", {}))
-        if "frontmatter" in preserved_sections:
-            enhanced = self._restore_frontmatter(enhanced, preserved_sections["frontmatter"])
+        enhanced = self._restore_code_blocks(enhanced, code_blocks)
+        if frontmatter:
+            enhanced = frontmatter + enhanced
         
         return enhanced
     
@@ -114,14 +200,104 @@ class EnhancementProcessor:
         Returns:
             Path to enhanced file
         """
-        content = file_path.read_text(encoding="utf-8")
-        enhanced = await self.enhance_content(content)
+        return await self._enhance_file(
+            file_path,
+            output_path,
+            asyncio.Semaphore(self.max_concurrency),
+        )
+    
+    async def enhance_files(self, file_paths: List[Path]) -> List[Path]:
+        """Enhance several markdown files in place, concurrently.
+        
+        All files share one limit of ``max_concurrency`` provider calls.
+        
+        Args:
+            file_paths: Paths to markdown files
+            
+        Returns:
+            Paths to enhanced files, in input order
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        return list(await asyncio.gather(
+            *(self._enhance_file(file_path, None, semaphore) for file_path in file_paths)
+        ))
+    
+    async def _enhance_file(
+        self,
+        file_path: Path,
+        output_path: Optional[Path],
+        semaphore: asyncio.Semaphore,
+    ) -> Path:
+        """Enhance a markdown file under a shared provider call limit.
+        
+        File reads and writes run in a worker thread so they don't block
+        the event loop while other files are being enhanced.
+        
+        Args:
+            file_path: Path to markdown file
+            output_path: Optional output path (defaults to overwriting input)
+            semaphore: Semaphore bounding concurrent provider calls
+            
+        Returns:
+            Path to enhanced file
+        """
+        content = await asyncio.to_thread(file_path.read_text, encoding="utf-8")
+        enhanced = await self._enhance_content(content, True, True, semaphore)
         
         output = output_path or file_path
-        output.write_text(enhanced, encoding="utf-8")
+        await asyncio.to_thread(output.write_text, enhanced, encoding="utf-8")
         
         return output
     
+    def _split_sections(self, text: str, max_chunk: int) -> List[str]:
+        """Split markdown into chunks at heading boundaries.
+        
+        Consecutive sections are packed together up to ``max_chunk``
+        characters; a single longer section stays whole. Code blocks and
+        frontmatter are expected to be replaced by placeholders already, so
+        ``#`` lines inside them can't be mistaken for headings.
+        
+        Args:
+            text: Markdown content
+            max_chunk: Target maximum characters per chunk
+            
+        Returns:
+            Chunks that concatenate back to ``text``
+        """
+        chunks = []
+        current = ""
+        
+        for section in _HEADING_BOUNDARY.split(text):
+            if current and len(current) + len(section) > max_chunk:
+                chunks.append(current)
+                current = ""
+            current += section
+        
+        if current:
+            chunks.append(current)
+        
+        return chunks
+    
+    async def _enhance_chunk(self, chunk: str, semaphore: asyncio.Semaphore) -> str:
+        """Enhance one chunk, keeping its surrounding whitespace.
+        
+        Args:
+            chunk: Chunk of markdown content
+            semaphore: Semaphore bounding concurrent provider calls
+            
+        Returns:
+            Enhanced chunk
+        """
+        body = chunk.strip()
+        if not body:
+            return chunk
+        
+        start = chunk.index(body)
+        async with semaphore:
+            enhanced = await self._enhance_text(body)
+        
+        return chunk[:start] + enhanced + chunk[start + len(body):]
+    
     async def _enhance_text(self, text: str) -> str:
         """Enhance text content using AI.
         
@@ -131,135 +307,143 @@ class EnhancementProcessor:
         Returns:
             Enhanced text
         """
-        config = self.level_configs.get(self.enhancement_level, self.level_configs["moderate"])
-        
-        # Build enhancement prompt based on configuration
-        instructions = []
-        
-        if config["fix_grammar"]:
-            instructions.append("Fix any grammar errors")
-        if config["fix_spelling"]:
-            instructions.append("Correct spelling mistakes")
-        if config["improve_clarity"]:
-            instructions.append("Improve clarity and readability")
-        if config["check_consistency"]:
-            instructions.append("Ensure terminology consistency")
-        if config["rewrite_sentences"]:
-            instructions.append("Rewrite unclear sentences for better flow")
-        
-        if not instructions:
+        prefix = self._prompt_prefix()
+        if prefix is None:
             return text
         
-        prompt = f"""Enhance the following documentation text.
-
-Instructions:
-{chr(10).join(f'- {inst}' for inst in instructions)}
-
-Important:
-- Preserve all markdown formatting
-- Keep the same structure and organization
-- Don't add new content, only improve existing text
-- Maintain the original tone and style
-- Keep technical terms unchanged
-
-Text to enhance:
-
-{text}
-
-Return ONLY the enhanced text, no explanations or meta-commentary."""
+        # Check in-memory results, then the cache
+        cache_key = f"enhance_{self.enhancement_level}_{content_hash(text)}"
+        memoized = self._memo_get(cache_key)
+        if memoized is not None:
+            return memoized
         
-        # Check cache
-        cache_key = f"enhance_{self.enhancement_level}_{text[:100]}"
         if self.cache_manager:
             cached = self.cache_manager.get(
                 cache_key,
                 model=self.provider.model,
             )
             if cached:
+                self._memo_set(cache_key, cached)
                 return cached
         
         # Generate enhancement
         response = await self.provider.generate(
-            prompt=prompt,
-            system_prompt="You are an expert technical editor improving documentation quality.",
+            prompt=prefix + text + _ENHANCE_PROMPT_SUFFIX,
+            system_prompt=_ENHANCE_SYSTEM_PROMPT,
             temperature=0.3,  # Lower temperature for more consistent edits
         )
         
         enhanced = response.content.strip()
         
         # Cache result
+        self._memo_set(cache_key, enhanced)
         if self.cache_manager:
             self.cache_manager.set(cache_key, enhanced, model=self.provider.model)
         
         return enhanced
     
-    def _extract_frontmatter(self, content: str) -> tuple[str, Optional[str]]:
-        """Extract YAML frontmatter from content.
+    def _prompt_prefix(self) -> Optional[str]:
+        """Get the enhancement prompt up to the text, for the current level.
+        
+        Built once per level and reused for every chunk.
         
-        Args:
-            content: Markdown content
-            
         Returns:
-            Tuple of (content without frontmatter, frontmatter)
+            Prompt prefix, or None if the level enables no enhancements
         """
-        # Match YAML frontmatter (--- at start and end)
-        pattern = r'^---\s*\n(.*?)\n---\s*\n'
-        match = re.match(pattern, content, re.DOTALL)
-        
-        if match:
-            frontmatter = match.group(0)
-            content_without = content[len(frontmatter):]
-            return content_without, frontmatter
+        level = self.enhancement_level
+        if level not in self._prompt_prefixes:
+            config = self.level_configs.get(level, self.level_configs["moderate"])
+            instructions = [text for option, text in _INSTRUCTIONS if config[option]]
+            
+            self._prompt_prefixes[level] = None if not instructions else (
+                "Enhance the following documentation text.\n\n"
+                "Instructions:\n"
+                + "".join(f"- {instruction}\n" for instruction in instructions)
+                + "\n"
+                "Important:\n"
+                "- Preserve all markdown formatting\n"
+                "- Keep the same structure and organization\n"
+                "- Don't add new content, only improve existing text\n"
+                "- Maintain the original tone and style\n"
+                "- Keep technical terms unchanged\n\n"
+                "Text to enhance:\n\n"
+            )
         
-        return content, None
+        return self._prompt_prefixes[level]
     
-    def _restore_frontmatter(self, content: str, frontmatter: str) -> str:
-        """Restore frontmatter to content.
+    def _memo_get(self, key: str) -> Optional[Any]:
+        """Get an in-memory result, marking it recently used.
         
         Args:
-            content: Content without frontmatter
-            frontmatter: Frontmatter to restore
+            key: Result key
             
         Returns:
-            Content with frontmatter
+            Memoized result, or None if not present
         """
-        return frontmatter + content
+        value = self._memo.get(key)
+        if value is not None:
+            self._memo.move_to_end(key)
+        return value
     
-    def _extract_code_blocks(self, content: str) -> tuple[str, Dict[str, str]]:
-        """Extract code blocks from content.
+    def _memo_set(self, key: str, value: Any) -> None:
+        """Keep a result in memory, evicting the least recently used.
+        
+        Args:
+            key: Result key
+            value: Result to keep
+        """
+        if self.memo_size <= 0:
+            return
+        
+        self._memo[key] = value
+        self._memo.move_to_end(key)
+        if len(self._memo) > self.memo_size:
+            self._memo.popitem(last=False)
+    
+    def _extract_preserved(
+        self,
+        content: str,
+        preserve_code: bool = True,
+        preserve_frontmatter: bool = True,
+    ) -> tuple[str, Optional[str], Dict[str, str]]:
+        """Extract frontmatter and code blocks from content in one pass.
+        
+        Frontmatter is removed; code blocks are replaced by placeholders.
         
         Args:
             content: Markdown content
+            preserve_code: Whether to extract code blocks
+            preserve_frontmatter: Whether to extract frontmatter
             
         Returns:
-            Tuple of (content with placeholders, dict of code blocks)
+            Tuple of (content with placeholders, frontmatter, dict of code blocks)
         """
-        code_blocks = {}
-        counter = 0
-        
-        def replace_code_block(match):
-            nonlocal counter
-            placeholder = f"__CODE_BLOCK_{counter}__"
-            code_blocks[placeholder] = match.group(0)
-            counter += 1
-            return placeholder
+        # Cheap substring checks skip the regex scan for plain text
+        has_frontmatter = preserve_frontmatter and content.startswith('---')
+        has_code = preserve_code and ('`' in content or '~~~' in content)
+        if not (has_frontmatter or has_code):
+            return content, None, {}
         
-        # Match fenced code blocks (``` or ~~~)
-        pattern = r'```[\s\S]*?```|~~~[\s\S]*?~~~'
-        content_with_placeholders = re.sub(pattern, replace_code_block, content)
+        frontmatter = None
+        code_blocks = {}
         
-        # Also match inline code
-        def replace_inline_code(match):
-            nonlocal counter
-            placeholder = f"__INLINE_CODE_{counter}__"
+        def replace(match):
+            nonlocal frontmatter
+            if match.lastgroup == "frontmatter":
+                frontmatter = match.group(0)
+                return ""
+            
+            if not preserve_code:
+                return match.group(0)
+            kind = "CODE_BLOCK" if match.lastgroup == "fence" else "INLINE_CODE"
+            placeholder = f"__{kind}_{len(code_blocks)}__"
             code_blocks[placeholder] = match.group(0)
-            counter += 1
             return placeholder
         
-        pattern = r'`[^`\n]+`'
-        content_with_placeholders = re.sub(pattern, replace_inline_code, content_with_placeholders)
+        pattern = _PRESERVED if has_frontmatter else _CODE
+        content_with_placeholders = pattern.sub(replace, content)
         
-        return content_with_placeholders, code_blocks
+        return content_with_placeholders, frontmatter, code_blocks
     
     def _restore_code_blocks(self, content: str, code_blocks: Dict[str, str]) -> str:
         """Restore code blocks to content.
@@ -271,10 +455,14 @@ Return ONLY the enhanced text, no explanations or meta-commentary."""
         Returns:
             Content with code blocks restored
         """
-        for placeholder, code_block in code_blocks.items():
-            content = content.replace(placeholder, code_block)
+        if not code_blocks:
+            return content
         
-        return content
+        # Restore every placeholder in one pass over the content
+        return _CODE_PLACEHOLDER.sub(
+            lambda match: code_blocks.get(match.group(0), match.group(0)),
+            content,
+        )
     
     async def check_quality(self, content: str) -> Dict[str, Any]:
         """Check content quality and provide metrics.
@@ -285,6 +473,12 @@ Return ONLY the enhanced text, no explanations or meta-commentary."""
         Returns:
             Quality metrics dictionary
         """
+        memo_key = f"quality_{content_hash(content)}"
+        memoized = self._memo_get(memo_key)
+        if memoized is not None:
+            # Copied so callers can't alter the memoized metrics
+            return copy.deepcopy(memoized)
+        
         prompt = f"""Analyze the quality of this documentation and provide metrics.
 
 Content:
@@ -307,11 +501,11 @@ Return ONLY valid JSON, no other text."""
         )
         
         # Parse JSON response
-        import json
         try:
-            metrics = json.loads(response.content)
+            metrics = extract_json(response.content)
+            self._memo_set(memo_key, copy.deepcopy(metrics))
             return metrics
-        except json.JSONDecodeError:
+        except ValueError:
             # Fallback if AI doesn't return valid JSON
             return {
                 "grammar_score": 0,
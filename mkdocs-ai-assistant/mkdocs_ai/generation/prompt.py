@@ -1,6 +1,6 @@
 """Prompt-based document generation."""
 
-from typing import Optional
+from typing import AsyncIterator, Optional
 from pathlib import Path
 
 from ..providers import AIProvider, ProviderError
@@ -86,6 +86,64 @@ class PromptGenerator:
         
         return content
 
+    async def stream_from_prompt(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        **kwargs,
+    ) -> AsyncIterator[str]:
+        """Generate documentation from a prompt, yielding chunks as they arrive.
+        
+        Cached content is yielded as a single chunk; streamed content is
+        cached once the response is complete.
+        
+        Args:
+            prompt: User prompt describing what to generate
+            system_prompt: Optional system prompt for context
+            **kwargs: Additional provider parameters
+            
+        Yields:
+            Chunks of generated markdown content
+            
+        Raises:
+            ProviderError: If generation fails
+        """
+        # Build system prompt for documentation
+        if not system_prompt:
+            system_prompt = self._build_documentation_system_prompt()
+        
+        # Check cache first
+        if self.cache_manager:
+            cached = self.cache_manager.get(
+                prompt,
+                system_prompt=system_prompt,
+                model=self.provider.model,
+                **kwargs,
+            )
+            if cached:
+                yield cached
+                return
+        
+        # Stream content
+        chunks = []
+        async for chunk in self.provider.generate_stream(
+            prompt=prompt,
+            system_prompt=system_prompt,
+            **kwargs,
+        ):
+            chunks.append(chunk)
+            yield chunk
+        
+        # Cache the result
+        if self.cache_manager:
+            self.cache_manager.set(
+                prompt,
+                "".join(chunks),
+                system_prompt=system_prompt,
+                model=self.provider.model,
+                **kwargs,
+            )
+
     async def generate_from_template(
         self,
         template_path: str,
@@ -82,6 +82,7 @@ class AIAssistantPlugin(BasePlugin[AIAssistantConfig]):
                 "temperature": self.config.provider.temperature,
                 "max_tokens": self.config.provider.max_tokens,
                 "timeout": self.config.provider.timeout,
+                "prompt_caching": self.config.provider.prompt_caching,
             }
             
             self.provider = get_provider(provider_config)
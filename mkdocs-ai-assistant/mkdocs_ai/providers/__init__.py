@@ -1,10 +1,15 @@
 """AI provider abstraction layer."""
 
+from typing import Optional
+
+import httpx
+
 from .base import AIProvider, ProviderError, ProviderResponse
 from .openrouter import OpenRouterProvider
 from .gemini import GeminiProvider
 from .anthropic import AnthropicProvider
 from .ollama import OllamaProvider
+from .session import get_shared_session, close_shared_session, shared_session
 
 __all__ = [
     "AIProvider",
@@ -16,39 +21,57 @@ __all__ = [
     "OllamaProvider",
     "get_provider",
     "create_provider",
+    "get_shared_session",
+    "close_shared_session",
+    "shared_session",
 ]
 
+# Provider classes by configuration name
+_PROVIDERS = {
+    "openrouter": OpenRouterProvider,
+    "gemini": GeminiProvider,
+    "anthropic": AnthropicProvider,
+    "ollama": OllamaProvider,
+}
 
-def get_provider(config: dict) -> AIProvider:
-    """Factory function to get the appropriate provider."""
-    provider_name = config.get("name", "openrouter")
+
+def get_provider(config: dict, session: Optional[httpx.AsyncClient] = None) -> AIProvider:
+    """Factory function to get the appropriate provider.
     
-    providers = {
-        "openrouter": OpenRouterProvider,
-        "gemini": GeminiProvider,
-        "anthropic": AnthropicProvider,
-        "ollama": OllamaProvider,
-    }
+    Args:
+        config: Provider configuration
+        session: Optional HTTP client to reuse for all requests
     
-    provider_class = providers.get(provider_name)
+    Returns:
+        Configured provider instance
+    """
+    provider_name = config.get("name", "openrouter")
+    
+    provider_class = _PROVIDERS.get(provider_name)
     if not provider_class:
         raise ValueError(f"Unknown provider: {provider_name}")
     
-    return provider_class(config)
+    provider = provider_class(config)
+    provider.session = session
+    return provider
 
 
 def create_provider(
     provider_name: str = "openrouter",
     api_key: str = None,
     model: str = None,
+    session: Optional[httpx.AsyncClient] = None,
     **kwargs
 ) -> AIProvider:
     """Create a provider instance with simple parameters.
     
+    Every call returns a new instance; the caller owns its lifetime.
+    
     Args:
         provider_name: Name of provider (openrouter, gemini, anthropic, ollama)
         api_key: Optional API key
         model: Optional model name
+        session: Optional HTTP client to reuse for all requests
         **kwargs: Additional provider-specific parameters
     
     Returns:
@@ -64,4 +87,4 @@ def create_provider(
     if model:
         config["model"] = model
     
-    return get_provider(config)
+    return get_provider(config, session=session)
@@ -1,8 +1,8 @@
 """Anthropic Claude AI provider implementation."""
 
 import httpx
-from typing import Optional, Any
-from .base import AIProvider, ProviderError, ProviderResponse
+from typing import AsyncIterator, Optional, Any
+from .base import AIProvider, ProviderError, ProviderResponse, iter_sse_data
 
 
 class AnthropicProvider(AIProvider):
@@ -34,30 +34,15 @@ class AnthropicProvider(AIProvider):
         Returns:
             ProviderResponse with generated content
         """
-        headers = {
-            "x-api-key": self.api_key,
-            "anthropic-version": self.api_version,
-            "content-type": "application/json",
-        }
+        headers, payload = self._build_request(prompt, system_prompt, **kwargs)
         
-        payload = {
-            "model": kwargs.get("model", self.model),
-            "max_tokens": kwargs.get("max_tokens", self.max_tokens),
-            "temperature": kwargs.get("temperature", self.temperature),
-            "messages": [
-                {"role": "user", "content": prompt}
-            ],
-        }
-        
-        if system_prompt:
-            payload["system"] = system_prompt
-        
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
+        async with self._client() as client:
             try:
                 response = await client.post(
                     f"{self.base_url}/messages",
                     headers=headers,
                     json=payload,
+                    timeout=self.timeout,
                 )
                 response.raise_for_status()
                 data = response.json()
@@ -95,6 +80,33 @@ class AnthropicProvider(AIProvider):
             except (KeyError, IndexError) as e:
                 raise ProviderError(f"Invalid Anthropic response format: {str(e)}")
 
+    def _build_request(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        **kwargs: Any,
+    ) -> tuple[dict[str, str], dict[str, Any]]:
+        """Build headers and payload for a messages request."""
+        headers = {
+            "x-api-key": self.api_key,
+            "anthropic-version": self.api_version,
+            "content-type": "application/json",
+        }
+        
+        payload = {
+            "model": kwargs.get("model", self.model),
+            "max_tokens": kwargs.get("max_tokens", self.max_tokens),
+            "temperature": kwargs.get("temperature", self.temperature),
+            "messages": [
+                {"role": "user", "content": prompt}
+            ],
+        }
+        
+        if system_prompt:
+            payload["system"] = self._system_content(system_prompt)
+        
+        return headers, payload
+
     async def embed(self, text: str) -> list[float]:
         """Generate embeddings.
         
@@ -115,7 +127,47 @@ class AnthropicProvider(AIProvider):
         prompt: str,
         system_prompt: Optional[str] = None,
         **kwargs: Any,
-    ):
-        """Generate text with streaming (future implementation)."""
-        # TODO: Implement Anthropic streaming
-        raise NotImplementedError("Streaming not yet implemented for Anthropic")
+    ) -> AsyncIterator[str]:
+        """Generate text with streaming.
+        
+        Args:
+            prompt: User prompt
+            system_prompt: Optional system context
+            **kwargs: Additional parameters
+            
+        Yields:
+            Chunks of generated content
+        """
+        headers, payload = self._build_request(prompt, system_prompt, **kwargs)
+        payload["stream"] = True
+        
+        async with self._client() as client:
+            try:
+                async with client.stream(
+                    "POST",
+                    f"{self.base_url}/messages",
+                    headers=headers,
+                    json=payload,
+                    timeout=self.timeout,
+                ) as response:
+                    if response.is_error:
+                        await response.aread()
+                    response.raise_for_status()
+                    
+                    async for data in iter_sse_data(response):
+                        if data.get("type") == "error":
+                            raise ProviderError(f"Anthropic error: {data['error']}")
+                        
+                        if data.get("type") == "content_block_delta":
+                            text = data["delta"].get("text")
+                            if text:
+                                yield text
+                
+            except httpx.HTTPStatusError as e:
+                raise ProviderError(
+                    f"Anthropic HTTP error {e.response.status_code}: {e.response.text}"
+                )
+            except httpx.RequestError as e:
+                raise ProviderError(f"Anthropic request error: {str(e)}")
+            except KeyError as e:
+                raise ProviderError(f"Invalid Anthropic response format: {str(e)}")
@@ -1,8 +1,16 @@
 """Base AI provider interface."""
 
 from abc import ABC, abstractmethod
+from contextlib import asynccontextmanager
 from dataclasses import dataclass
-from typing import Optional, Any
+from typing import AsyncIterator, Optional, Any
+import asyncio
+import json
+
+import httpx
+
+from ..ratelimit import EVENT_HOOKS
+from .session import current_session
 
 
 class ProviderError(Exception):
@@ -42,6 +50,48 @@ class AIProvider(ABC):
         self.temperature = config.get("temperature", 0.7)
         self.max_tokens = config.get("max_tokens", 4000)
         self.timeout = config.get("timeout", 60)
+        self.prompt_caching = config.get("prompt_caching", False)
+        self.session: Optional[httpx.AsyncClient] = None
+
+    @asynccontextmanager
+    async def _client(self) -> AsyncIterator[httpx.AsyncClient]:
+        """Get an HTTP client for a request.
+        
+        Uses the provider's session or the shared session when one is open,
+        otherwise a client that is closed after the request. Clients created
+        here apply the per-host rate limiters.
+        
+        Yields:
+            HTTP client
+        """
+        session = self.session or current_session()
+        if session is not None:
+            yield session
+            return
+        
+        async with httpx.AsyncClient(timeout=self.timeout, event_hooks=EVENT_HOOKS) as client:
+            yield client
+
+    def _system_content(self, system_prompt: str) -> Any:
+        """Build system message content, marked for prompt caching if enabled.
+        
+        The system prompt is the stable prefix shared by all requests of one
+        kind, so providers supporting cache breakpoints can reuse it.
+        
+        Args:
+            system_prompt: System prompt
+            
+        Returns:
+            The prompt text, or a content block list with a cache breakpoint
+        """
+        if not self.prompt_caching:
+            return system_prompt
+        
+        return [{
+            "type": "text",
+            "text": system_prompt,
+            "cache_control": {"type": "ephemeral"},
+        }]
 
     @abstractmethod
     async def generate(
@@ -80,6 +130,30 @@ class AIProvider(ABC):
         """
         pass
 
+    async def generate_embeddings(self, texts: list[str]) -> list[list[float]]:
+        """Generate embeddings for several texts.
+        
+        Providers with a batch embeddings endpoint override this to embed
+        all texts in one request; this fallback embeds them one by one,
+        with at most the ``max_concurrency`` config (default 8) in flight.
+        
+        Args:
+            texts: Texts to embed
+            
+        Returns:
+            Embedding vectors, in the order of ``texts``
+            
+        Raises:
+            ProviderError: If embedding generation fails
+        """
+        semaphore = asyncio.Semaphore(self.config.get("max_concurrency", 8))
+        
+        async def run(text: str) -> list[float]:
+            async with semaphore:
+                return await self.embed(text)
+        
+        return list(await asyncio.gather(*(run(text) for text in texts)))
+
     @abstractmethod
     def supports_streaming(self) -> bool:
         """Check if provider supports streaming responses.
@@ -89,6 +163,31 @@ class AIProvider(ABC):
         """
         pass
 
+    async def generate_stream(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[str]:
+        """Generate text from a prompt, yielding chunks as they arrive.
+        
+        Providers without a streaming API inherit this fallback, which
+        yields the complete response as a single chunk.
+        
+        Args:
+            prompt: The user prompt
+            system_prompt: Optional system prompt for context
+            **kwargs: Additional provider-specific parameters
+            
+        Yields:
+            Chunks of generated content
+            
+        Raises:
+            ProviderError: If generation fails
+        """
+        response = await self.generate(prompt, system_prompt, **kwargs)
+        yield response.content
+
     def validate_config(self) -> None:
         """Validate provider configuration.
         
@@ -144,3 +243,23 @@ class AIProvider(ABC):
                 continue
         
         raise ProviderError(f"Failed after {max_retries} attempts: {last_error}")
+
+
+async def iter_sse_data(response: httpx.Response) -> AsyncIterator[dict[str, Any]]:
+    """Parse the JSON payloads of a server-sent events response.
+    
+    Args:
+        response: Streaming HTTP response
+        
+    Yields:
+        Decoded ``data:`` payloads, up to an optional ``[DONE]`` marker
+    """
+    async for line in response.aiter_lines():
+        if not line.startswith("data:"):
+            continue  # Event names, keep-alive comments and blank lines
+        
+        data = line[5:].strip()
+        if data == "[DONE]":
+            break
+        if data:
+            yield json.loads(data)
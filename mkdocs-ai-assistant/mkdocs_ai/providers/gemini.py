@@ -1,8 +1,8 @@
 """Google Gemini AI provider implementation."""
 
 import httpx
-from typing import Optional, Any
-from .base import AIProvider, ProviderError, ProviderResponse
+from typing import AsyncIterator, Optional, Any
+from .base import AIProvider, ProviderError, ProviderResponse, iter_sse_data
 
 
 class GeminiProvider(AIProvider):
@@ -37,34 +37,18 @@ class GeminiProvider(AIProvider):
         Returns:
             ProviderResponse with generated content
         """
-        # Combine system prompt and user prompt for Gemini
-        full_prompt = prompt
-        if system_prompt:
-            full_prompt = f"{system_prompt}\n\n{prompt}"
-        
-        payload = {
-            "contents": [
-                {
-                    "parts": [
-                        {"text": full_prompt}
-                    ]
-                }
-            ],
-            "generationConfig": {
-                "temperature": kwargs.get("temperature", self.temperature),
-                "maxOutputTokens": kwargs.get("max_tokens", self.max_tokens),
-            },
-        }
+        payload = self._build_payload(prompt, system_prompt, **kwargs)
         
         url = f"{self.base_url}/models/{self.model}:generateContent"
         params = {"key": self.api_key}
         
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
+        async with self._client() as client:
             try:
                 response = await client.post(
                     url,
                     params=params,
                     json=payload,
+                    timeout=self.timeout,
                 )
                 response.raise_for_status()
                 data = response.json()
@@ -102,6 +86,32 @@ class GeminiProvider(AIProvider):
             except (KeyError, IndexError) as e:
                 raise ProviderError(f"Invalid Gemini response format: {str(e)}")
 
+    def _build_payload(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        **kwargs: Any,
+    ) -> dict[str, Any]:
+        """Build the payload for a content generation request."""
+        # Combine system prompt and user prompt for Gemini
+        full_prompt = prompt
+        if system_prompt:
+            full_prompt = f"{system_prompt}\n\n{prompt}"
+        
+        return {
+            "contents": [
+                {
+                    "parts": [
+                        {"text": full_prompt}
+                    ]
+                }
+            ],
+            "generationConfig": {
+                "temperature": kwargs.get("temperature", self.temperature),
+                "maxOutputTokens": kwargs.get("max_tokens", self.max_tokens),
+            },
+        }
+
     async def embed(self, text: str) -> list[float]:
         """Generate embeddings using Gemini.
         
@@ -119,12 +129,13 @@ class GeminiProvider(AIProvider):
             }
         }
         
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
+        async with self._client() as client:
             try:
                 response = await client.post(
                     url,
                     params=params,
                     json=payload,
+                    timeout=self.timeout,
                 )
                 response.raise_for_status()
                 data = response.json()
@@ -136,6 +147,52 @@ class GeminiProvider(AIProvider):
             except (KeyError, IndexError) as e:
                 raise ProviderError(f"Invalid embedding response: {str(e)}")
 
+    async def generate_embeddings(self, texts: list[str]) -> list[list[float]]:
+        """Generate embeddings for several texts in one request.
+        
+        Args:
+            texts: Texts to embed
+            
+        Returns:
+            Embedding vectors, in the order of ``texts``
+        """
+        embedding_model = "embedding-001"
+        url = f"{self.base_url}/models/{embedding_model}:batchEmbedContents"
+        params = {"key": self.api_key}
+        
+        payload = {
+            "requests": [
+                {
+                    "model": f"models/{embedding_model}",
+                    "content": {"parts": [{"text": text}]},
+                }
+                for text in texts
+            ]
+        }
+        
+        async with self._client() as client:
+            try:
+                response = await client.post(
+                    url,
+                    params=params,
+                    json=payload,
+                    timeout=self.timeout,
+                )
+                response.raise_for_status()
+                data = response.json()
+                
+                embeddings = [item["values"] for item in data["embeddings"]]
+                if len(embeddings) != len(texts):
+                    raise ProviderError(
+                        f"Expected {len(texts)} embeddings, got {len(embeddings)}"
+                    )
+                return embeddings
+                
+            except httpx.HTTPStatusError as e:
+                raise ProviderError(f"Gemini embedding error: {e.response.status_code}")
+            except (KeyError, IndexError) as e:
+                raise ProviderError(f"Invalid embedding response: {str(e)}")
+
     def supports_streaming(self) -> bool:
         """Gemini supports streaming."""
         return True
@@ -145,7 +202,47 @@ class GeminiProvider(AIProvider):
         prompt: str,
         system_prompt: Optional[str] = None,
         **kwargs: Any,
-    ):
-        """Generate text with streaming (future implementation)."""
-        # TODO: Implement Gemini streaming
-        raise NotImplementedError("Streaming not yet implemented for Gemini")
+    ) -> AsyncIterator[str]:
+        """Generate text with streaming.
+        
+        Args:
+            prompt: User prompt
+            system_prompt: Optional system context
+            **kwargs: Additional parameters
+            
+        Yields:
+            Chunks of generated content
+        """
+        payload = self._build_payload(prompt, system_prompt, **kwargs)
+        
+        url = f"{self.base_url}/models/{self.model}:streamGenerateContent"
+        params = {"key": self.api_key, "alt": "sse"}
+        
+        async with self._client() as client:
+            try:
+                async with client.stream(
+                    "POST",
+                    url,
+                    params=params,
+                    json=payload,
+                    timeout=self.timeout,
+                ) as response:
+                    if response.is_error:
+                        await response.aread()
+                    response.raise_for_status()
+                    
+                    async for data in iter_sse_data(response):
+                        if "error" in data:
+                            raise ProviderError(f"Gemini error: {data['error']}")
+                        
+                        for candidate in data.get("candidates", [])[:1]:
+                            for part in candidate.get("content", {}).get("parts", []):
+                                if part.get("text"):
+                                    yield part["text"]
+                
+            except httpx.HTTPStatusError as e:
+                raise ProviderError(
+                    f"Gemini HTTP error {e.response.status_code}: {e.response.text}"
+                )
+            except httpx.RequestError as e:
+                raise ProviderError(f"Gemini request error: {str(e)}")
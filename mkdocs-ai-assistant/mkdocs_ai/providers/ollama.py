@@ -1,7 +1,8 @@
 """Ollama local LLM provider implementation."""
 
 import httpx
-from typing import Optional, Any
+import json
+from typing import AsyncIterator, Optional, Any
 from .base import AIProvider, ProviderError, ProviderResponse
 
 
@@ -38,24 +39,14 @@ class OllamaProvider(AIProvider):
         Returns:
             ProviderResponse with generated content
         """
-        payload = {
-            "model": kwargs.get("model", self.model),
-            "prompt": prompt,
-            "stream": False,
-            "options": {
-                "temperature": kwargs.get("temperature", self.temperature),
-                "num_predict": kwargs.get("max_tokens", self.max_tokens),
-            },
-        }
-        
-        if system_prompt:
-            payload["system"] = system_prompt
+        payload = self._build_payload(prompt, system_prompt, stream=False, **kwargs)
         
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
+        async with self._client() as client:
             try:
                 response = await client.post(
                     f"{self.base_url}/api/generate",
                     json=payload,
+                    timeout=self.timeout,
                 )
                 response.raise_for_status()
                 data = response.json()
@@ -89,6 +80,29 @@ class OllamaProvider(AIProvider):
             except (KeyError, IndexError) as e:
                 raise ProviderError(f"Invalid Ollama response format: {str(e)}")
 
+    def _build_payload(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        stream: bool = False,
+        **kwargs: Any,
+    ) -> dict[str, Any]:
+        """Build the payload for a generate request."""
+        payload = {
+            "model": kwargs.get("model", self.model),
+            "prompt": prompt,
+            "stream": stream,
+            "options": {
+                "temperature": kwargs.get("temperature", self.temperature),
+                "num_predict": kwargs.get("max_tokens", self.max_tokens),
+            },
+        }
+        
+        if system_prompt:
+            payload["system"] = system_prompt
+        
+        return payload
+
     async def embed(self, text: str) -> list[float]:
         """Generate embeddings using Ollama.
         
@@ -99,11 +113,12 @@ class OllamaProvider(AIProvider):
             "prompt": text,
         }
         
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
+        async with self._client() as client:
             try:
                 response = await client.post(
                     f"{self.base_url}/api/embeddings",
                     json=payload,
+                    timeout=self.timeout,
                 )
                 response.raise_for_status()
                 data = response.json()
@@ -115,6 +130,44 @@ class OllamaProvider(AIProvider):
             except (KeyError, IndexError) as e:
                 raise ProviderError(f"Invalid embedding response: {str(e)}")
 
+    async def generate_embeddings(self, texts: list[str]) -> list[list[float]]:
+        """Generate embeddings for several texts in one request.
+        
+        Uses the ``/api/embed`` endpoint, which accepts a list of inputs.
+        
+        Args:
+            texts: Texts to embed
+            
+        Returns:
+            Embedding vectors, in the order of ``texts``
+        """
+        payload = {
+            "model": "nomic-embed-text",  # Default embedding model
+            "input": texts,
+        }
+        
+        async with self._client() as client:
+            try:
+                response = await client.post(
+                    f"{self.base_url}/api/embed",
+                    json=payload,
+                    timeout=self.timeout,
+                )
+                response.raise_for_status()
+                data = response.json()
+                
+                embeddings = data["embeddings"]
+                if len(embeddings) != len(texts):
+                    raise ProviderError(
+                        f"Expected {len(texts)} embeddings, got {len(embeddings)}"
+                    )
+                return embeddings
+                
+            except httpx.HTTPStatusError as e:
+                raise ProviderError(f"Ollama embedding error: {e.response.status_code}")
+            except (KeyError, IndexError) as e:
+                raise ProviderError(f"Invalid embedding response: {str(e)}")
+
     def supports_streaming(self) -> bool:
         """Ollama supports streaming."""
         return True
@@ -124,10 +177,55 @@ class OllamaProvider(AIProvider):
         prompt: str,
         system_prompt: Optional[str] = None,
         **kwargs: Any,
-    ):
-        """Generate text with streaming (future implementation)."""
-        # TODO: Implement Ollama streaming
-        raise NotImplementedError("Streaming not yet implemented for Ollama")
+    ) -> AsyncIterator[str]:
+        """Generate text with streaming.
+        
+        Ollama streams one JSON object per line.
+        
+        Args:
+            prompt: User prompt
+            system_prompt: Optional system context
+            **kwargs: Additional parameters
+            
+        Yields:
+            Chunks of generated content
+        """
+        payload = self._build_payload(prompt, system_prompt, stream=True, **kwargs)
+        
+        async with self._client() as client:
+            try:
+                async with client.stream(
+                    "POST",
+                    f"{self.base_url}/api/generate",
+                    json=payload,
+                    timeout=self.timeout,
+                ) as response:
+                    if response.is_error:
+                        await response.aread()
+                    response.raise_for_status()
+                    
+                    async for line in response.aiter_lines():
+                        if not line:
+                            continue
+                        
+                        data = json.loads(line)
+                        if "error" in data:
+                            raise ProviderError(f"Ollama error: {data['error']}")
+                        
+                        if data.get("response"):
+                            yield data["response"]
+                        if data.get("done"):
+                            break
+                
+            except httpx.HTTPStatusError as e:
+                raise ProviderError(
+                    f"Ollama HTTP error {e.response.status_code}: {e.response.text}"
+                )
+            except httpx.RequestError as e:
+                raise ProviderError(
+                    f"Ollama request error: {str(e)}. "
+                    f"Is Ollama running at {self.base_url}?"
+                )
 
     async def check_model_available(self) -> bool:
         """Check if the specified model is available locally.
@@ -135,9 +233,9 @@ class OllamaProvider(AIProvider):
         Returns:
             True if model is available
         """
-        async with httpx.AsyncClient(timeout=10) as client:
+        async with self._client() as client:
             try:
-                response = await client.get(f"{self.base_url}/api/tags")
+                response = await client.get(f"{self.base_url}/api/tags", timeout=10)
                 response.raise_for_status()
                 data = response.json()
                 
@@ -1,8 +1,8 @@
 """OpenRouter AI provider implementation."""
 
 import httpx
-from typing import Optional, Any
-from .base import AIProvider, ProviderError, ProviderResponse
+from typing import AsyncIterator, Optional, Any
+from .base import AIProvider, ProviderError, ProviderResponse, iter_sse_data
 
 
 class OpenRouterProvider(AIProvider):
@@ -35,10 +35,32 @@ class OpenRouterProvider(AIProvider):
         Returns:
             ProviderResponse with generated content
         """
+        headers, payload = self._build_request(prompt, system_prompt, **kwargs)
+        
+        # Try primary model
+        try:
+            return await self._make_request(headers, payload)
+        except ProviderError as e:
+            # Try fallback model if configured
+            if self.fallback_model:
+                payload["model"] = self.fallback_model
+                try:
+                    return await self._make_request(headers, payload)
+                except ProviderError:
+                    pass  # Fall through to raise original error
+            raise e
+
+    def _build_request(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        **kwargs: Any,
+    ) -> tuple[dict[str, str], dict[str, Any]]:
+        """Build headers and payload for a chat completion request."""
         messages = []
         
         if system_prompt:
-            messages.append({"role": "system", "content": system_prompt})
+            messages.append({"role": "system", "content": self._system_content(system_prompt)})
         
         messages.append({"role": "user", "content": prompt})
         
@@ -56,18 +78,7 @@ class OpenRouterProvider(AIProvider):
             "max_tokens": kwargs.get("max_tokens", self.max_tokens),
         }
         
-        # Try primary model
-        try:
-            return await self._make_request(headers, payload)
-        except ProviderError as e:
-            # Try fallback model if configured
-            if self.fallback_model:
-                payload["model"] = self.fallback_model
-                try:
-                    return await self._make_request(headers, payload)
-                except ProviderError:
-                    pass  # Fall through to raise original error
-            raise e
+        return headers, payload
 
     async def _make_request(
         self,
@@ -75,12 +86,13 @@ class OpenRouterProvider(AIProvider):
         payload: dict[str, Any],
     ) -> ProviderResponse:
         """Make HTTP request to OpenRouter API."""
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
+        async with self._client() as client:
             try:
                 response = await client.post(
                     f"{self.base_url}/chat/completions",
                     headers=headers,
                     json=payload,
+                    timeout=self.timeout,
                 )
                 response.raise_for_status()
                 data = response.json()
@@ -114,6 +126,18 @@ class OpenRouterProvider(AIProvider):
         
         Note: OpenRouter supports embeddings through specific models.
         """
+        embeddings = await self.generate_embeddings([text])
+        return embeddings[0]
+
+    async def generate_embeddings(self, texts: list[str]) -> list[list[float]]:
+        """Generate embeddings for several texts in one request.
+        
+        Args:
+            texts: Texts to embed
+            
+        Returns:
+            Embedding vectors, in the order of ``texts``
+        """
         headers = {
             "Authorization": f"Bearer {self.api_key}",
             "Content-Type": "application/json",
@@ -121,20 +145,27 @@ class OpenRouterProvider(AIProvider):
         
         payload = {
             "model": "text-embedding-3-small",  # OpenAI embedding model via OpenRouter
-            "input": text,
+            "input": texts,
         }
         
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
+        async with self._client() as client:
             try:
                 response = await client.post(
                     f"{self.base_url}/embeddings",
                     headers=headers,
                     json=payload,
+                    timeout=self.timeout,
                 )
                 response.raise_for_status()
                 data = response.json()
                 
-                return data["data"][0]["embedding"]
+                # Results carry their input index and may come back reordered
+                items = sorted(data["data"], key=lambda item: item["index"])
+                if len(items) != len(texts):
+                    raise ProviderError(
+                        f"Expected {len(texts)} embeddings, got {len(items)}"
+                    )
+                return [item["embedding"] for item in items]
                 
             except httpx.HTTPStatusError as e:
                 raise ProviderError(f"Embedding error: {e.response.status_code}")
@@ -150,10 +181,44 @@ class OpenRouterProvider(AIProvider):
         prompt: str,
         system_prompt: Optional[str] = None,
         **kwargs: Any,
-    ):
-        """Generate text with streaming (future implementation).
+    ) -> AsyncIterator[str]:
+        """Generate text with streaming.
         
-        This is a placeholder for future streaming support.
+        Args:
+            prompt: User prompt
+            system_prompt: Optional system context
+            **kwargs: Additional parameters (temperature, max_tokens, etc.)
+            
+        Yields:
+            Chunks of generated content
         """
-        # TODO: Implement streaming in future version
-        raise NotImplementedError("Streaming not yet implemented")
+        headers, payload = self._build_request(prompt, system_prompt, **kwargs)
+        payload["stream"] = True
+        
+        async with self._client() as client:
+            try:
+                async with client.stream(
+                    "POST",
+                    f"{self.base_url}/chat/completions",
+                    headers=headers,
+                    json=payload,
+                    timeout=self.timeout,
+                ) as response:
+                    if response.is_error:
+                        await response.aread()
+                    response.raise_for_status()
+                    
+                    async for data in iter_sse_data(response):
+                        if "error" in data:
+                            raise ProviderError(f"OpenRouter error: {data['error']}")
+                        
+                        content = data["choices"][0]["delta"].get("content")
+                        if content:
+                            yield content
+                
+            except httpx.HTTPStatusError as e:
+                raise ProviderError(f"HTTP error: {e.response.status_code} - {e.response.text}")
+            except httpx.RequestError as e:
+                raise ProviderError(f"Request error: {str(e)}")
+            except (KeyError, IndexError) as e:
+                raise ProviderError(f"Invalid response format: {str(e)}")
@@ -0,0 +1,81 @@
+"""Shared HTTP client for AI providers."""
+
+import asyncio
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional
+
+import httpx
+
+from ..ratelimit import EVENT_HOOKS
+
+# Connection pool limits for the shared client; httpx pools per host, so
+# keep-alive connections are what cap the reuse per provider endpoint
+SHARED_LIMITS = httpx.Limits(
+    max_connections=256,
+    max_keepalive_connections=64,
+    keepalive_expiry=300,
+)
+
+_session: Optional[httpx.AsyncClient] = None
+_session_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def get_shared_session() -> httpx.AsyncClient:
+    """Get the shared HTTP client, creating it on first use.
+
+    Connections are bound to an event loop, so a new client is created
+    when called from a different loop than the current one.
+
+    Returns:
+        Shared HTTP client
+    """
+    global _session, _session_loop
+
+    loop = asyncio.get_running_loop()
+    if _session is None or _session.is_closed or _session_loop is not loop:
+        _session = httpx.AsyncClient(limits=SHARED_LIMITS, event_hooks=EVENT_HOOKS)
+        _session_loop = loop
+
+    return _session
+
+
+def current_session() -> Optional[httpx.AsyncClient]:
+    """Get the shared HTTP client if one is open on the running loop.
+
+    Returns:
+        Shared HTTP client or None
+    """
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+    if _session is None or _session.is_closed or _session_loop is not loop:
+        return None
+
+    return _session
+
+
+async def close_shared_session() -> None:
+    """Close the shared HTTP client if it is open."""
+    global _session, _session_loop
+
+    session, _session, _session_loop = _session, None, None
+    if session is not None and not session.is_closed:
+        await session.aclose()
+
+
+@asynccontextmanager
+async def shared_session() -> AsyncIterator[httpx.AsyncClient]:
+    """Scope a shared HTTP client to a block of provider calls.
+
+    Providers without an explicit session reuse this client, and its
+    connections, until the block exits.
+
+    Yields:
+        Shared HTTP client
+    """
+    try:
+        yield get_shared_session()
+    finally:
+        await close_shared_session()
@@ -0,0 +1,278 @@
+"""Client-side rate limiting for AI provider requests.
+
+Limiters are kept per API host, created on the host's first request, and
+consulted by HTTP event hooks installed on provider clients, so every
+provider request waits for a token before it is sent. Request rates adapt
+AIMD-style: halved when the provider answers 429, raised by a fixed step
+after each successful response, up to the configured ceiling.
+"""
+
+import asyncio
+import time
+from collections import deque
+from typing import Deque, Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+import httpx
+
+# Default sustainable ceilings per provider: (requests, tokens) per minute.
+# Local Ollama servers are not limited.
+PROVIDER_LIMITS: Dict[str, Tuple[Optional[int], Optional[int]]] = {
+    "anthropic": (50, 40_000),
+    "openrouter": (60, None),
+    "gemini": (60, 1_000_000),
+    "ollama": (None, None),
+}
+
+# Default API hosts of the providers above
+PROVIDER_HOSTS = {
+    "api.anthropic.com": "anthropic",
+    "openrouter.ai": "openrouter",
+    "generativelanguage.googleapis.com": "gemini",
+}
+
+# Rough characters per token when estimating request size
+CHARS_PER_TOKEN = 4
+
+# Host -> limiter, or None for hosts without any limit
+_limiters: Dict[str, Optional["RateLimiter"]] = {}
+_overrides: Dict[str, Optional[int]] = {"rpm": None, "tpm": None}
+
+
+class RateLimiter:
+    """Request and token budget for one API host.
+
+    Requests draw from a token bucket holding up to ``rpm`` requests and
+    refilled at the current request rate, so bursts up to the ceiling go
+    out at once and only sustained load is spaced out. A sliding one-minute
+    window keeps estimated tokens under the token ceiling. Slots are
+    reserved synchronously, so no lock is needed and the limiter can be
+    shared between event loops.
+    """
+
+    def __init__(
+        self,
+        rpm: Optional[float] = None,
+        tpm: Optional[int] = None,
+        alpha: float = 1.0,
+    ):
+        """Initialize limiter.
+
+        Args:
+            rpm: Maximum requests per minute (None for no request limit)
+            tpm: Maximum estimated tokens per minute (None for no token limit)
+            alpha: Requests per minute added to the rate after each success
+        """
+        self.rpm = rpm
+        self.tpm = tpm
+        self.alpha = alpha
+        self.rate = rpm
+        # Requests available in the bucket (negative while reservations
+        # wait for a refill) and when it was last refilled
+        self._tokens = float(rpm or 0)
+        self._refilled: Optional[float] = None
+        self._blocked_until = 0.0
+        self._last_decrease = 0.0
+        self._window: Deque[Tuple[float, int]] = deque()
+        self._window_tokens = 0
+
+    def configure(self, rpm: Optional[float] = None, tpm: Optional[int] = None) -> None:
+        """Change the ceilings, keeping the current rate if it is lower.
+
+        Args:
+            rpm: Maximum requests per minute
+            tpm: Maximum estimated tokens per minute
+        """
+        self.rpm = rpm
+        self.tpm = tpm
+        self.rate = min(self.rate, rpm) if self.rate and rpm else rpm
+        if rpm:
+            self._tokens = min(self._tokens, rpm)
+
+    async def acquire(self, tokens: int = 0) -> None:
+        """Wait until a request of the given size may be sent.
+
+        Args:
+            tokens: Estimated tokens used by the request
+        """
+        now = time.monotonic()
+        delay = self._reserve(tokens, now)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def _reserve(self, tokens: int, now: float) -> float:
+        """Reserve the next free slot for a request.
+
+        Args:
+            tokens: Estimated tokens used by the request
+            now: Current monotonic time
+
+        Returns:
+            Seconds to wait before sending
+        """
+        start = max(now, self._blocked_until)
+
+        if self.rate:
+            if self._refilled is not None:
+                self._tokens += (now - self._refilled) * self.rate / 60
+                self._tokens = min(self._tokens, self.rpm or self.rate)
+            self._refilled = now
+            self._tokens -= 1
+            if self._tokens < 0:
+                start = max(start, now - self._tokens * 60 / self.rate)
+
+        if self.tpm and tokens:
+            window = self._window
+            while window and window[0][0] <= start - 60:
+                self._window_tokens -= window.popleft()[1]
+            # Wait for the oldest requests to leave the window until this one fits
+            while window and self._window_tokens + tokens > self.tpm:
+                sent, used = window.popleft()
+                self._window_tokens -= used
+                start = max(start, sent + 60)
+            window.append((start, tokens))
+            self._window_tokens += tokens
+
+        return start - now
+
+    def on_success(self) -> None:
+        """Raise the request rate by one step after a successful response."""
+        if self.rate and self.rpm and self.rate < self.rpm:
+            self.rate = min(self.rpm, self.rate + self.alpha)
+
+    def on_throttle(self, retry_after: Optional[float] = None) -> None:
+        """Back off after the provider rejected a request as rate limited.
+
+        The rate is halved at most once per second, so a burst of rejected
+        in-flight requests counts as a single congestion signal, and the
+        bucket is emptied so the next requests wait for a refill.
+
+        Args:
+            retry_after: Seconds the provider asked to wait, if any
+        """
+        now = time.monotonic()
+        if self.rate and now - self._last_decrease >= 1.0:
+            self.rate = max(1.0, self.rate / 2)
+            self._tokens = min(self._tokens, 0.0)
+            self._last_decrease = now
+        if retry_after:
+            self._blocked_until = max(self._blocked_until, now + retry_after)
+
+    def update(self, response: httpx.Response) -> None:
+        """Adjust the rate from a provider response.
+
+        Args:
+            response: HTTP response (headers are enough)
+        """
+        if response.status_code == 429:
+            self.on_throttle(_retry_after(response))
+        elif response.status_code < 400:
+            remaining = response.headers.get(
+                "x-ratelimit-remaining-requests",
+                response.headers.get("x-ratelimit-remaining"),
+            )
+            # Hold the rate while the provider reports an exhausted budget
+            if remaining != "0":
+                self.on_success()
+
+
+def configure_defaults(rpm: Optional[int] = None, tpm: Optional[int] = None) -> None:
+    """Override the default ceilings of every API host.
+
+    Args:
+        rpm: Requests per minute for every provider
+        tpm: Tokens per minute for every provider
+    """
+    _overrides["rpm"] = rpm
+    _overrides["tpm"] = tpm
+    _limiters.clear()
+
+
+def set_rate_limit(
+    base_url: str,
+    provider_name: Optional[str] = None,
+    rpm: Optional[int] = None,
+    tpm: Optional[int] = None,
+) -> Optional[RateLimiter]:
+    """Configure the limiter for a provider's API host.
+
+    Explicit limits win over CLI overrides, which win over the provider's
+    defaults. Providers sharing a host share one limiter.
+
+    Args:
+        base_url: Provider API base URL
+        provider_name: Provider name for default limits
+        rpm: Requests per minute
+        tpm: Tokens per minute
+
+    Returns:
+        Limiter for the host, or None without a host or any limit
+    """
+    host = urlsplit(base_url or "").hostname
+    default_rpm, default_tpm = PROVIDER_LIMITS.get(provider_name, (None, None))
+    rpm = rpm or _overrides["rpm"] or default_rpm
+    tpm = tpm or _overrides["tpm"] or default_tpm
+
+    if not host or not (rpm or tpm):
+        return None
+
+    limiter = _limiters.get(host)
+    if limiter is None:
+        limiter = _limiters[host] = RateLimiter(rpm, tpm)
+    else:
+        limiter.configure(rpm, tpm)
+    return limiter
+
+
+def get_rate_limiter(host: str) -> Optional[RateLimiter]:
+    """Get the limiter for an API host, if it has any limit.
+
+    Hosts without an explicitly set limiter get one from the CLI overrides
+    or, for the providers' default hosts, the provider's defaults.
+
+    Args:
+        host: API host name
+
+    Returns:
+        Limiter for the host, or None without any limit
+    """
+    if host not in _limiters:
+        default_rpm, default_tpm = PROVIDER_LIMITS.get(PROVIDER_HOSTS.get(host), (None, None))
+        rpm = _overrides["rpm"] or default_rpm
+        tpm = _overrides["tpm"] or default_tpm
+        _limiters[host] = RateLimiter(rpm, tpm) if rpm or tpm else None
+    return _limiters[host]
+
+
+def _retry_after(response: httpx.Response) -> Optional[float]:
+    """Read a numeric Retry-After header."""
+    try:
+        return float(response.headers["retry-after"])
+    except (KeyError, ValueError):
+        return None
+
+
+def _estimate_tokens(request: httpx.Request) -> int:
+    """Estimate the prompt tokens of a request from its body size."""
+    try:
+        return len(request.content) // CHARS_PER_TOKEN
+    except httpx.RequestNotRead:
+        return 0
+
+
+async def _before_request(request: httpx.Request) -> None:
+    """Event hook waiting for the host's limiter before sending."""
+    limiter = get_rate_limiter(request.url.host)
+    if limiter is not None:
+        await limiter.acquire(_estimate_tokens(request))
+
+
+async def _after_response(response: httpx.Response) -> None:
+    """Event hook feeding response status back into the host's limiter."""
+    limiter = get_rate_limiter(response.request.url.host)
+    if limiter is not None:
+        limiter.update(response)
+
+
+# httpx event hooks applying the limiters to a client
+EVENT_HOOKS = {"request": [_before_request], "response": [_after_response]}
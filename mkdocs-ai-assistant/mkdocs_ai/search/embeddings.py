@@ -1,11 +1,17 @@
 """Embedding generation for semantic search."""
 
 from typing import List, Dict, Any, Optional
+import asyncio
 import hashlib
 import re
+import struct
 
 from ..providers import AIProvider
-from ..cache import CacheManager
+from ..cache import CacheManager, content_hash
+
+# Code removed before chunking, and the sentence boundaries chunks follow
+_CODE = re.compile(r'```[\s\S]*?```|`[^`\n]+`')
+_SENTENCE_SPLIT = re.compile(r'[.!?]+\s+')
 
 
 class EmbeddingGenerator:
@@ -24,6 +30,8 @@ class EmbeddingGenerator:
         cache_manager: Optional[CacheManager] = None,
         chunk_size: int = 1000,
         chunk_overlap: int = 200,
+        max_concurrency: Optional[int] = None,
+        batch_size: int = 64,
     ):
         """Initialize generator.
         
@@ -32,11 +40,19 @@ class EmbeddingGenerator:
             cache_manager: Optional cache manager
             chunk_size: Maximum characters per chunk
             chunk_overlap: Overlap between chunks
+            max_concurrency: Maximum number of concurrent embedding requests
+                (defaults to the provider's ``max_concurrency`` config, or 8)
+            batch_size: Maximum number of texts per provider embedding request
         """
         self.provider = provider
         self.cache_manager = cache_manager
         self.chunk_size = chunk_size
         self.chunk_overlap = chunk_overlap
+        self.batch_size = batch_size
+        # Shared by all batches, so concurrent documents share the limit too
+        self._semaphore = asyncio.Semaphore(
+            max_concurrency or provider.config.get("max_concurrency", 8)
+        )
     
     async def generate_embedding(self, text: str) -> List[float]:
         """Generate embedding for text.
@@ -47,27 +63,22 @@ class EmbeddingGenerator:
         Returns:
             Embedding vector
         """
+        # Encode once for the cache key and the fallback embedding
+        encoded = text.encode()
+        
         # Check cache
-        cache_key = self._get_cache_key(text)
+        cache_key = self._get_cache_key(text, encoded)
         if self.cache_manager:
             cached = self.cache_manager.get(cache_key)
             if cached:
                 return cached
         
         # Generate embedding using provider
-        # Note: This uses the provider's embedding capability
-        # For providers without native embedding support, we use a simple approach
+        # For providers without embedding support, fall back to a simple approach
         try:
-            # Try to use provider's embedding method if available
-            if hasattr(self.provider, 'generate_embedding'):
-                embedding = await self.provider.generate_embedding(text)
-            else:
-                # Fallback: Use AI to generate a semantic representation
-                # This is a simplified approach - in production, use dedicated embedding models
-                embedding = await self._generate_simple_embedding(text)
-        except Exception as e:
-            # Fallback to simple embedding
-            embedding = await self._generate_simple_embedding(text)
+            embedding = (await self._provider_embeddings([text]))[0]
+        except Exception:
+            embedding = await self._generate_simple_embedding(text, encoded)
         
         # Cache result
         if self.cache_manager:
@@ -75,7 +86,29 @@ class EmbeddingGenerator:
         
         return embedding
     
-    async def _generate_simple_embedding(self, text: str) -> List[float]:
+    async def _provider_embeddings(self, texts: List[str]) -> List[List[float]]:
+        """Embed texts with the provider, in one request where supported.
+        
+        Args:
+            texts: Texts to embed
+            
+        Returns:
+            Embedding vectors, in the order of ``texts``
+            
+        Raises:
+            ProviderError: If the provider cannot generate embeddings
+        """
+        if hasattr(self.provider, 'generate_embeddings'):
+            return await self.provider.generate_embeddings(texts)
+        
+        # Providers without a batch method embed one text per request
+        return list(await asyncio.gather(*(self.provider.embed(text) for text in texts)))
+    
+    async def _generate_simple_embedding(
+        self,
+        text: str,
+        encoded: Optional[bytes] = None,
+    ) -> List[float]:
         """Generate a simple embedding using AI provider.
         
         This is a fallback method that creates a semantic representation.
@@ -83,26 +116,21 @@ class EmbeddingGenerator:
         
         Args:
             text: Text to embed
+            encoded: The text as UTF-8 bytes, if already encoded
             
         Returns:
             Embedding vector (384 dimensions)
         """
         # Create a deterministic hash-based embedding as fallback
         # This ensures consistent results without API calls
-        text_hash = hashlib.sha256(text.encode()).digest()
+        text_hash = hashlib.sha256(encoded if encoded is not None else text.encode()).digest()
         
-        # Convert hash to normalized float vector (384 dimensions)
-        embedding = []
-        for i in range(0, len(text_hash), 2):
-            if i + 1 < len(text_hash):
-                value = (text_hash[i] * 256 + text_hash[i + 1]) / 65535.0
-                embedding.append(value * 2 - 1)  # Normalize to [-1, 1]
+        # Read the digest as big-endian 16-bit values, normalized to [-1, 1]
+        values = struct.unpack(f'>{len(text_hash) // 2}H', text_hash)
+        embedding = [value / 65535.0 * 2 - 1 for value in values]
         
         # Pad to 384 dimensions
-        while len(embedding) < 384:
-            embedding.append(0.0)
-        
-        return embedding[:384]
+        return embedding + [0.0] * (384 - len(embedding))
     
     def chunk_text(self, text: str, metadata: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
         """Chunk text into smaller pieces for embedding.
@@ -158,7 +186,11 @@ class EmbeddingGenerator:
         self,
         chunks: List[Dict[str, Any]],
     ) -> List[Dict[str, Any]]:
-        """Generate embeddings for multiple chunks.
+        """Generate embeddings for multiple chunks in batches.
+        
+        Cached embeddings are reused; the remaining distinct texts are sent
+        to the provider ``batch_size`` at a time, with batches running
+        concurrently.
         
         Args:
             chunks: List of chunks with text and metadata
@@ -166,23 +198,51 @@ class EmbeddingGenerator:
         Returns:
             Chunks with embeddings added
         """
+        # Chunks still needing an embedding, grouped by cache key
+        pending: Dict[str, List[Dict[str, Any]]] = {}
         for chunk in chunks:
-            embedding = await self.generate_embedding(chunk['text'])
-            chunk['embedding'] = embedding
+            cache_key = self._get_cache_key(chunk['text'])
+            cached = self.cache_manager.get(cache_key) if self.cache_manager else None
+            if cached:
+                chunk['embedding'] = cached
+            else:
+                pending.setdefault(cache_key, []).append(chunk)
+        
+        async def embed(cache_keys: List[str]) -> None:
+            texts = [pending[cache_key][0]['text'] for cache_key in cache_keys]
+            async with self._semaphore:
+                try:
+                    embeddings = await self._provider_embeddings(texts)
+                except Exception:
+                    embeddings = [await self._generate_simple_embedding(text) for text in texts]
+            
+            for cache_key, embedding in zip(cache_keys, embeddings):
+                for chunk in pending[cache_key]:
+                    chunk['embedding'] = embedding
+                if self.cache_manager:
+                    self.cache_manager.set(cache_key, embedding)
+        
+        cache_keys = list(pending)
+        await asyncio.gather(*(
+            embed(cache_keys[i:i + self.batch_size])
+            for i in range(0, len(cache_keys), self.batch_size)
+        ))
         
         return chunks
     
-    def _get_cache_key(self, text: str) -> str:
+    def _get_cache_key(self, text: str, encoded: Optional[bytes] = None) -> str:
         """Get cache key for text.
         
         Args:
             text: Text to cache
+            encoded: The text as UTF-8 bytes, if already encoded
             
         Returns:
             Cache key
         """
-        text_hash = hashlib.sha256(text.encode()).hexdigest()
-        return f"embedding_{text_hash[:16]}"
+        # Scoped to the provider, whose embeddings differ in size and meaning
+        provider = type(self.provider).__name__
+        return f"embedding_{content_hash(provider, encoded if encoded is not None else text)[:16]}"
     
     def _extract_code_blocks(self, text: str) -> tuple[str, List[str]]:
         """Extract code blocks from text.
@@ -193,19 +253,18 @@ class EmbeddingGenerator:
         Returns:
             Tuple of (text without code, list of code blocks)
         """
+        # Every code pattern contains a backtick
+        if '`' not in text:
+            return text, []
+        
         code_blocks = []
         
         def replace_code_block(match):
             code_blocks.append(match.group(0))
             return ""
         
-        # Remove fenced code blocks
-        pattern = r'```[\s\S]*?```'
-        text_without_code = re.sub(pattern, replace_code_block, text)
-        
-        # Remove inline code
-        pattern = r'`[^`\n]+`'
-        text_without_code = re.sub(pattern, replace_code_block, text_without_code)
+        # Remove fenced code blocks and inline code in one pass
+        text_without_code = _CODE.sub(replace_code_block, text)
         
         return text_without_code, code_blocks
     
@@ -220,8 +279,9 @@ class EmbeddingGenerator:
         """
         # Simple sentence splitting
         # In production, use a proper sentence tokenizer like nltk
-        sentences = re.split(r'[.!?]+\s+', text)
-        return [s.strip() for s in sentences if s.strip()]
+        # Strip each piece once, dropping the empty ones
+        stripped = (s.strip() for s in _SENTENCE_SPLIT.split(text))
+        return [s for s in stripped if s]
 
 
 class DocumentProcessor:
@@ -264,24 +324,25 @@ class DocumentProcessor:
         self,
         documents: List[Dict[str, Any]],
     ) -> List[Dict[str, Any]]:
-        """Process multiple documents.
+        """Process multiple documents, embedding all their chunks together.
+        
+        Chunks from every document go through one batched embedding call,
+        so text repeated across pages is embedded once and batches are
+        filled across document boundaries.
         
         Args:
             documents: List of documents with 'content' and 'metadata'
             
         Returns:
-            List of all chunks with embeddings
+            List of all chunks with embeddings, in document order
         """
-        all_chunks = []
-        
-        for doc in documents:
-            chunks = await self.process_document(
-                doc['content'],
-                doc['metadata'],
-            )
-            all_chunks.extend(chunks)
+        chunks = [
+            chunk
+            for doc in documents
+            for chunk in self.embedding_generator.chunk_text(doc['content'], doc['metadata'])
+        ]
         
-        return all_chunks
+        return await self.embedding_generator.generate_embeddings_for_chunks(chunks)
 
 
 async def generate_embeddings_for_content(
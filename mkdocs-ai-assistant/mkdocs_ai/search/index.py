@@ -1,34 +1,105 @@
 """Vector index for semantic search."""
 
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from collections import Counter
+from typing import List, Dict, Any, Optional, Set
+import functools
+import heapq
 import json
 import math
+import operator
+
+# Vectorized scoring requires the ``search`` extra
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+# orjson (``fast`` extra) parses and dumps large vector payloads much faster
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+# Scoring backends accepted by SearchIndex
+BACKENDS = ("auto", "numpy", "brute")
+
+# Storage types for embeddings in the binary file next to the index
+VECTOR_TYPES = ("float32", "float16", "int8")
+
+# Metadata value of chunks without a filtered key; equal to nothing
+_MISSING = object()
+
+# BM25 term frequency saturation and length normalization
+_BM25_K1 = 1.5
+_BM25_B = 0.75
 
 
 class SearchIndex:
     """Vector index for semantic search.
     
     Features:
-    - JSON-based storage (portable)
-    - Cosine similarity search
+    - JSON-based storage, with embeddings in a binary float32,
+      float16 or int8-quantized file next to it when NumPy is installed
+    - Cosine similarity search (vectorized with NumPy when installed)
     - Metadata filtering
-    - Incremental updates
+    - Incremental updates (per-file modification stamps)
     """
     
-    def __init__(self, index_path: Optional[Path] = None):
+    def __init__(
+        self,
+        index_path: Optional[Path] = None,
+        backend: str = "auto",
+        quantize: bool = False,
+        vectors: Optional[str] = None,
+    ):
         """Initialize index.
         
         Args:
             index_path: Path to index file (JSON)
+            backend: Scoring backend: "numpy", "brute" (pure Python), or
+                "auto" to use NumPy when it is installed
+            quantize: Deprecated alias of ``vectors="int8"``
+            vectors: Storage type of embeddings in the ``.npz`` file next to
+                the index: "float32" (default), "float16" (half the size,
+                about 3 significant digits) or "int8" (a quarter, with a
+                per-row scale). Searches always score in float32.
+            
+        Raises:
+            ValueError: If the backend or vector type is unknown, conflicts
+                with ``quantize``, or NumPy is unavailable
         """
+        if backend not in BACKENDS:
+            raise ValueError(f"Unknown search backend: {backend}")
+        if quantize and vectors not in (None, "int8"):
+            raise ValueError(f"quantize conflicts with vectors={vectors!r}")
+        vectors = vectors or ("int8" if quantize else "float32")
+        if vectors not in VECTOR_TYPES:
+            raise ValueError(f"Unknown vector type: {vectors}")
+        if np is None and (backend == "numpy" or vectors != "float32"):
+            raise ValueError("The numpy backend and compact vectors require 'numpy'")
+        
         self.index_path = index_path or Path(".ai-cache/search_index.json")
+        self.backend = "brute" if backend == "auto" and np is None else backend
+        self.vectors = vectors
         self.chunks: List[Dict[str, Any]] = []
         self.metadata: Dict[str, Any] = {
             "version": "1.0",
             "total_chunks": 0,
             "total_documents": 0,
         }
+        # Source path -> {mtime_ns, size, sha256} of the indexed content
+        self.per_file: Dict[str, Dict[str, Any]] = {}
+        self._chunks_by_path: Optional[Dict[str, List[Dict[str, Any]]]] = None
+        # Dimension -> (row -> chunk position, normalized matrix and valid
+        # rows, both with spare capacity, number of chunks covered)
+        self._matrices: Dict[int, tuple] = {}
+        # Metadata key -> value per chunk position, for filtering
+        self._metadata_columns: Dict[str, Any] = {}
+        # Embedding magnitude per chunk position, for the pure Python backend
+        self._norms: Optional[List[Optional[float]]] = None
+        # (document frequency per term, chunk count, average terms per chunk)
+        self._keyword_stats: Optional[tuple] = None
     
     def add_chunk(self, chunk: Dict[str, Any]):
         """Add a chunk to the index.
@@ -42,6 +113,11 @@ class SearchIndex:
         
         self.chunks.append(chunk)
         self.metadata['total_chunks'] = len(self.chunks)
+        self._chunks_by_path = None
+        # Matrices are append-only and pick up new chunks on the next search
+        self._metadata_columns = {}
+        self._norms = None
+        self._keyword_stats = None
     
     def add_chunks(self, chunks: List[Dict[str, Any]]):
         """Add multiple chunks to the index.
@@ -52,6 +128,44 @@ class SearchIndex:
         for chunk in chunks:
             self.add_chunk(chunk)
     
+    def add_file(
+        self,
+        path: str,
+        chunks: List[Dict[str, Any]],
+        stamp: Dict[str, Any],
+    ):
+        """Add the chunks of a source file and record its stamp.
+        
+        Args:
+            path: Source file path
+            chunks: Chunks of the file
+            stamp: File stamp (mtime_ns, size, sha256)
+        """
+        self.per_file[path] = stamp
+        self.add_chunks(chunks)
+    
+    def get_file_chunks(self, path: str) -> List[Dict[str, Any]]:
+        """Get copies of the indexed chunks of a source file.
+        
+        Copies have no ``id`` so they can be added to another index.
+        
+        Args:
+            path: Source file path
+            
+        Returns:
+            Chunks whose metadata path matches
+        """
+        if self._chunks_by_path is None:
+            self._chunks_by_path = {}
+            for chunk in self.chunks:
+                source = chunk.get('metadata', {}).get('path')
+                self._chunks_by_path.setdefault(source, []).append(chunk)
+        
+        return [
+            {k: v for k, v in chunk.items() if k != 'id'}
+            for chunk in self._chunks_by_path.get(path, [])
+        ]
+    
     def search(
         self,
         query_embedding: List[float],
@@ -68,63 +182,354 @@ class SearchIndex:
         Returns:
             List of chunks with similarity scores
         """
-        # Filter chunks by metadata if specified
-        filtered_chunks = self.chunks
-        if filter_metadata:
-            filtered_chunks = [
-                chunk for chunk in self.chunks
-                if self._matches_filter(chunk.get('metadata', {}), filter_metadata)
-            ]
+        if self.backend != "brute":
+            return self._search_numpy(query_embedding, top_k, filter_metadata)
+        
+        # Magnitudes are computed once: the query's per search, the
+        # chunks' until they change
+        norms = self._chunk_norms()
+        query_norm = math.sqrt(sum(a * a for a in query_embedding))
         
         # Calculate similarity scores
-        results = []
-        for chunk in filtered_chunks:
-            if 'embedding' not in chunk:
+        scored = []
+        for chunk, norm in zip(self.chunks, norms):
+            if norm is None:
+                continue
+            
+            # Filter chunks by metadata if specified
+            if filter_metadata and not self._matches_filter(
+                chunk.get('metadata', {}), filter_metadata
+            ):
                 continue
             
             similarity = self._cosine_similarity(
                 query_embedding,
                 chunk['embedding'],
+                query_norm,
+                norm,
             )
             
-            results.append({
-                **chunk,
-                'similarity': similarity,
-            })
+            scored.append((similarity, chunk))
         
-        # Sort by similarity (descending)
-        results.sort(key=lambda x: x['similarity'], reverse=True)
+        # Select the top k by similarity (descending, stable on ties), then
+        # copy only those chunks into results
+        top = heapq.nlargest(top_k, scored, key=lambda item: item[0])
+        return [{**chunk, 'similarity': similarity} for similarity, chunk in top]
+    
+    def _search_numpy(
+        self,
+        query_embedding: List[float],
+        top_k: int,
+        filter_metadata: Optional[Dict[str, Any]],
+    ) -> List[Dict[str, Any]]:
+        """Score all chunks with one matrix-vector product.
         
-        # Return top k results
-        return results[:top_k]
+        Matches the pure Python loop up to float32 rounding: chunks with a
+        different dimension or a zero vector score 0.0, the rest
+        ``(cosine + 1) / 2``.
+        
+        Args:
+            query_embedding: Query embedding vector
+            top_k: Number of results to return
+            filter_metadata: Optional metadata filters
+            
+        Returns:
+            List of chunks with similarity scores
+        """
+        positions, matrix, valid = self._matrix(len(query_embedding))
+        if not len(positions):
+            return []
+        
+        query = np.asarray(query_embedding, dtype=np.float32)
+        norm = float(np.linalg.norm(query))
+        
+        scores = np.zeros(len(positions), dtype=np.float32)
+        if norm:
+            scores[valid] = (matrix[valid] @ (query / norm) + 1) / 2
+        
+        candidates = np.arange(len(positions))
+        if filter_metadata:
+            candidates = self._filter_rows(positions, filter_metadata)
+        
+        # Partial selection, then order the top k by score (stable on ties)
+        if top_k < len(candidates):
+            top = np.argpartition(-scores[candidates], top_k)[:top_k]
+            candidates = np.sort(candidates[top])
+        order = candidates[np.argsort(-scores[candidates], kind="stable")][:top_k]
+        
+        return [
+            {**self.chunks[positions[row]], 'similarity': float(scores[row])}
+            for row in order
+        ]
+    
+    def _filter_rows(
+        self,
+        positions: List[int],
+        filter_metadata: Dict[str, Any],
+    ) -> Any:
+        """Get the matrix rows whose chunk metadata matches the filters.
+        
+        Args:
+            positions: Chunk position per matrix row
+            filter_metadata: Metadata filters
+            
+        Returns:
+            Array of matching row indices
+        """
+        mask = np.ones(len(positions), dtype=bool)
+        for key, value in filter_metadata.items():
+            column = self._metadata_column(key)[positions]
+            if isinstance(value, (str, int, float)):
+                mask &= column == value
+            else:
+                mask &= np.fromiter(
+                    (item == value for item in column), dtype=bool, count=len(column)
+                )
+        
+        return np.flatnonzero(mask)
+    
+    def _metadata_column(self, key: str) -> Any:
+        """Get the values of a metadata key for every chunk.
+        
+        Built once per key and reused until the chunks change.
+        
+        Args:
+            key: Metadata key
+            
+        Returns:
+            Object array of values by chunk position (a sentinel that equals
+            nothing for chunks without the key)
+        """
+        if key not in self._metadata_columns:
+            column = np.empty(len(self.chunks), dtype=object)
+            column[:] = [
+                chunk.get('metadata', {}).get(key, _MISSING) for chunk in self.chunks
+            ]
+            self._metadata_columns[key] = column
+        
+        return self._metadata_columns[key]
+    
+    def _matrix(self, dimension: int) -> tuple:
+        """Get the normalized embedding matrix for a query dimension.
+        
+        Built once per dimension; chunks added later are appended to it,
+        with the capacity doubling as needed, so incremental updates don't
+        rebuild the existing rows.
+        
+        Args:
+            dimension: Query embedding dimension
+            
+        Returns:
+            Tuple of (chunk position per row, normalized float32 matrix,
+            boolean mask of rows with a matching, non-zero embedding)
+        """
+        positions, matrix, valid, covered = self._matrices.get(dimension) or (
+            [],
+            np.zeros((0, dimension), dtype=np.float32),
+            np.zeros(0, dtype=bool),
+            0,
+        )
+        
+        if covered < len(self.chunks):
+            added = [
+                i for i in range(covered, len(self.chunks))
+                if 'embedding' in self.chunks[i]
+            ]
+            start = len(positions)
+            end = start + len(added)
+            
+            if end > len(matrix):
+                capacity = max(end, 2 * len(matrix))
+                grown = np.zeros((capacity, dimension), dtype=np.float32)
+                grown[:start] = matrix[:start]
+                matrix = grown
+                valid = np.concatenate([valid[:start], np.zeros(capacity - start, dtype=bool)])
+            
+            for row, position in enumerate(added, start):
+                embedding = self.chunks[position]['embedding']
+                if len(embedding) == dimension:
+                    matrix[row] = embedding
+                    valid[row] = True
+            
+            block, block_valid = matrix[start:end], valid[start:end]
+            norms = np.linalg.norm(block, axis=1)
+            block_valid &= norms > 0
+            block[block_valid] /= norms[block_valid, None]
+            
+            positions.extend(added)
+            self._matrices[dimension] = (positions, matrix, valid, len(self.chunks))
+        
+        rows = len(positions)
+        return positions, matrix[:rows], valid[:rows]
+    
+    @property
+    def vectors_path(self) -> Path:
+        """Path of the binary embedding file saved next to the index."""
+        return self.index_path.with_suffix(".npz")
     
     def save(self):
         """Save index to disk."""
         self.index_path.parent.mkdir(parents=True, exist_ok=True)
         
+        # Embeddings go to a temporary file, replacing the previous one only
+        # once the JSON referring to them is written
+        part_path = self.vectors_path.with_suffix(".npz.part")
+        chunks = self.chunks
+        if np is not None:
+            chunks = self._save_vectors(part_path)
+        else:
+            self.metadata.pop('vectors', None)
+        
         data = {
             'metadata': self.metadata,
-            'chunks': self.chunks,
+            'per_file': self.per_file,
+            'chunks': chunks,
         }
         
-        with open(self.index_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2)
+        try:
+            if orjson is not None:
+                self.index_path.write_bytes(
+                    orjson.dumps(data, option=orjson.OPT_SERIALIZE_NUMPY)
+                )
+            else:
+                with open(self.index_path, 'w', encoding='utf-8') as f:
+                    json.dump(data, f, separators=(',', ':'))
+        except BaseException:
+            part_path.unlink(missing_ok=True)
+            raise
+        
+        if np is not None:
+            part_path.replace(self.vectors_path)
+        else:
+            self.vectors_path.unlink(missing_ok=True)
     
     def load(self):
-        """Load index from disk."""
+        """Load index from disk.
+        
+        Raises:
+            ValueError: If the index's binary embeddings can't be loaded
+        """
         if not self.index_path.exists():
             return
         
-        with open(self.index_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        if orjson is not None:
+            data = orjson.loads(self.index_path.read_bytes())
+        else:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
         
         self.metadata = data.get('metadata', self.metadata)
+        self.per_file = data.get('per_file', {})
         self.chunks = data.get('chunks', [])
+        self._chunks_by_path = None
+        self._matrices = {}
+        self._metadata_columns = {}
+        self._norms = None
+        self._keyword_stats = None
+        
+        # Indexes saved before float32 storage only flag int8 vectors
+        if self.metadata.pop('quantized', False):
+            self.metadata['vectors'] = "int8"
+        if self.metadata.get('vectors'):
+            self._load_vectors()
+    
+    def _save_vectors(self, path: Path) -> List[Dict[str, Any]]:
+        """Write embeddings to a binary file.
+        
+        Embeddings sharing the dimension of the first one are stored as one
+        matrix of the configured vector type (int8 quantized symmetrically
+        per row, ``scale = max|v| / 127``); any others stay in JSON. Values
+        out of float16 range are stored as float32 instead.
+        
+        Args:
+            path: Path of the binary file
+        
+        Returns:
+            Chunks to write to JSON, without the stored embeddings
+        """
+        embedded = [i for i, chunk in enumerate(self.chunks) if 'embedding' in chunk]
+        dimension = len(self.chunks[embedded[0]]['embedding']) if embedded else 0
+        rows = [i for i in embedded if len(self.chunks[i]['embedding']) == dimension]
+        
+        vectors = np.array(
+            [self.chunks[i]['embedding'] for i in rows], dtype=np.float32
+        ).reshape(len(rows), dimension)
+        
+        stored_type = self.vectors
+        if (
+            stored_type == "float16"
+            and np.abs(vectors).max(initial=0.0) > np.finfo(np.float16).max
+        ):
+            stored_type = "float32"
+        
+        with open(path, 'wb') as f:
+            if stored_type == "int8":
+                scale = np.abs(vectors).max(axis=1, initial=0.0) / 127
+                quantized = np.round(
+                    vectors / np.where(scale > 0, scale, 1)[:, None]
+                ).astype(np.int8)
+                np.savez_compressed(
+                    f,
+                    rows=np.asarray(rows, dtype=np.int64),
+                    q=quantized,
+                    scale=scale.astype(np.float32),
+                )
+            elif stored_type == "float16":
+                np.savez(
+                    f,
+                    rows=np.asarray(rows, dtype=np.int64),
+                    h=vectors.astype(np.float16),
+                )
+            else:
+                # Float data barely compresses, so it is stored as is
+                np.savez(f, rows=np.asarray(rows, dtype=np.int64), v=vectors)
+        self.metadata['vectors'] = stored_type
+        
+        stored = set(rows)
+        return [
+            {k: v for k, v in chunk.items() if k != 'embedding'} if i in stored else chunk
+            for i, chunk in enumerate(self.chunks)
+        ]
+    
+    def _load_vectors(self):
+        """Restore embeddings from the binary file written by save().
+        
+        Raises:
+            ValueError: If the file is missing or NumPy is not installed
+        """
+        if not self.vectors_path.exists():
+            raise ValueError(
+                f"Embeddings file {self.vectors_path} of the search index is "
+                "missing; rebuild the index with --force-rebuild"
+            )
+        if np is None:
+            raise ValueError(
+                "Loading an index with binary embeddings requires 'numpy'; "
+                "install it or rebuild the index with --force-rebuild"
+            )
+        
+        with np.load(self.vectors_path) as data:
+            rows = data['rows']
+            if 'q' in data:
+                vectors = data['q'].astype(np.float32) * data['scale'][:, None]
+            elif 'h' in data:
+                vectors = data['h'].astype(np.float32)
+            else:
+                vectors = data['v']
+        
+        for position, embedding in zip(rows.tolist(), vectors.tolist()):
+            self.chunks[position]['embedding'] = embedding
     
     def clear(self):
         """Clear the index."""
         self.chunks = []
+        self.per_file = {}
         self.metadata['total_chunks'] = 0
+        self._chunks_by_path = None
+        self._matrices = {}
+        self._metadata_columns = {}
+        self._norms = None
+        self._keyword_stats = None
     
     def get_stats(self) -> Dict[str, Any]:
         """Get index statistics.
@@ -139,12 +544,59 @@ class SearchIndex:
             'avg_chunk_length': self._get_avg_chunk_length(),
         }
     
-    def _cosine_similarity(self, vec1: List[float], vec2: List[float]) -> float:
+    def _chunk_norms(self) -> List[Optional[float]]:
+        """Get the embedding magnitude of every chunk.
+        
+        Computed once and reused until the chunks change.
+        
+        Returns:
+            Magnitude per chunk position (None for chunks without embedding)
+        """
+        if self._norms is None:
+            self._norms = [
+                math.sqrt(sum(x * x for x in chunk['embedding']))
+                if 'embedding' in chunk else None
+                for chunk in self.chunks
+            ]
+        return self._norms
+    
+    def keyword_stats(self) -> tuple:
+        """Get the corpus statistics used for BM25 keyword scoring.
+        
+        Computed once and reused until the chunks change.
+        
+        Returns:
+            Tuple of (document frequency per term, number of chunks,
+            average number of terms per chunk)
+        """
+        if self._keyword_stats is None:
+            doc_freq: Dict[str, int] = {}
+            total_terms = 0
+            for chunk in self.chunks:
+                counts = Counter(chunk.get('text', '').lower().split())
+                total_terms += counts.total()
+                for term in counts:
+                    doc_freq[term] = doc_freq.get(term, 0) + 1
+            
+            count = len(self.chunks)
+            self._keyword_stats = (doc_freq, count, total_terms / count if count else 0.0)
+        
+        return self._keyword_stats
+    
+    def _cosine_similarity(
+        self,
+        vec1: List[float],
+        vec2: List[float],
+        magnitude1: Optional[float] = None,
+        magnitude2: Optional[float] = None,
+    ) -> float:
         """Calculate cosine similarity between two vectors.
         
         Args:
             vec1: First vector
             vec2: Second vector
+            magnitude1: Magnitude of the first vector, if already known
+            magnitude2: Magnitude of the second vector, if already known
             
         Returns:
             Similarity score (0-1)
@@ -152,12 +604,21 @@ class SearchIndex:
         if len(vec1) != len(vec2):
             return 0.0
         
-        # Calculate dot product
-        dot_product = sum(a * b for a, b in zip(vec1, vec2))
-        
-        # Calculate magnitudes
-        magnitude1 = math.sqrt(sum(a * a for a in vec1))
-        magnitude2 = math.sqrt(sum(b * b for b in vec2))
+        if magnitude1 is not None and magnitude2 is not None:
+            # Only the dot product is left to compute
+            dot_product = sum(map(operator.mul, vec1, vec2))
+        else:
+            # Dot product and squared magnitudes in a single pass
+            dot_product = squares1 = squares2 = 0.0
+            for a, b in zip(vec1, vec2):
+                dot_product += a * b
+                squares1 += a * a
+                squares2 += b * b
+            
+            if magnitude1 is None:
+                magnitude1 = math.sqrt(squares1)
+            if magnitude2 is None:
+                magnitude2 = math.sqrt(squares2)
         
         # Avoid division by zero
         if magnitude1 == 0 or magnitude2 == 0:
@@ -194,6 +655,8 @@ class SearchIndex:
             return 0.0
         
         size_bytes = self.index_path.stat().st_size
+        if self.metadata.get('vectors') and self.vectors_path.exists():
+            size_bytes += self.vectors_path.stat().st_size
         return size_bytes / (1024 * 1024)
     
     def _get_avg_chunk_length(self) -> float:
@@ -209,6 +672,22 @@ class SearchIndex:
         return total_length / len(self.chunks)
 
 
+@functools.lru_cache(maxsize=4096)
+def _term_counts(text: str) -> Counter:
+    """Count the lowercased whitespace-separated terms of a text.
+    
+    Chunks come back across queries, so their terms are counted once.
+    The result is shared and must not be modified.
+    
+    Args:
+        text: Chunk text
+        
+    Returns:
+        Term counts
+    """
+    return Counter(text.lower().split())
+
+
 class HybridSearch:
     """Hybrid search combining semantic and keyword search."""
     
@@ -230,6 +709,9 @@ class HybridSearch:
     ) -> List[Dict[str, Any]]:
         """Perform hybrid search.
         
+        Semantic candidates are rescored with BM25 over the query terms,
+        scaled so the best candidate has a keyword score of 1.
+        
         Args:
             query: Query text
             query_embedding: Query embedding
@@ -245,14 +727,14 @@ class HybridSearch:
         
         # Calculate keyword scores
         query_terms = set(query.lower().split())
+        bm25_scores = [
+            self._bm25(query_terms, _term_counts(result.get('text', '')))
+            for result in semantic_results
+        ]
+        best = max(bm25_scores, default=0.0)
         
-        for result in semantic_results:
-            text = result.get('text', '').lower()
-            text_terms = set(text.split())
-            
-            # Calculate keyword overlap
-            overlap = len(query_terms & text_terms)
-            keyword_score = overlap / len(query_terms) if query_terms else 0
+        for result, bm25_score in zip(semantic_results, bm25_scores):
+            keyword_score = bm25_score / best if best > 0 else 0
             
             # Combine scores
             semantic_score = result.get('similarity', 0)
@@ -268,6 +750,31 @@ class HybridSearch:
         semantic_results.sort(key=lambda x: x['combined_score'], reverse=True)
         
         return semantic_results[:top_k]
+    
+    def _bm25(self, query_terms: Set[str], term_counts: Counter) -> float:
+        """Score a chunk against query terms with BM25.
+        
+        Args:
+            query_terms: Lowercased query terms
+            term_counts: Term counts of the chunk
+            
+        Returns:
+            BM25 score (0 if no query term occurs in the chunk)
+        """
+        doc_freq, count, avg_terms = self.index.keyword_stats()
+        length_norm = 1 - _BM25_B + _BM25_B * term_counts.total() / (avg_terms or 1)
+        
+        score = 0.0
+        for term in query_terms:
+            frequency = term_counts.get(term)
+            if not frequency:
+                continue
+            
+            df = doc_freq.get(term, 0)
+            idf = math.log((count - df + 0.5) / (df + 0.5) + 1)
+            score += idf * frequency * (_BM25_K1 + 1) / (frequency + _BM25_K1 * length_norm)
+        
+        return score
 
 
 def create_index_from_documents(
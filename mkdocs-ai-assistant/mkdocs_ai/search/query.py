@@ -2,13 +2,32 @@
 
 from pathlib import Path
 from typing import List, Dict, Any, Optional
+import asyncio
+import functools
+import re
 
 from ..providers import AIProvider
 from ..cache import CacheManager
-from .embeddings import EmbeddingGenerator
+from .embeddings import DocumentProcessor, EmbeddingGenerator
 from .index import SearchIndex, HybridSearch
 
 
+@functools.lru_cache(maxsize=128)
+def _query_pattern(query: str) -> Optional[re.Pattern]:
+    """Compile a case-insensitive pattern matching any term of a query.
+    
+    Args:
+        query: Search query
+        
+    Returns:
+        Compiled pattern, or None if the query has no terms
+    """
+    terms = query.lower().split()
+    if not terms:
+        return None
+    return re.compile('|'.join(map(re.escape, terms)), re.IGNORECASE)
+
+
 class SemanticSearch:
     """Semantic search interface.
     
@@ -47,6 +66,7 @@ class SemanticSearch:
         top_k: int = 10,
         use_hybrid: bool = True,
         filter_metadata: Optional[Dict[str, Any]] = None,
+        query_embedding: Optional[List[float]] = None,
     ) -> List[Dict[str, Any]]:
         """Search for relevant content.
         
@@ -55,12 +75,14 @@ class SemanticSearch:
             top_k: Number of results to return
             use_hybrid: Whether to use hybrid search
             filter_metadata: Optional metadata filters
+            query_embedding: Precomputed query embedding (generated if omitted)
             
         Returns:
             List of search results with scores
         """
         # Generate query embedding
-        query_embedding = await self.embedding_generator.generate_embedding(query)
+        if query_embedding is None:
+            query_embedding = await self.embedding_generator.generate_embedding(query)
         
         # Perform search
         if use_hybrid:
@@ -123,15 +145,10 @@ class SemanticSearch:
         Returns:
             Highlighted text snippet
         """
-        query_terms = query.lower().split()
-        text_lower = text.lower()
-        
-        # Find first occurrence of any query term
-        first_pos = len(text)
-        for term in query_terms:
-            pos = text_lower.find(term)
-            if pos != -1 and pos < first_pos:
-                first_pos = pos
+        # Find first occurrence of any query term, in one scan
+        pattern = _query_pattern(query)
+        match = pattern.search(text) if pattern else None
+        first_pos = match.start() if match else len(text)
         
         # Extract snippet around first occurrence
         if first_pos < len(text):
@@ -187,32 +204,99 @@ class SearchBuilder:
         Returns:
             Search index
         """
-        from .embeddings import DocumentProcessor
-        
         index = SearchIndex(self.index_path)
-        processor = DocumentProcessor(self.embedding_generator)
         
-        for file_path in file_paths:
-            # Read file
-            content = file_path.read_text(encoding='utf-8')
-            
-            # Extract metadata
-            metadata = {
-                'path': str(file_path),
-                'filename': file_path.name,
-            }
-            
-            # Process document
-            chunks = await processor.process_document(content, metadata)
-            
-            # Add to index
-            index.add_chunks(chunks)
+        # Embed all files together and add them to the index
+        index.add_chunks(await self.embed_files(file_paths))
         
         # Update metadata
         index.metadata['total_documents'] = len(file_paths)
         
         return index
     
+    async def embed_file(
+        self,
+        file_path: Path,
+        processor: Optional[DocumentProcessor] = None,
+    ) -> List[Dict[str, Any]]:
+        """Chunk and embed a single markdown file.
+        
+        Args:
+            file_path: Markdown file path
+            processor: Optional document processor to reuse
+            
+        Returns:
+            List of chunks with embeddings
+        """
+        content = await asyncio.to_thread(file_path.read_text, encoding='utf-8')
+        
+        return await self.embed_content(file_path, content, processor)
+    
+    async def embed_files(
+        self,
+        file_paths: List[Path],
+        processor: Optional[DocumentProcessor] = None,
+    ) -> List[Dict[str, Any]]:
+        """Chunk and embed several markdown files together.
+        
+        Files are read concurrently in worker threads, then the chunks of
+        all files are embedded in one batched, deduplicated pass.
+        
+        Args:
+            file_paths: Markdown file paths
+            processor: Optional document processor to reuse
+            
+        Returns:
+            List of chunks with embeddings, in file order
+        """
+        if processor is None:
+            processor = DocumentProcessor(self.embedding_generator)
+        
+        contents = await asyncio.gather(*(
+            asyncio.to_thread(file_path.read_text, encoding='utf-8')
+            for file_path in file_paths
+        ))
+        
+        return await processor.process_documents([
+            {'content': content, 'metadata': self._file_metadata(file_path)}
+            for file_path, content in zip(file_paths, contents)
+        ])
+    
+    async def embed_content(
+        self,
+        file_path: Path,
+        content: str,
+        processor: Optional[DocumentProcessor] = None,
+    ) -> List[Dict[str, Any]]:
+        """Chunk and embed the already-read content of a markdown file.
+        
+        Args:
+            file_path: Markdown file path (used for metadata)
+            content: File content
+            processor: Optional document processor to reuse
+            
+        Returns:
+            List of chunks with embeddings
+        """
+        if processor is None:
+            processor = DocumentProcessor(self.embedding_generator)
+        
+        return await processor.process_document(content, self._file_metadata(file_path))
+    
+    def _file_metadata(self, file_path: Path) -> Dict[str, Any]:
+        """Get the chunk metadata of a markdown file.
+        
+        Args:
+            file_path: Markdown file path
+            
+        Returns:
+            Metadata dictionary
+        """
+        return {
+            'path': str(file_path),
+            'filename': file_path.name,
+        }
+    
     async def update_index(
         self,
         index: SearchIndex,
@@ -227,20 +311,7 @@ class SearchBuilder:
         Returns:
             Updated index
         """
-        from .embeddings import DocumentProcessor
-        
-        processor = DocumentProcessor(self.embedding_generator)
-        
-        for file_path in new_files:
-            content = file_path.read_text(encoding='utf-8')
-            
-            metadata = {
-                'path': str(file_path),
-                'filename': file_path.name,
-            }
-            
-            chunks = await processor.process_document(content, metadata)
-            index.add_chunks(chunks)
+        index.add_chunks(await self.embed_files(new_files))
         
         # Update metadata
         index.metadata['total_documents'] += len(new_files)
@@ -254,22 +325,24 @@ async def search_documents(
     provider: AIProvider,
     cache_manager: Optional[CacheManager] = None,
     top_k: int = 10,
+    backend: str = "auto",
 ) -> List[Dict[str, Any]]:
     """Convenience function to search documents.
     
+    The index is loaded from disk while the query is being embedded.
+    
     Args:
         query: Search query
         index_path: Path to search index
         provider: AI provider
         cache_manager: Optional cache manager
         top_k: Number of results
+        backend: Scoring backend ("auto", "numpy" or "brute")
         
     Returns:
         Search results
     """
-    # Load index
-    index = SearchIndex(index_path)
-    index.load()
+    index = SearchIndex(index_path, backend=backend)
     
     # Create search
     search = SemanticSearch(
@@ -278,7 +351,13 @@ async def search_documents(
         cache_manager=cache_manager,
     )
     
+    # Load index and embed the query concurrently
+    query_embedding, _ = await asyncio.gather(
+        search.embedding_generator.generate_embedding(query),
+        asyncio.to_thread(index.load),
+    )
+    
     # Perform search
-    results = await search.search(query, top_k=top_k)
+    results = await search.search(query, top_k=top_k, query_embedding=query_embedding)
     
     return results
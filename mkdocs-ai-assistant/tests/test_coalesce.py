@@ -0,0 +1,83 @@
+"""Tests for request coalescing."""
+
+import asyncio
+from typing import Any, AsyncIterator, Optional
+
+from mkdocs_ai.cache import RequestCoalescer
+from mkdocs_ai.providers.base import AIProvider, ProviderResponse
+
+
+class SlowStreamProvider(AIProvider):
+    """Provider streaming a prompt back word by word."""
+
+    def __init__(self) -> None:
+        super().__init__({"model": "slow"})
+        self.calls = 0
+
+    async def generate(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        **kwargs: Any,
+    ) -> ProviderResponse:
+        self.calls += 1
+        return ProviderResponse(content=prompt, model=self.model)
+
+    async def generate_stream(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[str]:
+        self.calls += 1
+        for word in prompt.split(" "):
+            await asyncio.sleep(0.01)
+            yield word + " "
+
+    async def embed(self, text: str) -> list[float]:
+        return [1.0]
+
+    def supports_streaming(self) -> bool:
+        return True
+
+
+async def collect(stream: AsyncIterator[str]) -> str:
+    return "".join([chunk async for chunk in stream])
+
+
+async def test_identical_streams_share_one_request() -> None:
+    provider = SlowStreamProvider()
+    coalescer = RequestCoalescer(provider)
+
+    first, second = await asyncio.gather(
+        collect(coalescer.stream("one two three")),
+        collect(coalescer.stream("one two three")),
+    )
+
+    assert first == second == "one two three "
+    assert provider.calls == 1
+
+
+async def test_generate_joins_a_stream_in_flight() -> None:
+    provider = SlowStreamProvider()
+    coalescer = RequestCoalescer(provider)
+
+    streamed, generated = await asyncio.gather(
+        collect(coalescer.stream("one two")),
+        coalescer.generate("one two"),
+    )
+
+    assert streamed == generated == "one two "
+    assert provider.calls == 1
+
+
+async def test_abandoned_stream_releases_its_slot() -> None:
+    provider = SlowStreamProvider()
+    coalescer = RequestCoalescer(provider, max_concurrency=1)
+
+    stream = coalescer.stream("one two three four")
+    assert await stream.__anext__() == "one "
+    await stream.aclose()
+
+    result = await asyncio.wait_for(coalescer.generate("other"), timeout=1)
+    assert result == "other"
@@ -0,0 +1,34 @@
+"""Tests for the daemon client."""
+
+import socket
+
+import pytest
+
+from mkdocs_ai.daemon import DaemonUnavailable, request
+
+pytestmark = pytest.mark.skipif(
+    not hasattr(socket, "AF_UNIX"), reason="UNIX sockets are not supported"
+)
+
+
+def test_missing_socket_is_unavailable(tmp_path) -> None:
+    with pytest.raises(DaemonUnavailable):
+        request("ping", socket_path=tmp_path / "sock")
+
+
+def test_wedged_daemon_times_out(tmp_path) -> None:
+    path = tmp_path / "sock"
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as server:
+        server.bind(str(path))
+        server.listen()
+
+        with pytest.raises(DaemonUnavailable):
+            request("ping", socket_path=path, timeout=0.2)
+
+
+def test_socket_that_is_not_a_daemon_is_unavailable(tmp_path) -> None:
+    path = tmp_path / "sock"
+    path.write_text("")
+
+    with pytest.raises(DaemonUnavailable):
+        request("ping", socket_path=path)
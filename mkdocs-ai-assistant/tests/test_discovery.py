@@ -0,0 +1,71 @@
+"""Tests for the persisted asset discovery result."""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from mkdocs_ai.assets.discovery import AssetDiscovery
+
+
+@pytest.fixture
+def project(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    monkeypatch.delenv("MKDOCS_AI_NOCACHE", raising=False)
+    (tmp_path / "docker-compose.yml").write_text("services: {}\n")
+    nested = tmp_path / "deploy" / "staging"
+    nested.mkdir(parents=True)
+    (nested / "config.yml").write_text("debug: false\n")
+    return tmp_path
+
+
+def age(directory: Path) -> int:
+    """Move a directory's modification time an hour back, returning it."""
+    mtime_ns = directory.stat().st_mtime_ns - 3600 * 10**9
+    os.utime(directory, ns=(mtime_ns, mtime_ns))
+    return mtime_ns
+
+
+def test_new_file_in_nested_directory_invalidates_cache(project: Path) -> None:
+    nested = project / "deploy" / "staging"
+    # Adding a file must move the stamped time however coarse the clock
+    age(nested)
+
+    first = AssetDiscovery(project).discover_all()
+    assert AssetDiscovery(project).cache_file.exists()
+    assert first["docker_compose"] == [project / "docker-compose.yml"]
+
+    (nested / "docker-compose.staging.yml").write_text("services: {}\n")
+
+    assets = AssetDiscovery(project).discover_all()
+    assert sorted(assets["docker_compose"]) == [
+        project / "deploy" / "staging" / "docker-compose.staging.yml",
+        project / "docker-compose.yml",
+    ]
+
+
+def test_nocache_bypasses_persisted_result(
+    project: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    nested = project / "deploy" / "staging"
+    stamped = age(nested)
+    AssetDiscovery(project).discover_all()
+
+    # A new file the stamps don't see: the cached result is stale
+    new_file = nested / "docker-compose.staging.yml"
+    new_file.write_text("services: {}\n")
+    os.utime(nested, ns=(stamped, stamped))
+    assert new_file not in AssetDiscovery(project).discover_all()["docker_compose"]
+
+    monkeypatch.setenv("MKDOCS_AI_NOCACHE", "1")
+    assert new_file in AssetDiscovery(project).discover_all()["docker_compose"]
+
+
+def test_nocache_does_not_persist_result(
+    project: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("MKDOCS_AI_NOCACHE", "1")
+    discovery = AssetDiscovery(project)
+
+    discovery.discover_all()
+
+    assert not discovery.cache_file.exists()
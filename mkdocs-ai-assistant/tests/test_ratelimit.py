@@ -0,0 +1,150 @@
+"""Tests for client-side rate limiting."""
+
+import httpx
+import pytest
+
+from mkdocs_ai import ratelimit
+from mkdocs_ai.ratelimit import RateLimiter, configure_defaults, get_rate_limiter
+
+
+class FakeTime:
+    """Stand-in for the time module with a manually advanced clock."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> FakeTime:
+    fake = FakeTime()
+    monkeypatch.setattr(ratelimit, "time", fake)
+    return fake
+
+
+@pytest.fixture(autouse=True)
+def isolated_limiters(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(ratelimit, "_limiters", {})
+    monkeypatch.setattr(ratelimit, "_overrides", {"rpm": None, "tpm": None})
+
+
+def reserve(limiter: RateLimiter, clock: FakeTime, tokens: int = 0) -> float:
+    return limiter._reserve(tokens, clock.monotonic())
+
+
+def test_bursts_up_to_rpm_then_spaces_requests(clock: FakeTime) -> None:
+    limiter = RateLimiter(rpm=60)
+
+    assert [reserve(limiter, clock) for _ in range(60)] == [0.0] * 60
+    assert reserve(limiter, clock) == pytest.approx(1.0)
+    assert reserve(limiter, clock) == pytest.approx(2.0)
+
+
+def test_bucket_refills_at_the_rate(clock: FakeTime) -> None:
+    limiter = RateLimiter(rpm=60)
+    for _ in range(60):
+        reserve(limiter, clock)
+
+    # One request per second at 60 rpm
+    clock.now += 3
+    assert [reserve(limiter, clock) for _ in range(4)] == pytest.approx([0, 0, 0, 1])
+
+    # Never more than a full bucket, however long the pause
+    clock.now += 3600
+    assert [reserve(limiter, clock) for _ in range(61)][-1] == pytest.approx(1.0)
+
+
+def test_throttle_halves_rate_at_most_once_per_second(clock: FakeTime) -> None:
+    limiter = RateLimiter(rpm=60)
+
+    limiter.on_throttle()
+    limiter.on_throttle()
+    assert limiter.rate == 30
+
+    clock.now += 0.5
+    limiter.on_throttle()
+    assert limiter.rate == 30
+
+    clock.now += 0.5
+    limiter.on_throttle()
+    assert limiter.rate == 15
+
+
+def test_throttle_empties_the_bucket(clock: FakeTime) -> None:
+    limiter = RateLimiter(rpm=60)
+
+    limiter.on_throttle()
+    # Next request waits for one token at the halved rate
+    assert reserve(limiter, clock) == pytest.approx(2.0)
+
+
+def test_retry_after_blocks_requests(clock: FakeTime) -> None:
+    limiter = RateLimiter(rpm=60)
+    request = httpx.Request("POST", "https://api.example.com/v1")
+
+    limiter.update(httpx.Response(429, headers={"retry-after": "30"}, request=request))
+
+    assert reserve(limiter, clock) >= 30
+    clock.now += 40
+    assert reserve(limiter, clock) == pytest.approx(0.0)
+
+
+def test_success_recovers_rate_up_to_rpm(clock: FakeTime) -> None:
+    limiter = RateLimiter(rpm=10, alpha=2.0)
+    limiter.on_throttle()
+    assert limiter.rate == 5
+
+    limiter.on_success()
+    assert limiter.rate == 7
+    limiter.on_success()
+    limiter.on_success()
+    assert limiter.rate == 10
+    limiter.on_success()
+    assert limiter.rate == 10
+
+
+def test_exhausted_budget_header_holds_the_rate(clock: FakeTime) -> None:
+    limiter = RateLimiter(rpm=10)
+    limiter.on_throttle()
+    request = httpx.Request("POST", "https://api.example.com/v1")
+
+    limiter.update(
+        httpx.Response(200, headers={"x-ratelimit-remaining": "0"}, request=request)
+    )
+
+    assert limiter.rate == 5
+
+
+def test_token_window_evicts_old_entries(clock: FakeTime) -> None:
+    limiter = RateLimiter(tpm=1000)
+
+    assert reserve(limiter, clock, 600) == 0.0
+    clock.now += 10
+    assert reserve(limiter, clock, 300) == 0.0
+
+    # Over the ceiling: waits for the first request to leave the window
+    assert reserve(limiter, clock, 300) == pytest.approx(50.0)
+
+    # Once a minute has passed, earlier entries no longer count
+    clock.now += 120
+    assert reserve(limiter, clock, 1000) == 0.0
+    assert len(limiter._window) == 1
+    assert limiter._window_tokens == 1000
+
+
+def test_configure_defaults_overrides_provider_limits(clock: FakeTime) -> None:
+    limiter = get_rate_limiter("api.anthropic.com")
+    assert (limiter.rpm, limiter.tpm) == ratelimit.PROVIDER_LIMITS["anthropic"]
+
+    configure_defaults(rpm=5, tpm=100)
+
+    limiter = get_rate_limiter("api.anthropic.com")
+    assert (limiter.rpm, limiter.tpm) == (5, 100)
+    # Hosts without provider defaults are limited too
+    assert get_rate_limiter("localhost").rpm == 5
+
+
+def test_hosts_without_limits_have_no_limiter() -> None:
+    assert get_rate_limiter("localhost") is None
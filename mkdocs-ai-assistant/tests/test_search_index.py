@@ -0,0 +1,172 @@
+"""Tests for search index storage and scoring."""
+
+import json
+import random
+from pathlib import Path
+from typing import Any, Optional
+
+import pytest
+from click.testing import CliRunner
+
+from mkdocs_ai import cli
+from mkdocs_ai.providers.base import AIProvider, ProviderResponse
+from mkdocs_ai.search import SearchIndex
+
+pytest.importorskip("numpy")
+
+
+class HashEmbeddingProvider(AIProvider):
+    """Provider embedding texts into small deterministic vectors."""
+
+    def __init__(self) -> None:
+        super().__init__({"model": "hash"})
+
+    async def generate(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        **kwargs: Any,
+    ) -> ProviderResponse:
+        return ProviderResponse(content=prompt, model=self.model)
+
+    async def embed(self, text: str) -> list[float]:
+        rng = random.Random(text)
+        return [rng.uniform(-1, 1) for _ in range(8)]
+
+    def supports_streaming(self) -> bool:
+        return False
+
+
+def build_index(path: Path, vectors: str = "float32", count: int = 50) -> SearchIndex:
+    rng = random.Random(0)
+    index = SearchIndex(path, vectors=vectors)
+    index.add_chunks([
+        {
+            'content': f"chunk {i}",
+            'embedding': [rng.uniform(-1, 1) for _ in range(16)],
+            'metadata': {'path': f"page{i % 5}.md", 'section': i % 3},
+        }
+        for i in range(count)
+    ])
+    return index
+
+
+@pytest.mark.parametrize(
+    "vectors, tolerance",
+    [("float32", 1e-7), ("float16", 1e-3), ("int8", 1e-2)],
+)
+def test_vectors_round_trip(tmp_path: Path, vectors: str, tolerance: float) -> None:
+    index = build_index(tmp_path / "index.json", vectors)
+    index.save()
+
+    # Stored embeddings live in the binary file only
+    data = json.loads(index.index_path.read_text())
+    assert data['metadata']['vectors'] == vectors
+    assert not any('embedding' in chunk for chunk in data['chunks'])
+
+    loaded = SearchIndex(index.index_path)
+    loaded.load()
+
+    assert [chunk['content'] for chunk in loaded.chunks] == [
+        chunk['content'] for chunk in index.chunks
+    ]
+    for original, restored in zip(index.chunks, loaded.chunks):
+        assert restored['embedding'] == pytest.approx(original['embedding'], abs=tolerance)
+
+
+def test_float16_falls_back_to_float32_out_of_range(tmp_path: Path) -> None:
+    index = SearchIndex(tmp_path / "index.json", vectors="float16")
+    index.add_chunk({'content': "big", 'embedding': [1e6, -2.5], 'metadata': {}})
+    index.save()
+
+    loaded = SearchIndex(index.index_path)
+    loaded.load()
+
+    assert loaded.metadata['vectors'] == "float32"
+    assert loaded.chunks[0]['embedding'] == [1e6, -2.5]
+
+
+def test_legacy_quantized_index_loads(tmp_path: Path) -> None:
+    index = build_index(tmp_path / "index.json", "int8")
+    index.save()
+
+    # Indexes saved before the vector types flagged int8 storage only
+    data = json.loads(index.index_path.read_text())
+    del data['metadata']['vectors']
+    data['metadata']['quantized'] = True
+    index.index_path.write_text(json.dumps(data))
+
+    loaded = SearchIndex(index.index_path)
+    loaded.load()
+
+    assert loaded.metadata['vectors'] == "int8"
+    assert 'quantized' not in loaded.metadata
+    assert loaded.chunks[0]['embedding'] == pytest.approx(
+        index.chunks[0]['embedding'], abs=1e-2
+    )
+
+
+def test_missing_vectors_file_asks_for_rebuild(tmp_path: Path) -> None:
+    index = build_index(tmp_path / "index.json")
+    index.save()
+    index.vectors_path.unlink()
+
+    with pytest.raises(ValueError, match="--force-rebuild"):
+        SearchIndex(index.index_path).load()
+
+
+@pytest.mark.parametrize("filter_metadata", [None, {'section': 1}, {'path': "page2.md"}])
+def test_numpy_and_brute_search_agree(
+    tmp_path: Path, filter_metadata: Optional[dict]
+) -> None:
+    index = build_index(tmp_path / "index.json")
+    query = [random.Random(1).uniform(-1, 1) for _ in range(16)]
+
+    index.backend = "numpy"
+    vectorized = index.search(query, top_k=5, filter_metadata=filter_metadata)
+    index.backend = "brute"
+    brute = index.search(query, top_k=5, filter_metadata=filter_metadata)
+
+    assert [chunk['id'] for chunk in vectorized] == [chunk['id'] for chunk in brute]
+    assert [chunk['similarity'] for chunk in vectorized] == pytest.approx(
+        [chunk['similarity'] for chunk in brute], abs=1e-6
+    )
+    if filter_metadata:
+        key, value = next(iter(filter_metadata.items()))
+        assert all(chunk['metadata'][key] == value for chunk in vectorized)
+
+
+def run_build(tmp_path: Path, monkeypatch: pytest.MonkeyPatch, *args: str) -> Any:
+    docs = tmp_path / "docs"
+    docs.mkdir()
+    (docs / "index.md").write_text("# Home\n\nSome text about the project.\n")
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(
+        "mkdocs_ai.providers.create_provider",
+        lambda *args, **kwargs: HashEmbeddingProvider(),
+    )
+
+    return CliRunner().invoke(
+        cli.main,
+        ["build-search-index", "--index-path", "index.json", *args],
+    )
+
+
+def test_quantize_is_an_alias_of_int8_vectors(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    result = run_build(tmp_path, monkeypatch, "--quantize")
+
+    assert result.exit_code == 0, result.output
+    assert "deprecated" in result.output
+    data = json.loads((tmp_path / "index.json").read_text())
+    assert data['metadata']['vectors'] == "int8"
+
+
+def test_quantize_conflicts_with_other_vectors(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    result = run_build(tmp_path, monkeypatch, "--quantize", "--vectors", "float16")
+
+    assert result.exit_code == 2
+    assert "conflicts" in result.output
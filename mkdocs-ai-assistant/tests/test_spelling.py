@@ -0,0 +1,78 @@
+"""Tests for local spelling fixes."""
+
+from typing import Any, Optional
+
+import pytest
+
+from mkdocs_ai.enhancement import FastSpellFixer, GrammarEnhancer
+from mkdocs_ai.providers.base import AIProvider, ProviderResponse
+
+pytest.importorskip("symspellpy")
+
+
+class EchoProvider(AIProvider):
+    """Provider answering every prompt with a fixed marker."""
+
+    def __init__(self) -> None:
+        super().__init__({"model": "echo"})
+        self.calls = 0
+
+    async def generate(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        **kwargs: Any,
+    ) -> ProviderResponse:
+        self.calls += 1
+        return ProviderResponse(content="MODEL", model=self.model)
+
+    async def embed(self, text: str) -> list[float]:
+        return [1.0]
+
+    def supports_streaming(self) -> bool:
+        return False
+
+
+@pytest.fixture
+def fixer() -> FastSpellFixer:
+    return FastSpellFixer()
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "Don't use async functions here.",
+        "Set the env variable first.",
+        "Install it with npm.",
+        "The frontend talks to the API.",
+        "Serve the app with uvicorn.",
+    ],
+)
+def test_unknown_words_are_uncertain(fixer: FastSpellFixer, text: str) -> None:
+    assert fixer.fix(text) is None
+
+
+def test_known_typos_are_fixed(fixer: FastSpellFixer) -> None:
+    assert fixer.fix("We recieve it. Seperate the parts.") == "We receive it. Separate the parts."
+
+
+def test_real_words_are_not_known_typos(fixer: FastSpellFixer) -> None:
+    assert fixer.fix("As was his wont, he spoke cant.") == "As was his wont, he spoke cant."
+
+
+def test_code_and_links_are_not_checked(fixer: FastSpellFixer) -> None:
+    text = "Run `npm install` and see [the docs](https://example.com/uvicorn)."
+    assert fixer.fix(text) == text
+
+
+def test_enhancer_has_no_spell_fixer_by_default() -> None:
+    assert GrammarEnhancer(EchoProvider()).spell_fixer is None
+
+
+async def test_uncertain_text_goes_to_the_model(fixer: FastSpellFixer) -> None:
+    provider = EchoProvider()
+    enhancer = GrammarEnhancer(provider, spell_fixer=fixer)
+
+    text = "Don't use async functions when a plain call is simpler to read."
+    assert await enhancer.fix_spelling(text) == "MODEL"
+    assert provider.calls == 1